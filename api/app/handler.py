@@ -8,14 +8,15 @@ from starlette.websockets import WebSocketDisconnect, WebSocketState
 
 from app.proto import Message, PlayerConnected, PlayerDisconnected
 from app.pubsub import publish, subscribe
+from app.wire import origin_uuid, stamp_origin
 
 
-async def send_messages(messages: asyncio.Queue[Message], websocket: WebSocket):
+async def send_messages(messages: asyncio.Queue[bytes], websocket: WebSocket):
     """Push all messages on queue through their socket"""
     message = await messages.get()
     if websocket.state != WebSocketState.DISCONNECTED:
         try:
-            await websocket.send_bytes(bytes(message))
+            await websocket.send_bytes(message)
         except RuntimeError as runtime_error:
             if "'websocket.send', after sending 'websocket.close'" in str(
                 runtime_error
@@ -35,18 +36,19 @@ async def handle_connected(websocket: WebSocket, uuid: str):
     """Handle the lifecycle of the websocket"""
 
     async def consumer():
-        """Translate bytes on the wire to messages"""
+        """Forward the client's messages, stamped with who sent them"""
         async for data in websocket.iter_bytes():
-            await publish(data)
+            await publish(stamp_origin(data, uuid))
 
     async def pubsub_consumer():
+        """Forward broadcasts as is, only peeking at who sent them"""
         channel = await subscribe(uuid)
         while True:
             message = await channel.get_message(ignore_subscribe_messages=True)
             if message is not None:
-                proto = Message().parse(message["data"])
-                if proto.origin_uuid != uuid:
-                    messages.put_nowait(proto)
+                data = message["data"]
+                if origin_uuid(data) != uuid:
+                    messages.put_nowait(data)
 
     async def producer():
         """Emit queued messages"""
@@ -65,7 +67,7 @@ async def handle_connected(websocket: WebSocket, uuid: str):
         for task in pending:
             task.cancel()
 
-    messages = asyncio.Queue[Message]()
+    messages = asyncio.Queue[bytes]()
     await publish(bytes(Message(player_connected=PlayerConnected(uuid=uuid))))
     try:
         await handler()
@@ -1,7 +1,8 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
-# sources: proto/character_type.proto, proto/direction.proto, proto/character.proto, proto/player.proto, proto/projectile.proto, proto/util.proto, proto/message.proto
+# sources: proto/character_type.proto, proto/direction.proto, proto/character.proto, proto/player.proto, proto/projectile.proto, proto/snapshot.proto, proto/util.proto, proto/message.proto
 # plugin: python-betterproto
 from dataclasses import dataclass
+from typing import List
 
 import betterproto
 
@@ -29,6 +30,7 @@ class Direction(betterproto.Enum):
 class CharacterAttacked(betterproto.Message):
     uuid: str = betterproto.string_field(1)
     direction: float = betterproto.float_field(2)
+    handle: int = betterproto.uint32_field(3)
 
 
 @dataclass
@@ -36,6 +38,7 @@ class CharacterDamaged(betterproto.Message):
     uuid: str = betterproto.string_field(1)
     damage: float = betterproto.float_field(2)
     hp: float = betterproto.float_field(3)
+    handle: int = betterproto.uint32_field(4)
 
 
 @dataclass
@@ -43,6 +46,12 @@ class CharacterDirectionUpdated(betterproto.Message):
     uuid: str = betterproto.string_field(1)
     facing_direction: "Direction" = betterproto.enum_field(5)
     moving_direction: "Direction" = betterproto.enum_field(6)
+    handle: int = betterproto.uint32_field(7)
+
+
+@dataclass
+class CharacterLeftView(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
 
 
 @dataclass
@@ -52,11 +61,23 @@ class CharacterPositionUpdated(betterproto.Message):
     y: float = betterproto.float_field(3)
     dx: float = betterproto.float_field(7)
     dy: float = betterproto.float_field(8)
+    handle: int = betterproto.uint32_field(9)
+
+
+@dataclass
+class CharacterPositionUpdatedQuantized(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    x: int = betterproto.sint32_field(2)
+    y: int = betterproto.sint32_field(3)
+    dx: int = betterproto.sint32_field(7)
+    dy: int = betterproto.sint32_field(8)
+    handle: int = betterproto.uint32_field(9)
 
 
 @dataclass
 class CharacterReloaded(betterproto.Message):
     uuid: str = betterproto.string_field(1)
+    handle: int = betterproto.uint32_field(2)
 
 
 @dataclass
@@ -70,6 +91,21 @@ class CharacterUpdated(betterproto.Message):
     facing_direction: "Direction" = betterproto.enum_field(5)
     moving_direction: "Direction" = betterproto.enum_field(6)
     hp: float = betterproto.float_field(9)
+    handle: int = betterproto.uint32_field(10)
+
+
+@dataclass
+class CharacterUpdatedQuantized(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    x: int = betterproto.sint32_field(2)
+    y: int = betterproto.sint32_field(3)
+    dx: int = betterproto.sint32_field(7)
+    dy: int = betterproto.sint32_field(8)
+    character_type: "CharacterType" = betterproto.enum_field(4)
+    facing_direction: "Direction" = betterproto.enum_field(5)
+    moving_direction: "Direction" = betterproto.enum_field(6)
+    hp: float = betterproto.float_field(9)
+    handle: int = betterproto.uint32_field(10)
 
 
 @dataclass
@@ -92,6 +128,7 @@ class PlayerJoinResponse(betterproto.Message):
     uuid: str = betterproto.string_field(1)
     x: float = betterproto.float_field(2)
     y: float = betterproto.float_field(3)
+    handle: int = betterproto.uint32_field(4)
 
 
 @dataclass
@@ -114,17 +151,67 @@ class Projectile(betterproto.Message):
     dx: float = betterproto.float_field(4)
     dy: float = betterproto.float_field(5)
     weapon_name: str = betterproto.string_field(6)
+    handle: int = betterproto.uint32_field(7)
 
 
 @dataclass
 class ProjectileCreated(betterproto.Message):
     origin_uuid: str = betterproto.string_field(2)
     projectile: "Projectile" = betterproto.message_field(1)
+    origin_handle: int = betterproto.uint32_field(3)
+
+
+@dataclass
+class ProjectileCreatedQuantized(betterproto.Message):
+    origin_uuid: str = betterproto.string_field(2)
+    projectile: "ProjectileQuantized" = betterproto.message_field(1)
+    origin_handle: int = betterproto.uint32_field(3)
 
 
 @dataclass
 class ProjectileDestroyed(betterproto.Message):
     uuid: str = betterproto.string_field(1)
+    handle: int = betterproto.uint32_field(2)
+
+
+@dataclass
+class ProjectileQuantized(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    x: int = betterproto.sint32_field(2)
+    y: int = betterproto.sint32_field(3)
+    dx: int = betterproto.sint32_field(4)
+    dy: int = betterproto.sint32_field(5)
+    weapon_name: str = betterproto.string_field(6)
+    handle: int = betterproto.uint32_field(7)
+
+
+@dataclass
+class EntitySnapshot(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    fields: int = betterproto.uint32_field(2)
+    x: float = betterproto.float_field(3)
+    y: float = betterproto.float_field(4)
+    dx: float = betterproto.float_field(5)
+    dy: float = betterproto.float_field(6)
+    character_type: "CharacterType" = betterproto.enum_field(7)
+    facing_direction: "Direction" = betterproto.enum_field(8)
+    moving_direction: "Direction" = betterproto.enum_field(9)
+    hp: float = betterproto.float_field(10)
+    handle: int = betterproto.uint32_field(11)
+
+
+@dataclass
+class SnapshotAcknowledged(betterproto.Message):
+    uuid: str = betterproto.string_field(1)
+    sequence: int = betterproto.uint32_field(2)
+
+
+@dataclass
+class WorldSnapshot(betterproto.Message):
+    sequence: int = betterproto.uint32_field(1)
+    baseline: int = betterproto.uint32_field(2)
+    entities: List["EntitySnapshot"] = betterproto.message_field(3)
+    removed: List[int] = betterproto.uint32_field(4)
 
 
 @dataclass
@@ -162,6 +249,15 @@ class Message(betterproto.Message):
     character_reloaded: "CharacterReloaded" = betterproto.message_field(
         205, group="payload"
     )
+    character_left_view: "CharacterLeftView" = betterproto.message_field(
+        206, group="payload"
+    )
+    character_updated_quantized: "CharacterUpdatedQuantized" = (
+        betterproto.message_field(207, group="payload")
+    )
+    character_position_updated_quantized: "CharacterPositionUpdatedQuantized" = (
+        betterproto.message_field(208, group="payload")
+    )
     player_connected: "PlayerConnected" = betterproto.message_field(
         102, group="payload"
     )
@@ -182,5 +278,12 @@ class Message(betterproto.Message):
     projectile_destroyed: "ProjectileDestroyed" = betterproto.message_field(
         301, group="payload"
     )
+    projectile_created_quantized: "ProjectileCreatedQuantized" = (
+        betterproto.message_field(302, group="payload")
+    )
+    world_snapshot: "WorldSnapshot" = betterproto.message_field(400, group="payload")
+    snapshot_acknowledged: "SnapshotAcknowledged" = betterproto.message_field(
+        401, group="payload"
+    )
     text_message: "TextMessage" = betterproto.message_field(1, group="payload")
     spawn_requested: "SpawnRequested" = betterproto.message_field(2, group="payload")
@@ -0,0 +1,57 @@
+"""Just enough of the protobuf wire format to route broadcasts without
+parsing them. Every top level Message field is a string or a nested
+message, so the top level can be walked by tag and length alone."""
+
+from app.proto import Message
+
+ORIGIN_UUID_FIELD = 11
+LENGTH_DELIMITED = 2
+
+
+def read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def write_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def stamp_origin(data: bytes, uuid: str) -> bytes:
+    """data with Message.origin_uuid set to uuid. The last occurrence of a
+    field on the wire wins, so appending it overrides whatever the client
+    claimed without parsing the message."""
+    encoded = uuid.encode("utf-8")
+    tag = write_varint(ORIGIN_UUID_FIELD << 3 | LENGTH_DELIMITED)
+    return data + tag + write_varint(len(encoded)) + encoded
+
+
+def origin_uuid(data: bytes) -> str:
+    """Message.origin_uuid of serialized data, parsing the whole message only
+    if the top level holds anything unexpected"""
+    pos = 0
+    origin = ""
+    try:
+        while pos < len(data):
+            tag, pos = read_varint(data, pos)
+            if tag & 7 != LENGTH_DELIMITED:
+                raise ValueError("Unexpected wire type")
+            length, pos = read_varint(data, pos)
+            if tag >> 3 == ORIGIN_UUID_FIELD:
+                origin = data[pos : pos + length].decode("utf-8")
+            pos += length
+    except (IndexError, ValueError):
+        return Message().parse(data).origin_uuid
+    return origin
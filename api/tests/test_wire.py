@@ -0,0 +1,21 @@
+from app.proto import CharacterUpdated, Message, TextMessage
+from app.wire import origin_uuid, stamp_origin
+
+
+class TestWire:
+    def test_origin_uuid(self):
+        msg = Message(
+            origin_uuid="1234", character_updated=CharacterUpdated(uuid="abc", x=1)
+        )
+        assert origin_uuid(bytes(msg)) == "1234"
+        assert origin_uuid(bytes(Message(text_message=TextMessage(text="hi")))) == ""
+
+    def test_stamp_origin(self):
+        msg = Message(
+            origin_uuid="spoofed", character_updated=CharacterUpdated(uuid="abc", x=1)
+        )
+        stamped = stamp_origin(bytes(msg), "1234")
+        assert origin_uuid(stamped) == "1234"
+        parsed = Message().parse(stamped)
+        assert parsed.origin_uuid == "1234"
+        assert parsed.character_updated == msg.character_updated
@@ -4,7 +4,8 @@ from uuid import uuid4
 
 import pymunk
 from nk_shared import builders
-from nk_shared.models import Character, Projectile
+from nk_shared.map.tilemap import Tilemap
+from nk_shared.models import Character, ProjectilePool
 from nk_shared.models.weapon import load_weapon_by_name
 from nk_shared.proto import Projectile as ProjectileProto
 from nk_shared.proto import ProjectileCreated
@@ -13,19 +14,21 @@ from nk_shared.proto import ProjectileCreated
 class WorldProtocol(Protocol):
     @property
     def space(self) -> pymunk.Space: ...
-    def get_character_by_uuid(self, uuid: str) -> Character | None: ...
+    @property
+    def map(self) -> Tilemap: ...
+    def get_character_by_handle(self, handle: int) -> Character | None: ...
 
 
 class ProjectileManager:
     def __init__(self, world: WorldProtocol):
         self.world = world
-        self.projectiles: list[Projectile] = []
+        self.pool = ProjectilePool()
 
     def update(self, dt: float):
-        for projectile in self.projectiles:
-            projectile.update(dt)
-            if self.handle_projectile_collisions(projectile):
-                self.projectiles.remove(projectile)
+        for hit in self.pool.sweep(self.world.space, dt):
+            self.pool.release(hit.slot)
+        for slot in self.pool.expired(self.world.map.width, self.world.map.height):
+            self.pool.release(slot)
 
     def process_local_attack(self, character: Character) -> ProjectileCreated:
         weapon = load_weapon_by_name(character.weapon_name)
@@ -43,33 +46,17 @@ class ProjectileManager:
         proto = builders.build_projectile_created(character, projectile)
         self.create_projectile(proto.projectile_created)
 
-    def handle_projectile_collisions(self, projectile: Projectile) -> bool:
-        """Handle collisions for a single projectile."""
-        for query_info in self.world.space.shape_query(projectile.shape):
-            # pylint: disable-next=no-else-return
-            if hasattr(query_info.shape.body, "character"):
-                character: Character = query_info.shape.body.character
-                return projectile.origin != character
-            else:
-                return True
-        return False
-
     def create_projectile(self, proto: ProjectileCreated):
-        weapon = load_weapon_by_name(proto.projectile.weapon_name)
-        self.projectiles.append(
-            Projectile(
-                origin=self.world.get_character_by_uuid(proto.origin_uuid),
-                uuid=proto.projectile.uuid,
-                weapon=weapon,
-                x=proto.projectile.x,
-                y=proto.projectile.y,
-                dx=proto.projectile.dx,
-                dy=proto.projectile.dy,
-            )
+        """Spawn a projectile, looked up by its zone handle, or by uuid when
+        predicted locally"""
+        origin = self.world.get_character_by_handle(proto.origin_handle)
+        self.pool.spawn(
+            uuid=proto.projectile.uuid,
+            handle=proto.projectile.handle,
+            x=proto.projectile.x,
+            y=proto.projectile.y,
+            dx=proto.projectile.dx,
+            dy=proto.projectile.dy,
+            weapon=load_weapon_by_name(proto.projectile.weapon_name),
+            owner=origin.collision_group if origin else 0,
         )
-
-    def get_projectile_by_uuid(self, uuid: str) -> Projectile | None:
-        for projectile in self.projectiles:
-            if projectile.uuid == uuid:
-                return projectile
-        return None
@@ -17,7 +17,13 @@ HEAL_AMT = 10.0
 
 class World:  # pylint: disable=too-many-instance-attributes,too-many-arguments
     def __init__(
-        self, uuid: str, x: float, y: float, zone_name=ZONE_NAME, tmxmap: Tilemap = None
+        self,
+        uuid: str,
+        x: float,
+        y: float,
+        zone_name=ZONE_NAME,
+        tmxmap: Tilemap = None,
+        handle: int = 0,
     ):
         self.listeners: deque[WorldListener] = deque()
         self.projectile_manager: ProjectileManager = ProjectileManager(self)
@@ -35,9 +41,11 @@ class World:  # pylint: disable=too-many-instance-attributes,too-many-arguments
             )
 
         self.characters: dict[str, Character] = {}
+        self.handles: dict[int, Character] = {}
         # initialize player
         self.player = self.add_character(
             uuid=uuid,
+            handle=handle,
             character_type=CharacterType.CHARACTER_TYPE_PIGSASSIN,
             start_x=x,
             start_y=y,
@@ -75,8 +83,10 @@ class World:  # pylint: disable=too-many-instance-attributes,too-many-arguments
 
     def add_character(self, **character_kwargs: Unpack[Character]) -> Character:
         character = Character(**character_kwargs)
-        self.space.add(character.body, character.shape, character.hitbox_shape)
+        self.space.add(character.body, character.shape)
         self.characters[character.uuid] = character
+        if character.handle:
+            self.handles[character.handle] = character
         for listener in self.listeners:
             listener.character_added(character)
         return character
@@ -84,10 +94,14 @@ class World:  # pylint: disable=too-many-instance-attributes,too-many-arguments
     def remove_character(self, character: Character):
         if character == self.player:
             return
-        self.space.remove(character.body, character.shape, character.hitbox_shape)
+        self.space.remove(character.body, character.shape)
         del self.characters[character.uuid]
+        self.handles.pop(character.handle, None)
         for listener in self.listeners:
             listener.character_removed(character)
 
     def get_character_by_uuid(self, uuid: str) -> Character | None:
         return self.characters.get(uuid)
+
+    def get_character_by_handle(self, handle: int) -> Character | None:
+        return self.handles.get(handle)
@@ -1,9 +1,19 @@
 from typing import Protocol
 
-from betterproto import serialized_on_wire
 from loguru import logger
+from nk_shared.dispatch import Dispatcher
 from nk_shared.models.character import Character
-from nk_shared.proto import CharacterType, Direction, Message
+from nk_shared.proto import (
+    CharacterAttacked,
+    CharacterDamaged,
+    CharacterDirectionUpdated,
+    CharacterLeftView,
+    CharacterPositionUpdated,
+    CharacterReloaded,
+    CharacterType,
+    CharacterUpdated,
+    Direction,
+)
 
 from nk.game.world import World
 from nk.net.messages.message_handler import MessageHandler
@@ -20,84 +30,83 @@ class CharacterMessageHandler(MessageHandler):
         self.world = world
         self.listeners: list[CharacterMessageListener] = []
 
-    def handle_message(self, message: Message) -> bool:
-        if serialized_on_wire(message.character_position_updated):
-            self.handle_character_position_updated(message)
-        if serialized_on_wire(message.character_direction_updated):
-            self.handle_character_direction_updated(message)
-        elif serialized_on_wire(message.character_updated):
-            self.handle_character_updated(message)
-        elif serialized_on_wire(message.character_attacked):
-            self.handle_character_attacked(message)
-        elif serialized_on_wire(message.character_damaged):
-            self.handle_character_damaged(message)
-        elif serialized_on_wire(message.character_reloaded):
-            self.handle_character_reloaded(message)
-        else:
-            return False
-        return True
+    def register(self, dispatcher: Dispatcher):
+        for payload, handler in (
+            ("character_position_updated", self.handle_character_position_updated),
+            ("character_direction_updated", self.handle_character_direction_updated),
+            ("character_updated", self.handle_character_updated),
+            ("character_attacked", self.handle_character_attacked),
+            ("character_damaged", self.handle_character_damaged),
+            ("character_reloaded", self.handle_character_reloaded),
+            ("character_left_view", self.handle_character_left_view),
+        ):
+            dispatcher.register(payload, handler)
 
-    def handle_character_attacked(self, message: Message):
-        details = message.character_attacked
-        character = self.world.get_character_by_uuid(details.uuid)
+    def handle_character_attacked(self, details: CharacterAttacked):
+        character = self.world.get_character_by_handle(details.handle)
         if character:
             character.attack(details.direction)
             for listener in self.listeners:
                 listener.character_attacked(character)
         else:
             logger.warning(
-                "character_attacked no character found with uuid {}", details.uuid
+                "character_attacked no character found with handle {}",
+                details.handle,
             )
 
-    def handle_character_damaged(self, message: Message):
-        details = message.character_damaged
-        character = self.world.get_character_by_uuid(details.uuid)
+    def handle_character_damaged(self, details: CharacterDamaged):
+        character = self.world.get_character_by_handle(details.handle)
         if character:
             character.handle_damage_received(details.damage)
             character.hp = details.hp
         else:
             logger.warning(
-                "character_damaged no character found with uuid {}", details.uuid
+                "character_damaged no character found with handle {}",
+                details.handle,
             )
 
-    def handle_character_reloaded(self, message: Message):
-        details = message.character_reloaded
-        character = self.world.get_character_by_uuid(details.uuid)
+    def handle_character_reloaded(self, details: CharacterReloaded):
+        character = self.world.get_character_by_handle(details.handle)
         if character:
             character.reload()
             for listener in self.listeners:
                 listener.character_reloaded(character)
         else:
             logger.warning(
-                "character_reloaded no character found with uuid {}", details.uuid
+                "character_reloaded no character found with handle {}",
+                details.handle,
             )
 
-    def handle_character_direction_updated(self, message: Message):
-        details = message.character_direction_updated
-        if self.world.player.uuid == details.uuid:
-            logger.warning("Received character_updated for self")
-            return
+    def handle_character_left_view(self, details: CharacterLeftView):
+        """Character is out of our view range, the zone stops sending updates
+        about it until it comes back into view"""
         character = self.world.get_character_by_uuid(details.uuid)
+        if character:
+            self.world.remove_character(character)
+
+    def handle_character_direction_updated(self, details: CharacterDirectionUpdated):
+        if self.world.player.handle == details.handle:
+            logger.warning("Received character_direction_updated for self")
+            return
+        character = self.world.get_character_by_handle(details.handle)
         if character:
             character.facing_direction = Direction(details.facing_direction)
             character.moving_direction = Direction(details.moving_direction)
         else:
-            logger.warning("No character found with uuid: {}", details.uuid)
+            logger.warning("No character found with handle: {}", details.handle)
 
-    def handle_character_position_updated(self, message: Message):
-        details = message.character_position_updated
-        if self.world.player.uuid == details.uuid:
-            logger.warning("Received character_updated for self")
+    def handle_character_position_updated(self, details: CharacterPositionUpdated):
+        if self.world.player.handle == details.handle:
+            logger.warning("Received character_position_updated for self")
             return
-        character = self.world.get_character_by_uuid(details.uuid)
+        character = self.world.get_character_by_handle(details.handle)
         if character:
             character.position = (details.x, details.y)
             character.velocity = (details.dx, details.dy)
         else:
-            logger.warning("No character found with uuid: {}", details.uuid)
+            logger.warning("No character found with handle: {}", details.handle)
 
-    def handle_character_updated(self, message: Message):
-        details = message.character_updated
+    def handle_character_updated(self, details: CharacterUpdated):
         if self.world.player.uuid == details.uuid:
             logger.warning("Received character_updated for self")
             return
@@ -108,6 +117,7 @@ class CharacterMessageHandler(MessageHandler):
         else:
             character = self.world.add_character(
                 uuid=details.uuid,
+                handle=details.handle,
                 start_x=details.x,
                 start_y=details.y,
                 character_type=CharacterType(details.character_type),
@@ -1,8 +1,10 @@
-from abc import ABC
+from abc import ABC, abstractmethod
 
-from nk_shared.proto import Message
+from nk_shared.dispatch import Dispatcher
 
 
 class MessageHandler(ABC):
-    def handle_message(self, message: Message) -> bool:
+    @abstractmethod
+    def register(self, dispatcher: Dispatcher):
+        """Register a handler for each message payload handled"""
         raise NotImplementedError
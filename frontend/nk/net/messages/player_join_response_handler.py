@@ -1,7 +1,6 @@
 from typing import Callable
 
-from betterproto import serialized_on_wire
-from nk_shared.proto import Message
+from nk_shared.dispatch import Dispatcher
 
 from nk.net.messages.message_handler import MessageHandler
 
@@ -10,6 +9,5 @@ class PlayerJoinResponseHandler(MessageHandler):
     def __init__(self, callback: Callable):
         self.callback = callback
 
-    def handle_message(self, message: Message) -> bool:
-        if serialized_on_wire(message.player_join_response):
-            self.callback(message)
+    def register(self, dispatcher: Dispatcher):
+        dispatcher.register("player_join_response", self.callback)
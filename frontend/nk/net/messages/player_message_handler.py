@@ -1,6 +1,6 @@
-from betterproto import serialized_on_wire
 from loguru import logger
-from nk_shared.proto import Message
+from nk_shared.dispatch import Dispatcher
+from nk_shared.proto import PlayerRespawned
 
 from nk.game.world import World
 from nk.net.messages.message_handler import MessageHandler
@@ -10,15 +10,10 @@ class PlayerMessageHandler(MessageHandler):
     def __init__(self, world: World):
         self.world = world
 
-    def handle_message(self, message: Message) -> bool:
-        if serialized_on_wire(message.player_respawned):
-            self.handle_player_respawned(message)
-        else:
-            return False
-        return True
+    def register(self, dispatcher: Dispatcher):
+        dispatcher.register("player_respawned", self.handle_player_respawned)
 
-    def handle_player_respawned(self, message: Message):
-        details = message.player_respawned
+    def handle_player_respawned(self, details: PlayerRespawned):
         character = self.world.get_character_by_uuid(details.uuid)
         logger.info("Player respawned: {}", details)
         if character:
@@ -1,5 +1,5 @@
-from betterproto import serialized_on_wire
-from nk_shared.proto import Message
+from nk_shared.dispatch import Dispatcher
+from nk_shared.proto import ProjectileCreated, ProjectileDestroyed
 
 from nk.game.world import World
 from nk.net.messages.message_handler import MessageHandler
@@ -9,22 +9,14 @@ class ProjectileMessageHandler(MessageHandler):
     def __init__(self, world: World):
         self.world = world
 
-    def handle_message(self, message: Message) -> bool:
-        if serialized_on_wire(message.projectile_created):
-            self.handle_projectile_created(message)
-        elif serialized_on_wire(message.projectile_destroyed):
-            self.handle_projectile_destroyed(message)
-        else:
-            return False
-        return True
+    def register(self, dispatcher: Dispatcher):
+        dispatcher.register("projectile_created", self.handle_projectile_created)
+        dispatcher.register("projectile_destroyed", self.handle_projectile_destroyed)
 
-    def handle_projectile_created(self, message: Message):
-        if message.projectile_created.origin_uuid == self.world.player.uuid:
+    def handle_projectile_created(self, details: ProjectileCreated):
+        if details.origin_handle == self.world.player.handle:
             return
-        self.world.projectile_manager.create_projectile(message.projectile_created)
+        self.world.projectile_manager.create_projectile(details)
 
-    def handle_projectile_destroyed(self, message: Message):
-        details = message.projectile_destroyed
-        projectile = self.world.projectile_manager.get_projectile_by_uuid(details.uuid)
-        if projectile:
-            self.world.projectile_manager.projectiles.remove(projectile)
+    def handle_projectile_destroyed(self, details: ProjectileDestroyed):
+        self.world.projectile_manager.pool.release_handle(details.handle)
@@ -0,0 +1,145 @@
+from typing import Any
+
+from loguru import logger
+from nk_shared import builders
+from nk_shared.dispatch import Dispatcher
+from nk_shared.models import SnapshotField
+from nk_shared.proto import CharacterType, Direction, EntitySnapshot, WorldSnapshot
+
+from nk.game.world import World
+from nk.net.messages.message_handler import MessageHandler
+from nk.net.network import Network
+
+SNAPSHOT_HISTORY = 32
+# EntitySnapshot field carried by each mask bit
+FIELD_NAMES = (
+    (SnapshotField.X, "x"),
+    (SnapshotField.Y, "y"),
+    (SnapshotField.DX, "dx"),
+    (SnapshotField.DY, "dy"),
+    (SnapshotField.CHARACTER_TYPE, "character_type"),
+    (SnapshotField.FACING_DIRECTION, "facing_direction"),
+    (SnapshotField.MOVING_DIRECTION, "moving_direction"),
+    (SnapshotField.HP, "hp"),
+)
+# field name to value, never mutated once stored so snapshots can share them
+EntityState = dict[str, Any]
+
+
+def merge_entity_snapshot(
+    state: EntityState | None, entity: EntitySnapshot
+) -> EntityState:
+    merged = dict(state or {})
+    fields = SnapshotField(entity.fields)
+    for bit, name in FIELD_NAMES:
+        if bit in fields:
+            merged[name] = getattr(entity, name)
+    if entity.uuid:
+        merged["uuid"] = entity.uuid
+    return merged
+
+
+class SnapshotMessageHandler(MessageHandler):
+    """Applies delta snapshots from the zone and acknowledges them. Each
+    delta is relative to the baseline snapshot it names, which may be older
+    than the last one applied, so the state of every snapshot since then is
+    kept to rebuild from. Baseline 0 is the empty state, full snapshots."""
+
+    def __init__(self, world: World, network: Network):
+        self.world = world
+        self.network = network
+        self.sequence = 0
+        self.states: dict[int, dict[int, EntityState]] = {0: {}}
+
+    def register(self, dispatcher: Dispatcher):
+        dispatcher.register("world_snapshot", self.handle_world_snapshot)
+
+    def handle_world_snapshot(self, details: WorldSnapshot):
+        if details.sequence <= self.sequence:
+            return  # older than what we've already applied
+        baseline = self.states.get(details.baseline)
+        if baseline is None:
+            logger.warning(
+                "Snapshot {} has unknown baseline {}",
+                details.sequence,
+                details.baseline,
+            )
+            return
+        removed = set(details.removed)
+        state = {
+            handle: entity
+            for handle, entity in baseline.items()
+            if handle not in removed
+        }
+        for entity in details.entities:
+            state[entity.handle] = merge_entity_snapshot(
+                state.get(entity.handle), entity
+            )
+        self.apply_state(self.states[self.sequence], state)
+        self.sequence = details.sequence
+        self.states[self.sequence] = state
+        self.trim(details.baseline)
+        ack = builders.build_snapshot_acknowledged(
+            self.world.player.uuid, self.sequence
+        )
+        self.network.send(ack)
+
+    def apply_state(
+        self, previous: dict[int, EntityState], state: dict[int, EntityState]
+    ):
+        """Bring the world from the previously applied snapshot's state to
+        this one's"""
+        for handle, entity in state.items():
+            if previous.get(handle) is not entity:
+                self.apply_entity_state(handle, entity, previous.get(handle))
+        for handle in previous.keys() - state.keys():
+            character = self.world.get_character_by_handle(handle)
+            if character:
+                self.world.remove_character(character)
+
+    def apply_entity_state(
+        self, handle: int, entity: EntityState, previous: EntityState | None
+    ):
+        """Apply the fields of entity that differ from previous"""
+        if handle == self.world.player.handle:
+            return
+        character = self.world.get_character_by_handle(handle)
+        if character is None:
+            if "uuid" not in entity:
+                logger.warning("Snapshot delta for unknown handle {}", handle)
+                return
+            character = self.world.add_character(
+                uuid=entity["uuid"],
+                handle=handle,
+                start_x=entity.get("x", 0),
+                start_y=entity.get("y", 0),
+                character_type=CharacterType(entity.get("character_type", 0)),
+            )
+            previous = None
+        changed = {
+            name: value
+            for name, value in entity.items()
+            if previous is None or previous.get(name) != value
+        }
+        x, y = character.position
+        if "x" in changed or "y" in changed:
+            character.position = (entity.get("x", x), entity.get("y", y))
+        dx, dy = character.velocity
+        if "dx" in changed or "dy" in changed:
+            character.velocity = (entity.get("dx", dx), entity.get("dy", dy))
+        if "facing_direction" in changed:
+            character.facing_direction = Direction(changed["facing_direction"])
+        if "moving_direction" in changed:
+            character.moving_direction = Direction(changed["moving_direction"])
+        if "hp" in changed:
+            character.hp = changed["hp"]
+
+    def trim(self, baseline: int):
+        """The zone diffs against what we last acknowledged, so nothing older
+        than the baseline it just used is needed again. The empty state is
+        kept for full snapshots, and at most SNAPSHOT_HISTORY newer ones."""
+        for seq in [seq for seq in self.states if 0 < seq < baseline]:
+            del self.states[seq]
+        newer = sorted(seq for seq in self.states if seq > baseline)
+        for seq in newer[: len(newer) - SNAPSHOT_HISTORY]:
+            del self.states[seq]
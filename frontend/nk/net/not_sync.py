@@ -2,6 +2,7 @@ import asyncio
 from asyncio import Queue
 
 from loguru import logger
+from nk_shared import codec
 from nk_shared.proto import Message
 from websockets import ConnectionClosed, WebSocketClientProtocol
 from websockets.client import connect
@@ -12,12 +13,12 @@ async def network_async_runner(
 ):
     async def consumer_handler(websocket: WebSocketClientProtocol):
         async for message in websocket:
-            await received.put(Message().parse(message))
+            await received.put(codec.decode(message))
 
     async def producer_handler(websocket: WebSocketClientProtocol):
         while True:
             message = await to_send.get()
-            await websocket.send(bytes(message))
+            await websocket.send(codec.encode(message))
 
     async def handler(websocket: WebSocketClientProtocol):
         consumer_task = asyncio.create_task(consumer_handler(websocket))
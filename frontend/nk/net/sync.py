@@ -2,6 +2,7 @@ import os
 from asyncio import Queue
 
 from loguru import logger
+from nk_shared import codec
 from nk_shared.proto import Message
 from websockets.sync.client import connect
 
@@ -19,11 +20,11 @@ def handle_websocket(
     while True:
         while not to_send.empty():
             message = to_send.get_nowait()
-            ws.send(bytes(message))
+            ws.send(codec.encode(message))
         try:
             while True:
                 data = ws.recv(timeout=0.001)
-                received.put_nowait(Message().parse(data))
+                received.put_nowait(codec.decode(data))
         except TimeoutError:
             pass  # expected
         except:  # pylint: disable=bare-except
@@ -2,7 +2,7 @@ from functools import lru_cache
 from typing import Iterable
 
 import pygame
-from nk_shared.models import Projectile
+from nk_shared.models import ProjectileView
 
 from nk.game.world import World
 from nk.settings import NK_DATA_ROOT
@@ -21,7 +21,7 @@ one_one_surface = pygame.Surface((1, 1))
 def generate_projectile_renderables(
     world: World, ui_interface: UIInterface
 ) -> Iterable[Renderable]:
-    for projectile in world.projectile_manager.projectiles:
+    for projectile in world.projectile_manager.pool:
         if projectile.weapon.projectile_image_path == "tracer":
             method = generate_projectile_tracer_renderable
         else:
@@ -30,7 +30,7 @@ def generate_projectile_renderables(
 
 
 def generate_projectile_blittable_renderable(
-    ui_interface: UIInterface, projectile: Projectile
+    ui_interface: UIInterface, projectile: ProjectileView
 ) -> BlittableRenderable:
     image = load_projectile_image(projectile.weapon.projectile_image_path)
     blit_x, blit_y = ui_interface.calculate_draw_coordinates(
@@ -42,7 +42,7 @@ def generate_projectile_blittable_renderable(
 
 
 def generate_projectile_tracer_renderable(
-    ui_interface: UIInterface, projectile: Projectile
+    ui_interface: UIInterface, projectile: ProjectileView
 ) -> TracerRenderable:
     start = ui_interface.calculate_draw_coordinates(
         projectile.x, projectile.y, one_one_surface
@@ -0,0 +1,69 @@
+from unittest.mock import Mock
+
+import pytest
+from nk_shared.models import SnapshotField
+from nk_shared.proto import CharacterType, EntitySnapshot, WorldSnapshot
+
+from nk.game.world import World
+from nk.net.messages.snapshot_message_handler import SnapshotMessageHandler
+
+HANDLE = 7
+
+
+def full_entity(x: float) -> EntitySnapshot:
+    return EntitySnapshot(
+        handle=HANDLE,
+        uuid="enemy",
+        fields=SnapshotField.ALL,
+        x=x,
+        hp=10,
+        character_type=CharacterType.CHARACTER_TYPE_SHADOW_GUARDIAN,
+    )
+
+
+@pytest.fixture
+def handler(world: World) -> SnapshotMessageHandler:
+    return SnapshotMessageHandler(world, Mock())
+
+
+def test_delta_applied_to_named_baseline(world: World, handler: SnapshotMessageHandler):
+    handler.handle_world_snapshot(
+        WorldSnapshot(sequence=1, baseline=0, entities=[full_entity(5)])
+    )
+    # x moves away in 2, which is lost on the zone's side, then moves back
+    handler.handle_world_snapshot(
+        WorldSnapshot(
+            sequence=2,
+            baseline=1,
+            entities=[EntitySnapshot(handle=HANDLE, fields=SnapshotField.X, x=9)],
+        )
+    )
+    assert world.get_character_by_handle(HANDLE).position.x == 9
+    # x is back to its value in 1, so a delta against 1 omits it
+    handler.handle_world_snapshot(
+        WorldSnapshot(
+            sequence=3,
+            baseline=1,
+            entities=[EntitySnapshot(handle=HANDLE, fields=SnapshotField.HP, hp=4)],
+        )
+    )
+    character = world.get_character_by_handle(HANDLE)
+    assert character.position.x == 5
+    assert character.hp == 4
+
+
+def test_unknown_baseline_dropped(world: World, handler: SnapshotMessageHandler):
+    handler.handle_world_snapshot(
+        WorldSnapshot(sequence=2, baseline=1, entities=[full_entity(5)])
+    )
+    assert world.get_character_by_handle(HANDLE) is None
+    handler.network.send.assert_not_called()
+
+
+def test_full_snapshot_removes_missing(world: World, handler: SnapshotMessageHandler):
+    handler.handle_world_snapshot(
+        WorldSnapshot(sequence=1, baseline=0, entities=[full_entity(5)])
+    )
+    handler.handle_world_snapshot(WorldSnapshot(sequence=2, baseline=0))
+    assert world.get_character_by_handle(HANDLE) is None
+    assert handler.states[2] == {}
@@ -0,0 +1,60 @@
+"""Compare FastCodec against betterproto for the high frequency messages.
+
+python -m benchmarks.codec_benchmark
+"""
+
+import timeit
+
+from nk_shared import builders
+from nk_shared.codec import BetterprotoCodec, Codec, FastCodec
+from nk_shared.models.character import Character
+from nk_shared.proto import Direction, Message, Projectile
+
+NUMBER = 2000
+
+
+def hot_messages() -> dict[str, Message]:
+    character = Character(start_x=31.5, start_y=-12.25, handle=42)
+    character.velocity = (3.5, -1.25)
+    character.facing_direction = Direction.DIRECTION_NE
+    character.moving_direction = Direction.DIRECTION_E
+    projectile = Projectile(x=31, y=-12, dx=20, dy=5, weapon_name="ak47", handle=7)
+    return {
+        "position": builders.build_character_position_updated_quantized(character),
+        "direction": builders.build_character_direction_updated(character),
+        "updated": builders.build_character_updated_quantized(character),
+        "projectile_created": builders.build_projectile_created_quantized(
+            character, projectile
+        ),
+        "projectile_destroyed": builders.build_projectile_destroyed(7),
+    }
+
+
+def per_call_us(func, number: int = NUMBER) -> float:
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def benchmark(codec: Codec, message: Message) -> tuple[float, float]:
+    data = bytes(message)
+    assert codec.encode(message) == data
+    return (
+        per_call_us(lambda: codec.encode(message)),
+        per_call_us(lambda: codec.decode(data)),
+    )
+
+
+def main():
+    baseline, fast = BetterprotoCodec(), FastCodec()
+    print(f"{'message':<22}{'encode us':>22}{'decode us':>22}")
+    for name, message in hot_messages().items():
+        base_encode, base_decode = benchmark(baseline, message)
+        fast_encode, fast_decode = benchmark(fast, message)
+        print(
+            f"{name:<22}"
+            f"{base_encode:>8.1f} -> {fast_encode:5.1f} {base_encode / fast_encode:4.0f}x"
+            f"{base_decode:>8.1f} -> {fast_decode:5.1f} {base_decode / fast_decode:4.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
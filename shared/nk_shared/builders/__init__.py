@@ -1,4 +1,6 @@
 from nk_shared.builders.character_builders import *
 from nk_shared.builders.player_builders import *
 from nk_shared.builders.projectile_builders import *
+from nk_shared.builders.quantized_builders import *
+from nk_shared.builders.snapshot_builders import *
 from nk_shared.builders.util_builders import *
@@ -5,7 +5,7 @@ from nk_shared.models import Character
 def build_character_attacked(character: Character, direction: float) -> proto.Message:
     return proto.Message(
         character_attacked=proto.CharacterAttacked(
-            uuid=character.uuid,
+            handle=character.handle,
             direction=direction,
         )
     )
@@ -14,18 +14,21 @@ def build_character_attacked(character: Character, direction: float) -> proto.Me
 def build_character_damaged(character: Character, damage: float) -> proto.Message:
     return proto.Message(
         character_damaged=proto.CharacterDamaged(
-            uuid=character.uuid,
+            handle=character.handle,
             damage=damage,
             hp=character.hp,
         )
     )
 
 
+def build_character_left_view(uuid: str) -> proto.Message:
+    return proto.Message(character_left_view=proto.CharacterLeftView(uuid=uuid))
+
+
 def build_character_position_updated(character: Character) -> proto.Message:
     return proto.Message(
-        origin_uuid=character.uuid,
         character_position_updated=proto.CharacterPositionUpdated(
-            uuid=character.uuid,
+            handle=character.handle,
             x=character.position.x,
             y=character.position.y,
             dx=character.velocity.x,
@@ -37,16 +40,15 @@ def build_character_position_updated(character: Character) -> proto.Message:
 def build_character_reloaded(character: Character) -> proto.Message:
     return proto.Message(
         character_reloaded=proto.CharacterReloaded(
-            uuid=character.uuid,
+            handle=character.handle,
         )
     )
 
 
 def build_character_direction_updated(character: Character) -> proto.Message:
     return proto.Message(
-        origin_uuid=character.uuid,
         character_direction_updated=proto.CharacterDirectionUpdated(
-            uuid=character.uuid,
+            handle=character.handle,
             facing_direction=character.facing_direction,
             moving_direction=character.moving_direction,
         ),
@@ -58,6 +60,7 @@ def build_character_updated(character: Character) -> proto.Message:
         origin_uuid=character.uuid,
         character_updated=proto.CharacterUpdated(
             uuid=character.uuid,
+            handle=character.handle,
             x=character.position.x,
             y=character.position.y,
             dx=character.velocity.x,
@@ -8,18 +8,19 @@ def build_projectile_created(
 ) -> proto.Message:
     return proto.Message(
         projectile_created=proto.ProjectileCreated(
-            origin_uuid=origin.uuid, projectile=build_projectile(projectile)
+            origin_handle=origin.handle, projectile=build_projectile(projectile)
         )
     )
 
 
-def build_projectile_destroyed(uuid: str) -> proto.Message:
-    return proto.Message(projectile_destroyed=proto.ProjectileDestroyed(uuid=uuid))
+def build_projectile_destroyed(handle: int) -> proto.Message:
+    return proto.Message(projectile_destroyed=proto.ProjectileDestroyed(handle=handle))
 
 
 def build_projectile(projectile: Projectile) -> proto.Message:
     return proto.Projectile(
         uuid=projectile.uuid,
+        handle=projectile.handle,
         x=projectile.x,
         y=projectile.y,
         dx=projectile.dx,
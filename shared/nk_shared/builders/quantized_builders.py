@@ -0,0 +1,151 @@
+"""Fixed point variants of the movement messages. Positions and velocities
+are in tiles, as the simulation holds them, scaled by POSITION_PRECISION
+steps per tile and sent as zigzag varints, which take far fewer bytes than
+floats for maps a few hundred tiles across. Zone maps span from (0, 0) to
+their width and height, so no origin offset is applied."""
+
+import betterproto
+
+from nk_shared import proto
+from nk_shared.models import Character
+from nk_shared.settings import POSITION_PRECISION
+
+
+def quantize(value: float, precision: int = POSITION_PRECISION) -> int:
+    """value in 1/precision steps. The sint32 fields hold values within
+    +-2**31 / precision, about 33 million tiles at the default precision."""
+    return round(value * precision)
+
+
+def dequantize(value: int, precision: int = POSITION_PRECISION) -> float:
+    return value / precision
+
+
+def build_character_position_updated_quantized(
+    character: Character,
+) -> proto.Message:
+    return proto.Message(
+        character_position_updated_quantized=proto.CharacterPositionUpdatedQuantized(
+            handle=character.handle,
+            x=quantize(character.position.x),
+            y=quantize(character.position.y),
+            dx=quantize(character.velocity.x),
+            dy=quantize(character.velocity.y),
+        ),
+    )
+
+
+def build_character_updated_quantized(character: Character) -> proto.Message:
+    return proto.Message(
+        origin_uuid=character.uuid,
+        character_updated_quantized=proto.CharacterUpdatedQuantized(
+            uuid=character.uuid,
+            handle=character.handle,
+            x=quantize(character.position.x),
+            y=quantize(character.position.y),
+            dx=quantize(character.velocity.x),
+            dy=quantize(character.velocity.y),
+            character_type=character.character_type,
+            facing_direction=character.facing_direction,
+            moving_direction=character.moving_direction,
+            hp=character.hp,
+        ),
+    )
+
+
+def build_projectile_created_quantized(
+    origin: Character, projectile: proto.Projectile
+) -> proto.Message:
+    return proto.Message(
+        projectile_created_quantized=proto.ProjectileCreatedQuantized(
+            origin_handle=origin.handle,
+            projectile=proto.ProjectileQuantized(
+                handle=projectile.handle,
+                x=quantize(projectile.x),
+                y=quantize(projectile.y),
+                dx=quantize(projectile.dx),
+                dy=quantize(projectile.dy),
+                weapon_name=projectile.weapon_name,
+            ),
+        )
+    )
+
+
+def dequantize_character_position_updated(
+    details: proto.CharacterPositionUpdatedQuantized,
+) -> proto.CharacterPositionUpdated:
+    return proto.CharacterPositionUpdated(
+        uuid=details.uuid,
+        handle=details.handle,
+        x=dequantize(details.x),
+        y=dequantize(details.y),
+        dx=dequantize(details.dx),
+        dy=dequantize(details.dy),
+    )
+
+
+def dequantize_character_updated(
+    details: proto.CharacterUpdatedQuantized,
+) -> proto.CharacterUpdated:
+    return proto.CharacterUpdated(
+        uuid=details.uuid,
+        handle=details.handle,
+        x=dequantize(details.x),
+        y=dequantize(details.y),
+        dx=dequantize(details.dx),
+        dy=dequantize(details.dy),
+        character_type=details.character_type,
+        facing_direction=details.facing_direction,
+        moving_direction=details.moving_direction,
+        hp=details.hp,
+    )
+
+
+def dequantize_projectile_created(
+    details: proto.ProjectileCreatedQuantized,
+) -> proto.ProjectileCreated:
+    projectile = details.projectile
+    return proto.ProjectileCreated(
+        origin_uuid=details.origin_uuid,
+        origin_handle=details.origin_handle,
+        projectile=proto.Projectile(
+            uuid=projectile.uuid,
+            handle=projectile.handle,
+            x=dequantize(projectile.x),
+            y=dequantize(projectile.y),
+            dx=dequantize(projectile.dx),
+            dy=dequantize(projectile.dy),
+            weapon_name=projectile.weapon_name,
+        ),
+    )
+
+
+# quantized payload field: (float payload field, decoder)
+DEQUANTIZERS = {
+    "character_position_updated_quantized": (
+        "character_position_updated",
+        dequantize_character_position_updated,
+    ),
+    "character_updated_quantized": (
+        "character_updated",
+        dequantize_character_updated,
+    ),
+    "projectile_created_quantized": (
+        "projectile_created",
+        dequantize_projectile_created,
+    ),
+}
+
+
+def dequantize_message(message: proto.Message) -> proto.Message:
+    """Float equivalent of a quantized message, so receivers handle one form.
+    Other messages are returned unchanged."""
+    name, details = betterproto.which_one_of(message, "payload")
+    if name not in DEQUANTIZERS:
+        return message
+    field, decoder = DEQUANTIZERS[name]
+    return proto.Message(
+        destination_uuid=message.destination_uuid,
+        origin_uuid=message.origin_uuid,
+        **{field: decoder(details)},
+    )
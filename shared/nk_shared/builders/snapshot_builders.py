@@ -0,0 +1,7 @@
+from nk_shared import proto
+
+
+def build_snapshot_acknowledged(uuid: str, sequence: int) -> proto.Message:
+    return proto.Message(
+        snapshot_acknowledged=proto.SnapshotAcknowledged(uuid=uuid, sequence=sequence)
+    )
@@ -0,0 +1,301 @@
+"""Message codecs. Every hop encodes and decodes Messages, and betterproto's
+generic reflection based (de)serialization dominates the cost of the high
+frequency movement and projectile messages. FastCodec hand rolls the wire
+format for those payloads, falling back to betterproto for everything else,
+and is byte for byte compatible with it. The codec in use is picked with
+the CODEC setting.
+
+Decoded messages are assembled straight into their instance dicts, the
+way betterproto's own parse leaves them, since running betterproto's
+__init__ and __setattr__ for every field costs more than the decode."""
+
+import struct
+from abc import ABC, abstractmethod
+from dataclasses import fields
+
+import betterproto
+from betterproto import PLACEHOLDER
+
+from nk_shared.proto import Message
+from nk_shared.settings import CODEC
+
+VARINT = 0
+FIXED32 = 5
+LENGTH_DELIMITED = 2
+FLOAT = struct.Struct("<f")
+
+
+class Codec(ABC):
+    @abstractmethod
+    def encode(self, message: Message) -> bytes:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Message:
+        raise NotImplementedError()
+
+
+class BetterprotoCodec(Codec):
+    def encode(self, message: Message) -> bytes:
+        return bytes(message)
+
+    def decode(self, data: bytes) -> Message:
+        return Message().parse(data)
+
+
+class Fallback(Exception):
+    """Raised by the fast path for anything it does not handle"""
+
+
+def unset_fields(cls: type) -> dict:
+    return dict.fromkeys((field.name for field in fields(cls)), PLACEHOLDER)
+
+
+def instantiate(
+    cls: type, unset: dict, values: dict, group_current: dict
+) -> betterproto.Message:
+    """A message as betterproto's parse builds it, unset fields default lazily"""
+    message = object.__new__(cls)
+    state = message.__dict__
+    state.update(unset)
+    state.update(values)
+    state["_serialized_on_wire"] = True
+    state["_unknown_fields"] = b""
+    state["_group_current"] = group_current
+    return message
+
+
+class FieldSpec:
+    """How one message field is laid out on the wire"""
+
+    __slots__ = ("name", "number", "proto_type", "wire_type", "tag", "enum", "schema")
+
+    def __init__(self, name: str, number: int, proto_type: str, field_cls: type):
+        self.name = name
+        self.number = number
+        self.proto_type = proto_type
+        self.wire_type = {
+            betterproto.TYPE_FLOAT: FIXED32,
+            betterproto.TYPE_STRING: LENGTH_DELIMITED,
+            betterproto.TYPE_MESSAGE: LENGTH_DELIMITED,
+        }.get(proto_type, VARINT)
+        self.tag = encode_varint(number << 3 | self.wire_type)
+        self.enum = None
+        self.schema = None
+        if proto_type == betterproto.TYPE_ENUM:
+            self.enum = field_cls
+        elif proto_type == betterproto.TYPE_MESSAGE:
+            self.schema = Schema(field_cls)
+
+
+class Schema:
+    """Field specs of a message class, in betterproto's serialization order"""
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self.unset = unset_fields(cls)
+        self.fields = []
+        cls_by_field = cls()._betterproto.cls_by_field
+        for field in fields(cls):
+            meta = field.metadata["betterproto"]
+            if meta.proto_type not in SUPPORTED_TYPES:
+                raise TypeError(f"Unsupported fast codec field {cls}.{field.name}")
+            self.fields.append(
+                FieldSpec(
+                    field.name, meta.number, meta.proto_type, cls_by_field[field.name]
+                )
+            )
+        self.by_number = {spec.number: spec for spec in self.fields}
+
+    def encode(self, message: betterproto.Message) -> bytearray:
+        out = bytearray()
+        for spec in self.fields:
+            value = getattr(message, spec.name)
+            proto_type = spec.proto_type
+            if proto_type == betterproto.TYPE_MESSAGE:
+                if value is None:
+                    continue
+                inner = spec.schema.encode(value)
+                if not inner and not betterproto.serialized_on_wire(value):
+                    continue
+                out += spec.tag
+                out += encode_varint(len(inner))
+                out += inner
+                continue
+            if not value:
+                continue  # proto3 default values stay off the wire
+            out += spec.tag
+            if proto_type == betterproto.TYPE_FLOAT:
+                out += FLOAT.pack(value)
+            elif proto_type == betterproto.TYPE_STRING:
+                encoded = value.encode("utf-8")
+                out += encode_varint(len(encoded))
+                out += encoded
+            elif proto_type == betterproto.TYPE_SINT32:
+                out += encode_varint((value << 1) ^ (value >> 31))
+            elif value < 0:
+                raise Fallback()  # negative varints take ten bytes, rare enough
+            else:
+                out += encode_varint(int(value))
+        return out
+
+    def decode(self, data: bytes, pos: int, end: int) -> betterproto.Message:
+        values = {}
+        while pos < end:
+            tag, pos = decode_varint(data, pos)
+            spec = self.by_number.get(tag >> 3)
+            if spec is None or spec.wire_type != tag & 7:
+                raise Fallback()
+            proto_type = spec.proto_type
+            if proto_type == betterproto.TYPE_FLOAT:
+                (values[spec.name],) = FLOAT.unpack_from(data, pos)
+                pos += 4
+            elif proto_type in LENGTH_DELIMITED_TYPES:
+                length, pos = decode_varint(data, pos)
+                if proto_type == betterproto.TYPE_STRING:
+                    values[spec.name] = data[pos : pos + length].decode("utf-8")
+                else:
+                    values[spec.name] = spec.schema.decode(data, pos, pos + length)
+                pos += length
+            else:
+                value, pos = decode_varint(data, pos)
+                if proto_type == betterproto.TYPE_SINT32:
+                    value = (value >> 1) ^ -(value & 1)
+                elif spec.enum is not None:
+                    value = spec.enum(value)
+                values[spec.name] = value
+        if pos != end:
+            raise Fallback()
+        return instantiate(self.cls, self.unset, values, {})
+
+
+SUPPORTED_TYPES = {
+    betterproto.TYPE_FLOAT,
+    betterproto.TYPE_STRING,
+    betterproto.TYPE_MESSAGE,
+    betterproto.TYPE_SINT32,
+    betterproto.TYPE_UINT32,
+    betterproto.TYPE_ENUM,
+}
+LENGTH_DELIMITED_TYPES = {betterproto.TYPE_STRING, betterproto.TYPE_MESSAGE}
+# high frequency payloads the fast path handles
+FAST_PAYLOADS = (
+    "character_position_updated",
+    "character_position_updated_quantized",
+    "character_direction_updated",
+    "character_updated",
+    "character_updated_quantized",
+    "projectile_created",
+    "projectile_created_quantized",
+    "projectile_destroyed",
+)
+
+
+def encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def decode_varint(data: bytes, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+class FastCodec(BetterprotoCodec):
+    """Hand rolled encoding of FAST_PAYLOADS, plus the Message routing
+    fields, with betterproto for any other message"""
+
+    def __init__(self):
+        message_fields = {field.name: field for field in fields(Message)}
+        cls_by_field = Message()._betterproto.cls_by_field
+        self.unset = unset_fields(Message)
+        self.routing = [
+            FieldSpec(name, number, betterproto.TYPE_STRING, str)
+            for name, number in (("destination_uuid", 10), ("origin_uuid", 11))
+        ]
+        self.payloads: dict[str, FieldSpec] = {}
+        self.payloads_by_number: dict[int, FieldSpec] = {}
+        for name in FAST_PAYLOADS:
+            number = message_fields[name].metadata["betterproto"].number
+            spec = FieldSpec(name, number, betterproto.TYPE_MESSAGE, cls_by_field[name])
+            self.payloads[name] = self.payloads_by_number[number] = spec
+
+    def encode(self, message: Message) -> bytes:
+        payload, details = betterproto.which_one_of(message, "payload")
+        spec = self.payloads.get(payload)
+        if spec is None:
+            return bytes(message)
+        try:
+            out = bytearray()
+            for routing in self.routing:
+                value = getattr(message, routing.name)
+                if value:
+                    encoded = value.encode("utf-8")
+                    out += routing.tag
+                    out += encode_varint(len(encoded))
+                    out += encoded
+            inner = spec.schema.encode(details)
+        except Fallback:
+            return bytes(message)
+        out += spec.tag
+        out += encode_varint(len(inner))
+        out += inner
+        return bytes(out)
+
+    def decode(self, data: bytes) -> Message:
+        try:
+            return self.decode_fast(data)
+        except (Fallback, IndexError, ValueError, UnicodeDecodeError):
+            return Message().parse(data)
+
+    def decode_fast(self, data: bytes) -> Message:
+        values = {}
+        payload = None
+        pos = 0
+        end = len(data)
+        while pos < end:
+            tag, pos = decode_varint(data, pos)
+            if tag & 7 != LENGTH_DELIMITED:
+                raise Fallback()
+            number = tag >> 3
+            length, pos = decode_varint(data, pos)
+            if number == 10:
+                values["destination_uuid"] = data[pos : pos + length].decode("utf-8")
+            elif number == 11:
+                values["origin_uuid"] = data[pos : pos + length].decode("utf-8")
+            else:
+                spec = self.payloads_by_number.get(number)
+                if spec is None or payload is not None:
+                    raise Fallback()
+                payload = spec.name
+                values[payload] = spec.schema.decode(data, pos, pos + length)
+            pos += length
+        if pos != end:
+            raise Fallback()
+        return instantiate(Message, self.unset, values, {"payload": payload})
+
+
+CODECS: dict[str, type[Codec]] = {
+    "betterproto": BetterprotoCodec,
+    "fast": FastCodec,
+}
+codec: Codec = CODECS[CODEC]()
+
+
+def encode(message: Message) -> bytes:
+    return codec.encode(message)
+
+
+def decode(data: bytes) -> Message:
+    return codec.decode(data)
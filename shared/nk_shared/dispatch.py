@@ -0,0 +1,96 @@
+"""Table driven message dispatch. The Message payload oneof is read once with
+betterproto.which_one_of and the handler registered for that payload is
+called with its details, counting and timing each payload type as it goes.
+Handlers acting on behalf of whoever sent the message can also ask for its
+origin_uuid."""
+
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from inspect import isawaitable
+from typing import Any, Callable
+
+import betterproto
+
+from nk_shared.proto import Message
+
+PAYLOAD = "payload"
+Handler = Callable[[Any], Any]
+
+
+@dataclass
+class DispatchStats:
+    """Messages handled for one payload type, and seconds spent handling them"""
+
+    count: int = 0
+    total_time: float = 0
+    max_time: float = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.count if self.count else 0
+
+    def record(self, duration: float):
+        self.count += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+
+
+class Dispatcher:
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.stats: defaultdict[str, DispatchStats] = defaultdict(DispatchStats)
+        self.unhandled = 0
+        self._handlers: dict[str, Handler] = {}
+        self._with_origin: set[str] = set()
+
+    def register(self, payload: str, handler: Handler, with_origin: bool = False):
+        """Handle messages whose payload is the Message field named `payload`.
+        The handler is called with that field's value, followed by the
+        Message's origin_uuid when with_origin is set."""
+        if payload not in Message.__dataclass_fields__:
+            raise ValueError(f"Unknown message payload: {payload}")
+        self._handlers[payload] = handler
+        if with_origin:
+            self._with_origin.add(payload)
+        else:
+            self._with_origin.discard(payload)
+
+    def clear(self):
+        self._handlers.clear()
+        self._with_origin.clear()
+
+    def dispatch(self, message: Message) -> bool:
+        """Call the payload's handler, returning whether there was one"""
+        payload, details = betterproto.which_one_of(message, PAYLOAD)
+        handler = self._handlers.get(payload)
+        if handler is None:
+            self.unhandled += 1
+            return False
+        start = self.clock()
+        if payload in self._with_origin:
+            handler(details, message.origin_uuid)
+        else:
+            handler(details)
+        self.stats[payload].record(self.clock() - start)
+        return True
+
+    async def dispatch_async(self, message: Message) -> bool:
+        """Like dispatch, awaiting handlers that are coroutines"""
+        payload, details = betterproto.which_one_of(message, PAYLOAD)
+        handler = self._handlers.get(payload)
+        if handler is None:
+            self.unhandled += 1
+            return False
+        start = self.clock()
+        if payload in self._with_origin:
+            result = handler(details, message.origin_uuid)
+        else:
+            result = handler(details)
+        if isawaitable(result):
+            await result
+        self.stats[payload].record(self.clock() - start)
+        return True
+
+    def __contains__(self, payload: str) -> bool:
+        return payload in self._handlers
@@ -1,8 +1,10 @@
 from functools import lru_cache
+from typing import Iterator
 
 import pymunk
 import pytmx
 
+from nk_shared.models.collision_category import CollisionCategory
 from nk_shared.settings import DATA_ROOT
 
 
@@ -29,6 +31,19 @@ class Tilemap:
     def add_map_geometry_to_space(
         self, space: pymunk.Space, tile_offset_x: int = 0, tile_offset_y: int = 0
     ):
+        for x, y in self.blocked_tiles(tile_offset_x, tile_offset_y):
+            body = pymunk.Body(body_type=pymunk.Body.STATIC)
+            body.position = (0.5 + x, 0.5 + y)
+            poly = pymunk.Poly.create_box(body, size=(1, 1))
+            poly.mass = 10
+            poly.filter = pymunk.ShapeFilter(categories=CollisionCategory.WALL)
+            space.add(body, poly)
+        return False
+
+    def blocked_tiles(
+        self, tile_offset_x: int = 0, tile_offset_y: int = 0
+    ) -> Iterator[tuple[int, int]]:
+        """Tiles with colliders or on the impassable layer, once per layer"""
         for layer in range(self.get_tile_layer_count()):
             impassable = self.get_layer_name(layer) == "impassable"
             for y in range(self.height):
@@ -38,15 +53,7 @@ class Tilemap:
                     colliders: list = tile_props.get("colliders", [])
                     impassable_tile = impassable and gid
                     if colliders or impassable_tile:
-                        body = pymunk.Body(body_type=pymunk.Body.STATIC)
-                        body.position = (
-                            0.5 + x + tile_offset_x,
-                            0.5 + y + tile_offset_y,
-                        )
-                        poly = pymunk.Poly.create_box(body, size=(1, 1))
-                        poly.mass = 10
-                        space.add(body, poly)
-        return False
+                        yield x + tile_offset_x, y + tile_offset_y
 
     @lru_cache(maxsize=32)
     def get_layer_name(self, layer: int) -> str:
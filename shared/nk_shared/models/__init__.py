@@ -1,7 +1,9 @@
 from nk_shared.models.attack_type import AttackType
 from nk_shared.models.character import Character
 from nk_shared.models.character_properties import CharacterProperties
-from nk_shared.models.projectile import Projectile
+from nk_shared.models.collision_category import CollisionCategory
+from nk_shared.models.projectile_pool import ProjectilePool, ProjectileView
+from nk_shared.models.snapshot_field import SnapshotField
 from nk_shared.models.weapon import Weapon
 from nk_shared.models.zone import Zone
 
@@ -10,6 +12,9 @@ __all__ = [
     "AttackType",
     "Character",
     "CharacterProperties",
+    "CollisionCategory",
     "Zone",
-    "Projectile",
+    "ProjectilePool",
+    "ProjectileView",
+    "SnapshotField",
 ]
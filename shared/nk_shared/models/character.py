@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from functools import lru_cache
+from itertools import count
 from os import environ
 from uuid import uuid4 as generate_uuid
 
@@ -8,21 +9,25 @@ import pymunk
 from nk_shared import direction_util
 from nk_shared.models.attack_type import AttackType
 from nk_shared.models.character_properties import CharacterProperties
+from nk_shared.models.collision_category import CollisionCategory
 from nk_shared.models.weapon import RangedWeapon, Weapon, load_weapon_by_name
 from nk_shared.proto import CharacterType, Direction
 
 DATA_ROOT = environ.get("NK_DATA_ROOT", "../data")
+collision_groups = count(1)
 
 
 @dataclass
 class Character(CharacterProperties):  # pylint: disable=too-many-instance-attributes
     character_type: CharacterType = CharacterType.CHARACTER_TYPE_PIGSASSIN
     uuid: str = field(default_factory=lambda: str(generate_uuid()))
+    handle: int = 0  # zone assigned, compact stand in for uuid on the wire
     facing_direction: Direction = Direction.DIRECTION_S
     moving_direction: Direction = None
     shape: pymunk.Shape = None
     body: pymunk.Body = None
-    hitbox_shape: pymunk.Shape = None
+    collision_category: CollisionCategory = CollisionCategory.ENEMY
+    collision_group: int = field(default_factory=lambda: next(collision_groups))
     dashing: bool = False
     dash_time_remaining: float = 0
     dash_cooldown_remaining: float = 0
@@ -56,10 +61,9 @@ class Character(CharacterProperties):  # pylint: disable=too-many-instance-attri
         self.body.character = self
         self.shape = pymunk.Circle(self.body, self.radius)
         self.shape.mass = self.mass
-        self.hitbox_shape = pymunk.Segment(
-            self.body, (0, 0), (self.weapon.attack_distance, 0), radius=1
+        self.shape.filter = pymunk.ShapeFilter(
+            group=self.collision_group, categories=self.collision_category
         )
-        self.hitbox_shape.sensor = True
 
     def handle_damage_received(self, dmg: float):
         if not self.invincible:
@@ -160,6 +164,15 @@ class Character(CharacterProperties):  # pylint: disable=too-many-instance-attri
             return True
         return False
 
+    def melee_hitbox_endpoints(self) -> tuple[pymunk.Vec2d, pymunk.Vec2d]:
+        """Segment swept by a melee attack, from the body out to attack distance"""
+        angle = (
+            self.body.angle if self.attack_direction is None else self.attack_direction
+        )
+        start = self.body.position
+        end = start + pymunk.Vec2d(self.weapon.attack_distance, 0).rotated(angle)
+        return start, end
+
     def dash(self):
         if not self.dashing and self.dash_cooldown_remaining <= 0:
             self.dashing = True
@@ -0,0 +1,11 @@
+from enum import IntFlag
+
+
+class CollisionCategory(IntFlag):
+    """pymunk shape filter categories, so queries can select shapes by kind"""
+
+    WALL = 1
+    PLAYER = 2
+    ENEMY = 4
+    PROJECTILE = 8
+    CHARACTER = PLAYER | ENEMY
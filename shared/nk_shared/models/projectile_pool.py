@@ -0,0 +1,181 @@
+"""Struct of arrays storage for projectiles in flight. Positions, velocities,
+lifetimes and owners live in NumPy arrays so integration is one vectorized
+operation per tick, and released slots are reused by later projectiles."""
+
+from typing import Iterator, NamedTuple
+
+import numpy as np
+import pymunk
+
+from nk_shared.models.collision_category import CollisionCategory
+from nk_shared.models.weapon import RangedWeapon
+
+INITIAL_CAPACITY = 64
+PROJECTILE_COLLISION_MASK = CollisionCategory.WALL | CollisionCategory.CHARACTER
+
+
+class ProjectileView(NamedTuple):
+    uuid: str
+    x: float
+    y: float
+    dx: float
+    dy: float
+    weapon: RangedWeapon
+    handle: int
+
+
+class SweepHit(NamedTuple):
+    slot: int
+    shape: pymunk.Shape
+
+
+class ProjectilePool:  # pylint: disable=too-many-instance-attributes
+    """Projectiles are looked up by zone assigned handle, or by uuid for
+    those predicted locally before the zone has assigned one"""
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        self.positions = np.zeros((capacity, 2))
+        self.velocities = np.zeros((capacity, 2))
+        self.lifetimes = np.zeros(capacity)
+        self.max_lifetimes = np.zeros(capacity)
+        self.owners = np.zeros(capacity, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.uuids: list[str] = [""] * capacity
+        self.handles = np.zeros(capacity, dtype=np.int64)
+        self.weapons: list[RangedWeapon | None] = [None] * capacity
+        self._slots: dict[str, int] = {}
+        self._handle_slots: dict[int, int] = {}
+        self._free: list[int] = list(range(capacity - 1, -1, -1))
+
+    def spawn(  # pylint: disable=too-many-arguments
+        self,
+        uuid: str,
+        x: float,
+        y: float,
+        dx: float,
+        dy: float,
+        weapon: RangedWeapon,
+        owner: int = 0,
+        handle: int = 0,
+    ) -> int:
+        """Store a new projectile, returning its slot. `owner` is the shooter's
+        collision group, which sweeps filter out. Either of uuid and handle
+        may be left empty."""
+        if not self._free:
+            self._grow()
+        slot = self._free.pop()
+        self.positions[slot] = (x, y)
+        self.velocities[slot] = (dx, dy)
+        self.lifetimes[slot] = 0
+        self.max_lifetimes[slot] = weapon.projectile_lifetime
+        self.owners[slot] = owner
+        self.active[slot] = True
+        self.uuids[slot] = uuid
+        self.handles[slot] = handle
+        self.weapons[slot] = weapon
+        if uuid:
+            self._slots[uuid] = slot
+        if handle:
+            self._handle_slots[handle] = slot
+        return slot
+
+    def release(self, slot: int):
+        if not self.active[slot]:
+            return
+        self._slots.pop(self.uuids[slot], None)
+        self._handle_slots.pop(int(self.handles[slot]), None)
+        self.active[slot] = False
+        self.velocities[slot] = 0
+        self.uuids[slot] = ""
+        self.handles[slot] = 0
+        self.weapons[slot] = None
+        self._free.append(slot)
+
+    def release_uuid(self, uuid: str) -> bool:
+        slot = self._slots.get(uuid)
+        if slot is None:
+            return False
+        self.release(slot)
+        return True
+
+    def release_handle(self, handle: int) -> bool:
+        slot = self._handle_slots.get(handle)
+        if slot is None:
+            return False
+        self.release(slot)
+        return True
+
+    def slot(self, uuid: str) -> int | None:
+        return self._slots.get(uuid)
+
+    def slot_by_handle(self, handle: int) -> int | None:
+        return self._handle_slots.get(handle)
+
+    def integrate(self, dt: float) -> np.ndarray:
+        """Advance every projectile, returning positions from before the step.
+        Released slots have zero velocity, so they are safe to integrate."""
+        previous = self.positions.copy()
+        self.positions += self.velocities * dt
+        self.lifetimes += dt
+        return previous
+
+    def sweep(self, space: pymunk.Space, dt: float) -> list[SweepHit]:
+        """Integrate, then query the segment each projectile travelled for the
+        first wall or character it touched, skipping its owner's shapes."""
+        previous = self.integrate(dt)
+        hits = []
+        for slot in np.flatnonzero(self.active):
+            shape_filter = pymunk.ShapeFilter(
+                group=int(self.owners[slot]), mask=PROJECTILE_COLLISION_MASK
+            )
+            info = space.segment_query_first(
+                tuple(previous[slot].tolist()),
+                tuple(self.positions[slot].tolist()),
+                self.weapons[slot].projectile_radius,
+                shape_filter,
+            )
+            if info is not None:
+                hits.append(SweepHit(int(slot), info.shape))
+        return hits
+
+    def expired(self, width: float, height: float) -> list[int]:
+        """Slots that outlived their weapon's range or left the map bounds"""
+        x, y = self.positions[:, 0], self.positions[:, 1]
+        expired = self.active & (
+            (self.lifetimes >= self.max_lifetimes)
+            | (x < 0)
+            | (y < 0)
+            | (x > width)
+            | (y > height)
+        )
+        return np.flatnonzero(expired).tolist()
+
+    def view(self, slot: int) -> ProjectileView:
+        x, y = self.positions[slot].tolist()
+        dx, dy = self.velocities[slot].tolist()
+        return ProjectileView(
+            self.uuids[slot], x, y, dx, dy, self.weapons[slot], int(self.handles[slot])
+        )
+
+    def __iter__(self) -> Iterator[ProjectileView]:
+        for slot in np.flatnonzero(self.active):
+            yield self.view(int(slot))
+
+    def __len__(self) -> int:
+        return len(self.active) - len(self._free)
+
+    def __contains__(self, uuid: str) -> bool:
+        return uuid in self._slots
+
+    def _grow(self):
+        capacity = len(self.active)
+        self.positions = np.concatenate([self.positions, np.zeros((capacity, 2))])
+        self.velocities = np.concatenate([self.velocities, np.zeros((capacity, 2))])
+        self.lifetimes = np.concatenate([self.lifetimes, np.zeros(capacity)])
+        self.max_lifetimes = np.concatenate([self.max_lifetimes, np.zeros(capacity)])
+        self.owners = np.concatenate([self.owners, np.zeros(capacity, np.int64)])
+        self.active = np.concatenate([self.active, np.zeros(capacity, bool)])
+        self.uuids.extend([""] * capacity)
+        self.handles = np.concatenate([self.handles, np.zeros(capacity, np.int64)])
+        self.weapons.extend([None] * capacity)
+        self._free.extend(range(2 * capacity - 1, capacity - 1, -1))
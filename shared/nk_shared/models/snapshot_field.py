@@ -0,0 +1,15 @@
+from enum import IntFlag
+
+
+class SnapshotField(IntFlag):
+    """Bits of `EntitySnapshot.fields`, marking which fields a delta carries"""
+
+    X = 1
+    Y = 2
+    DX = 4
+    DY = 8
+    CHARACTER_TYPE = 16
+    FACING_DIRECTION = 32
+    MOVING_DIRECTION = 64
+    HP = 128
+    ALL = X | Y | DX | DY | CHARACTER_TYPE | FACING_DIRECTION | MOVING_DIRECTION | HP
@@ -6,6 +6,8 @@ from dataclass_wizard import YAMLWizard
 from nk_shared.models.attack_type import AttackType
 from nk_shared.settings import DATA_ROOT
 
+DEFAULT_PROJECTILE_RANGE = 50
+
 
 @dataclass
 class Weapon(YAMLWizard):
@@ -22,6 +24,12 @@ class RangedWeapon(Weapon):
     projectile_radius: float = None
     clip_size: int = None
     reload_time: float = None
+    projectile_range: float = DEFAULT_PROJECTILE_RANGE
+
+    @property
+    def projectile_lifetime(self) -> float:
+        """Seconds a projectile may fly before it has travelled its range"""
+        return self.projectile_range / self.projectile_speed
 
 
 @lru_cache
@@ -32,4 +40,7 @@ def load_weapon_by_name(weapon_name: str) -> Weapon | RangedWeapon:
         weapon = Weapon.from_yaml(weapon_yaml)
         if weapon.attack_type == AttackType.RANGED:
             weapon = RangedWeapon.from_yaml(weapon_yaml)
+            if not weapon.projectile_speed or weapon.projectile_speed <= 0:
+                # projectile_lifetime divides by it
+                raise ValueError(f"{path}: projectile_speed must be positive")
     return weapon
@@ -11,6 +11,8 @@ class Spawner:
     offset_x: int
     offset_y: int
     spawn_frequency_s: float = 10
+    max_population: int = 5  # living enemies from this spawner
+    activation_distance: float = 40  # only spawn with a player this close
 
     @property
     def character_type(self) -> CharacterType:
@@ -43,9 +45,44 @@ class Medic:
     y: int
 
 
+@dataclass
+class AiLod:
+    """AI level of detail. Enemies within near_distance tiles of a player
+    think every tick, within mid_distance every mid_interval_ticks, and
+    beyond that only check whether to wake every far_interval_ticks."""
+
+    near_distance: float = 20
+    mid_distance: float = 40
+    mid_interval_ticks: int = 4
+    far_interval_ticks: int = 30
+
+
+@dataclass
+class Dormancy:
+    """Enemies with no player within sleep_distance tiles hibernate out of
+    the simulation, waking once a player comes within wake_distance.
+    Checked every check_interval_s."""
+
+    wake_distance: float = 50
+    sleep_distance: float = 60
+    check_interval_s: float = 1
+
+
+@dataclass
+class Spawning:
+    """Zone wide spawner limits. Spawners coming due after the tick's
+    max_spawns_per_tick are spent wait for a later tick."""
+
+    max_enemies: int = 100
+    max_spawns_per_tick: int = 1
+
+
 @dataclass
 class Zone(YAMLWizard):
     tmx_path: str
     enemy_groups: list[EnemyGroup]
     environment_features: list[Environment]
     medics: list[Medic]
+    ai_lod: AiLod = field(default_factory=AiLod)
+    dormancy: Dormancy = field(default_factory=Dormancy)
+    spawning: Spawning = field(default_factory=Spawning)
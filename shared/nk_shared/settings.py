@@ -8,3 +8,5 @@ DATA_ROOT = environ.get("NK_DATA_ROOT", f"{PROJECT_ROOT}/data")
 ENABLE_PROFILING = bool(environ.get("ENABLE_PROFILING", ""))
 MAPGEN_WIDTH = int(environ.get("MAPGEN_WIDTH", "200"))
 ZONE_NAME = environ.get("ZONE_NAME", "1")
+POSITION_PRECISION = int(environ.get("POSITION_PRECISION", "64"))
+CODEC = environ.get("CODEC", "fast")  # fast or betterproto
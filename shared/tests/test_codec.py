@@ -0,0 +1,67 @@
+import betterproto
+import pytest
+
+from nk_shared import builders
+from nk_shared.codec import FastCodec
+from nk_shared.models.character import Character
+from nk_shared.proto import (
+    CharacterPositionUpdated,
+    CharacterUpdated,
+    Direction,
+    Message,
+    Projectile,
+    TextMessage,
+)
+
+
+@pytest.fixture
+def character() -> Character:
+    character = Character(start_x=3.5, start_y=-4.25, handle=7)
+    character.velocity = (1.5, -2)
+    character.facing_direction = Direction.DIRECTION_NE
+    return character
+
+
+@pytest.fixture
+def messages(character: Character) -> list[Message]:
+    projectile = Projectile(x=1, y=2, dx=3, dy=-4, weapon_name="ak47", handle=9)
+    return [
+        builders.build_character_position_updated_quantized(character),
+        builders.build_character_direction_updated(character),
+        builders.build_character_updated(character),
+        builders.build_character_updated_quantized(character),
+        builders.build_projectile_created_quantized(character, projectile),
+        builders.build_projectile_destroyed(5),
+        Message(
+            origin_uuid="1234",
+            character_position_updated=CharacterPositionUpdated(handle=1, x=-1.25),
+        ),
+        Message(character_updated=CharacterUpdated()),
+        Message(text_message=TextMessage(text="slow path")),
+    ]
+
+
+class TestFastCodec:
+    def test_encode_matches_betterproto(self, messages: list[Message]):
+        codec = FastCodec()
+        for message in messages:
+            assert codec.encode(message) == bytes(message)
+
+    def test_decode_matches_betterproto(self, messages: list[Message]):
+        codec = FastCodec()
+        for message in messages:
+            data = bytes(message)
+            decoded = codec.decode(data)
+            assert decoded == Message().parse(data)
+            assert betterproto.which_one_of(decoded, "payload")[0] == (
+                betterproto.which_one_of(message, "payload")[0]
+            )
+            assert bytes(decoded) == data
+
+    def test_decode_falls_back_for_repeated_payloads(self, character: Character):
+        """Protobuf keeps the last oneof member on the wire"""
+        data = bytes(builders.build_character_direction_updated(character)) + bytes(
+            builders.build_projectile_destroyed(5)
+        )
+        decoded = FastCodec().decode(data)
+        assert betterproto.which_one_of(decoded, "payload")[0] == "projectile_destroyed"
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from nk_shared.dispatch import Dispatcher
+from nk_shared.proto import Message, TextMessage
+
+
+class TestDispatcher:
+    def test_dispatch_calls_handler_with_details(self):
+        dispatcher = Dispatcher()
+        received = []
+        dispatcher.register("text_message", received.append)
+        msg = Message(text_message=TextMessage(text="hi"))
+        assert dispatcher.dispatch(msg)
+        assert received == [msg.text_message]
+        assert dispatcher.stats["text_message"].count == 1
+
+    def test_dispatch_with_origin(self):
+        dispatcher = Dispatcher()
+        received = []
+        dispatcher.register(
+            "text_message", lambda *args: received.append(args), with_origin=True
+        )
+        msg = Message(origin_uuid="1234", text_message=TextMessage(text="hi"))
+        assert dispatcher.dispatch(msg)
+        assert received == [(msg.text_message, "1234")]
+
+    def test_unhandled(self):
+        dispatcher = Dispatcher()
+        assert not dispatcher.dispatch(Message(text_message=TextMessage(text="hi")))
+        assert not dispatcher.dispatch(Message())
+        assert dispatcher.unhandled == 2
+        assert not dispatcher.stats
+
+    def test_unknown_payload(self):
+        with pytest.raises(ValueError):
+            Dispatcher().register("text_mesage", print)
+
+    def test_dispatch_async_awaits_coroutines(self):
+        dispatcher = Dispatcher()
+        received = []
+
+        async def handle(details: TextMessage):
+            received.append(details.text)
+
+        dispatcher.register("text_message", handle)
+        msg = Message(text_message=TextMessage(text="hi"))
+        assert asyncio.run(dispatcher.dispatch_async(msg))
+        assert received == ["hi"]
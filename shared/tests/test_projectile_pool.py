@@ -0,0 +1,62 @@
+import pymunk
+import pytest
+
+from nk_shared.models import ProjectilePool
+from nk_shared.models.weapon import load_weapon_by_name
+
+
+@pytest.fixture
+def weapon():
+    return load_weapon_by_name("ak47")
+
+
+class TestProjectilePool:
+    def test_integrate_and_reuse_slots(self, weapon):
+        pool = ProjectilePool(capacity=1)
+        first = pool.spawn("a", 0, 0, 10, 0, weapon)
+        second = pool.spawn("b", 0, 0, 0, 10, weapon)
+        pool.integrate(0.5)
+        assert pool.view(first)[1:3] == (5, 0)
+        assert pool.view(second)[1:3] == (0, 5)
+        assert len(pool) == 2
+        pool.release(first)
+        assert "a" not in pool
+        assert pool.spawn("c", 1, 1, 0, 0, weapon) == first
+        assert [view.uuid for view in pool] == ["c", "b"]
+
+    def test_sweep_skips_owner(self, weapon):
+        space = pymunk.Space()
+        body = pymunk.Body()
+        body.position = (5, 0)
+        shape = pymunk.Circle(body, 0.5)
+        shape.filter = pymunk.ShapeFilter(group=7, categories=2)
+        space.add(body, shape)
+        pool = ProjectilePool()
+        owned = pool.spawn("owned", 0, 0, 100, 0, weapon, owner=7)
+        other = pool.spawn("other", 0, 0, 100, 0, weapon, owner=8)
+        hits = pool.sweep(space, 0.1)
+        assert [hit.slot for hit in hits] == [other]
+        assert owned not in [hit.slot for hit in hits]
+
+    def test_expired_by_range_and_bounds(self, weapon):
+        pool = ProjectilePool()
+        short = pool.spawn("short", 5, 5, 0, 0, weapon)
+        escaping = pool.spawn("escaping", 9, 5, 100, 0, weapon)
+        pool.spawn("flying", 5, 5, 1, 0, weapon)
+        pool.integrate(0.1)
+        assert pool.expired(10, 10) == [escaping]
+        pool.integrate(weapon.projectile_lifetime)
+        assert sorted(pool.expired(100, 100)) == sorted([short, escaping, 2])
+
+    def test_release_by_handle(self, weapon):
+        pool = ProjectilePool()
+        predicted = pool.spawn("predicted", 0, 0, 0, 0, weapon)
+        zoned = pool.spawn("", 0, 0, 0, 0, weapon, handle=12)
+        assert pool.slot_by_handle(12) == zoned
+        assert not pool.release_handle(13)
+        assert pool.release_handle(12)
+        assert pool.slot_by_handle(12) is None
+        assert [view.uuid for view in pool] == ["predicted"]
+        assert pool.release_uuid("predicted")
+        assert predicted in pool._free
+        assert len(pool) == 0
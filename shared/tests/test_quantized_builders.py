@@ -0,0 +1,28 @@
+from nk_shared import builders
+from nk_shared.models import Character
+from nk_shared.proto import Message
+
+
+class TestQuantizedBuilders:
+    def test_roundtrip_within_precision(self):
+        character = Character(start_x=123.456, start_y=7.89)
+        character.velocity = (-3.21, 0.5)
+        msg = builders.build_character_updated_quantized(character)
+        parsed = builders.dequantize_message(Message().parse(bytes(msg)))
+        details = parsed.character_updated
+        assert parsed.origin_uuid == character.uuid
+        assert abs(details.x - 123.456) <= 1 / 64
+        assert abs(details.y - 7.89) <= 1 / 64
+        assert abs(details.dx + 3.21) <= 1 / 64
+        assert details.character_type == character.character_type
+
+    def test_smaller_than_float_encoding(self):
+        character = Character(start_x=250.3, start_y=180.7)
+        character.velocity = (4.2, -1.3)
+        quantized = builders.build_character_position_updated_quantized(character)
+        full = builders.build_character_position_updated(character)
+        assert len(bytes(quantized)) < len(bytes(full))
+
+    def test_unquantized_message_unchanged(self):
+        msg = builders.build_text_message("hi")
+        assert builders.dequantize_message(msg) is msg
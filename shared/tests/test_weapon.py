@@ -0,0 +1,15 @@
+import pytest
+
+from nk_shared.models import weapon as weapon_module
+from nk_shared.models.weapon import load_weapon_by_name
+
+
+def test_ranged_weapon_needs_projectile_speed(tmp_path, monkeypatch):
+    (tmp_path / "weapons").mkdir()
+    (tmp_path / "weapons" / "stalled.yml").write_text(
+        "projectile_speed: 0\nprojectile_radius: 0.3\nattack_type: 2\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(weapon_module, "DATA_ROOT", str(tmp_path))
+    with pytest.raises(ValueError):
+        load_weapon_by_name("stalled")
@@ -1,87 +1,113 @@
 import random
-from math import atan2, log2
+import time
+from collections import OrderedDict
+from collections.abc import Collection
+from math import inf, log2
+from typing import Callable
 
-from nk_shared import builders, direction_util
+from nk_shared import builders
 from nk_shared.models.character import Character
 from nk_shared.models.zone import Zone
-from nk_shared.proto import CharacterType, Message
+from nk_shared.proto import CharacterType
 
-from app.ai import incrementals
+from app.ai.behavior import BehaviorContext, load_behavior_tree
+from app.ai.dormancy import DormancyManager
+from app.ai.flow_field import FlowFieldManager
+from app.ai.lod import LodScheduler, LodTier
+from app.ai.sensing import Sensed, sense
 from app.ai.spawner_manager import SpawnerManager, SpawnerProvider
 from app.models import Enemy, Player, WorldInterface, WorldListener
-
-FULL_UPDATE_FREQUENCY = 10
+from app.settings import AI_BUDGET_MS, AI_SLICE
 
 
 class Ai(SpawnerProvider, WorldListener):
-    def __init__(self, world: WorldInterface, zone: Zone):
+    def __init__(
+        self,
+        world: WorldInterface,
+        zone: Zone,
+        budget_ms: float = AI_BUDGET_MS,
+        slice_size: int = AI_SLICE,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
         self.world = world
         self.zone = zone
-        self.next_update_time = 0
-        self.enemies: list[Enemy] = []
-        self.spawn_manager = SpawnerManager(self, zone.environment_features)
+        self.budget = budget_ms / 1000
+        self.slice_size = max(1, slice_size)
+        self.clock = clock
+        self._pending: OrderedDict[str, Enemy] = OrderedDict()
+        self.spawn_manager = SpawnerManager(
+            self, zone.environment_features, zone.spawning
+        )
+        self.flow_fields = FlowFieldManager(world.blocked_tiles)
+        self.lod = LodScheduler(zone.ai_lod)
+        self.dormancy = DormancyManager(world, zone.dormancy)
         self.world.add_listener(self)
         for grp in self.zone.enemy_groups:
-            self.spawn_enemies(
-                grp.count, grp.character_type, grp.center_x, grp.center_y
+            list(
+                self.spawn_enemies(
+                    grp.count, grp.character_type, grp.center_x, grp.center_y
+                )
             )
 
     async def update(self, dt: float):
-        """Update enemy behaviors. Long term refactor option (e.g. behavior trees)"""
+        """Update enemy behaviors. Enemies due this tick are queued behind any
+        the time budget deferred last tick, then run round robin a slice at
+        a time until the queue empties or the budget is spent. The first
+        slice always runs, so a blown budget defers enemies but never starves
+        them. Flow field builds are charged to the same budget. Observers
+        learn of enemy movement from their delta snapshots."""
         if self.world.players:
             await self.spawn_manager.update(dt)
+        for enemy in self.dormancy.update(dt, self.world.players):
+            self.forget(enemy)
+        deadline = self.clock() + self.budget
+        self.flow_fields.update(
+            dt, self.world.players, lambda: self.clock() >= deadline
+        )
 
-        self.next_update_time -= dt
-        full_update = self.next_update_time <= 0
-        if full_update:
-            self.next_update_time = FULL_UPDATE_FREQUENCY
+        self.lod.begin_tick()
         for enemy in self.enemies:
-            if enemy.alive:
-                await self.update_enemy_behavior(enemy)
-                if not full_update:
-                    await incrementals.update_direction(self.world, enemy)
-                    await incrementals.update_position(dt, self.world, enemy)
-            if full_update:
-                proto = builders.build_character_updated(enemy)
-                await self.world.publish(proto)
-
-    async def update_enemy_behavior(self, enemy: Enemy):
-        """Update behavior for a single enemy."""
-        enemy.moving_direction = None
-        player = self.closest_player(enemy.position.x, enemy.position.y)
-        if not player:
-            return
-
-        player_dst_sqrd = enemy.position.get_dist_sqrd(player.position)
-        if player_dst_sqrd < enemy.chase_distance**2:
-            enemy.moving_direction = direction_util.direction_to(
-                enemy.position, player.position
-            )
-
-        if player_dst_sqrd < enemy.weapon.attack_distance**2 and not enemy.attacking:
-            await self.enemy_attack(enemy, player)
-
-    async def enemy_attack(self, enemy: Enemy, player: Player):
-        """Handle enemy attack behavior."""
-        direction = atan2(
-            player.position.y - enemy.position.y,
-            player.position.x - enemy.position.x,
-        )
-        enemy.attack(direction)
-        await self.world.publish(builders.build_character_attacked(enemy, direction))
-
-    def closest_player(self, x: float, y: float) -> Player | None:
-        """Retrieve the closest player to the given x,y pair.
-        Long term, should considering splitting world into zone/chunks, but
-        this is a scan currently."""
-        closest, min_dst = None, float("inf")
-        for player in self.world.players:
-            if player.alive:
-                dst = player.position.get_dist_sqrd((x, y))
-                if dst < min_dst:
-                    closest = player
-                    min_dst = dst
-        return closest
+            if enemy.alive and self.lod.due(enemy):
+                self._pending.setdefault(enemy.uuid, enemy)
+        players = [player for player in self.world.players if player.alive]
+        while self._pending:
+            batch = [
+                self._pending.popitem(last=False)[1]
+                for _ in range(min(self.slice_size, len(self._pending)))
+            ]
+            for enemy, sensed in zip(batch, sense(batch, players)):
+                await self.update_enemy_lod(dt, enemy, sensed)
+            if self.clock() >= deadline:
+                break
+        self.lod.stats.deferred = len(self._pending)
+
+    async def update_enemy_lod(self, dt: float, enemy: Enemy, sensed: Sensed):
+        """Re-tier the enemy, then think unless it is far from every player.
+        Enemies falling asleep stop moving."""
+        previous = self.lod.tier(enemy)
+        elapsed = dt * self.lod.interval(previous)
+        tier = self.lod.assign(enemy, sensed.distance if sensed.player else None)
+        if tier == LodTier.FAR:
+            if previous != LodTier.FAR:
+                enemy.moving_direction = None
+        else:
+            await self.update_enemy_behavior(elapsed, enemy, sensed)
+
+    async def update_enemy_behavior(self, dt: float, enemy: Enemy, sensed: Sensed):
+        """Tick the enemy's behavior tree with what it sensed this tick"""
+        ctx = BehaviorContext(enemy, sensed, self.flow_fields, dt)
+        load_behavior_tree(enemy.character_type_short).tick(ctx)
+        if ctx.attacked:
+            msg = builders.build_character_attacked(enemy, enemy.attack_direction)
+            await self.world.publish_to_observers(enemy, msg)
+
+    def closest_player(
+        self, x: float, y: float, max_distance: float = inf
+    ) -> Player | None:
+        """Retrieve the closest living player to the given x,y pair, using
+        the world's player spatial index."""
+        closest = self.world.player_index.nearest(x, y, max_distance=max_distance)
+        return closest[0] if closest else None
 
     def spawn_enemies(
         self, count: int, character_type: CharacterType, center_x: int, center_y: int
@@ -102,13 +128,27 @@ class Ai(SpawnerProvider, WorldListener):
             start_x=center_x,
             start_y=center_y,
         )
-        self.enemies.append(character)
-        self.world.space.add(character.body, character.shape, character.hitbox_shape)
+        self.world.add_character(character)
         return character
 
-    async def publish(self, message: Message, **kwargs) -> None:
-        await self.world.publish(message, **kwargs)
+    def player_near(self, x: float, y: float, distance: float) -> bool:
+        return self.closest_player(x, y, max_distance=distance) is not None
+
+    @property
+    def population(self) -> int:
+        return len(self.world.enemies) + len(self.dormancy)
 
     def character_removed(self, character: Character):
         if isinstance(character, Enemy):
-            self.enemies.remove(character)
+            self.forget(character)
+            self.spawn_manager.character_removed(character)
+            self.world.remove_character(character)
+
+    def forget(self, enemy: Enemy):
+        """Drop scheduling state for an enemy leaving the simulation"""
+        self.lod.forget(enemy)
+        self._pending.pop(enemy.uuid, None)
+
+    @property
+    def enemies(self) -> Collection[Enemy]:
+        return self.world.enemies
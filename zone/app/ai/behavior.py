@@ -0,0 +1,200 @@
+"""Behavior trees for enemies. Trees are loaded once per character type from
+`data/characters/<type>/behavior.yml` and shared by every enemy of that
+type, so nodes hold no per-enemy state. Anything a node must remember
+between ticks, like which child was running, lives in the enemy's
+Blackboard, keyed by node id.
+
+Each YAML node is a single key mapping, e.g.
+
+    sequence:
+      - condition: can_attack
+      - action: attack
+      - wait: 0.5
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from itertools import count
+from typing import Callable
+
+import yaml
+from nk_shared.settings import DATA_ROOT
+
+from app.ai.flow_field import FlowFieldManager
+from app.ai.sensing import Sensed
+from app.models import Enemy
+
+node_ids = count(1)
+
+
+class Status(Enum):
+    SUCCESS = 1
+    FAILURE = 2
+    RUNNING = 3
+
+
+@dataclass(slots=True)
+class BehaviorContext:
+    enemy: Enemy
+    sensed: Sensed
+    flow_fields: FlowFieldManager
+    dt: float
+    attacked: bool = False
+
+    @property
+    def blackboard(self):
+        return self.enemy.blackboard
+
+
+class Node(ABC):
+    def __init__(self):
+        self.id = next(node_ids)
+
+    @abstractmethod
+    def tick(self, ctx: BehaviorContext) -> Status:
+        raise NotImplementedError()
+
+
+class SequenceNode(Node):
+    """Runs children in order until one fails, resuming a running child"""
+
+    def __init__(self, children: list[Node]):
+        super().__init__()
+        self.children = children
+
+    def tick(self, ctx: BehaviorContext) -> Status:
+        start = ctx.blackboard.running.pop(self.id, 0)
+        for index in range(start, len(self.children)):
+            status = self.children[index].tick(ctx)
+            if status == Status.RUNNING:
+                ctx.blackboard.running[self.id] = index
+                return status
+            if status == Status.FAILURE:
+                return status
+        return Status.SUCCESS
+
+
+class SelectorNode(Node):
+    """Runs children in order until one succeeds, resuming a running child"""
+
+    def __init__(self, children: list[Node]):
+        super().__init__()
+        self.children = children
+
+    def tick(self, ctx: BehaviorContext) -> Status:
+        start = ctx.blackboard.running.pop(self.id, 0)
+        for index in range(start, len(self.children)):
+            status = self.children[index].tick(ctx)
+            if status == Status.RUNNING:
+                ctx.blackboard.running[self.id] = index
+                return status
+            if status == Status.SUCCESS:
+                return status
+        return Status.FAILURE
+
+
+class OptionalNode(Node):
+    """Succeeds even when its child fails"""
+
+    def __init__(self, child: Node):
+        super().__init__()
+        self.child = child
+
+    def tick(self, ctx: BehaviorContext) -> Status:
+        status = self.child.tick(ctx)
+        return Status.SUCCESS if status == Status.FAILURE else status
+
+
+class ConditionNode(Node):
+    def __init__(self, predicate: Callable[[BehaviorContext], bool]):
+        super().__init__()
+        self.predicate = predicate
+
+    def tick(self, ctx: BehaviorContext) -> Status:
+        return Status.SUCCESS if self.predicate(ctx) else Status.FAILURE
+
+
+class ActionNode(Node):
+    def __init__(self, action: Callable[[BehaviorContext], Status]):
+        super().__init__()
+        self.action = action
+
+    def tick(self, ctx: BehaviorContext) -> Status:
+        return self.action(ctx)
+
+
+class WaitNode(Node):
+    """Keeps running until `seconds` have passed"""
+
+    def __init__(self, seconds: float):
+        super().__init__()
+        self.seconds = seconds
+
+    def tick(self, ctx: BehaviorContext) -> Status:
+        elapsed = ctx.blackboard.timers.pop(self.id, 0.0) + ctx.dt
+        if elapsed >= self.seconds:
+            return Status.SUCCESS
+        ctx.blackboard.timers[self.id] = elapsed
+        return Status.RUNNING
+
+
+def chase(ctx: BehaviorContext) -> Status:
+    """Walk the flow field around walls, straight in once on their tile"""
+    enemy = ctx.enemy
+    direction = (
+        ctx.flow_fields.direction(ctx.sensed.player, enemy.position.x, enemy.position.y)
+        or ctx.sensed.direction
+    )
+    if enemy.moving_direction != direction:
+        enemy.moving_direction = direction
+    return Status.SUCCESS
+
+
+def attack(ctx: BehaviorContext) -> Status:
+    ctx.enemy.attack(ctx.sensed.angle)
+    ctx.attacked = True
+    return Status.SUCCESS
+
+
+def idle(ctx: BehaviorContext) -> Status:
+    ctx.enemy.moving_direction = None
+    return Status.SUCCESS
+
+
+CONDITIONS: dict[str, Callable[[BehaviorContext], bool]] = {
+    "in_chase_range": lambda ctx: ctx.sensed.chase,
+    "can_attack": lambda ctx: ctx.sensed.attack,
+    "attacking": lambda ctx: ctx.enemy.attacking,
+}
+ACTIONS: dict[str, Callable[[BehaviorContext], Status]] = {
+    "chase": chase,
+    "attack": attack,
+    "idle": idle,
+}
+
+
+def build_node(spec: dict) -> Node:
+    """Build a tree from its parsed YAML"""
+    ((kind, argument),) = spec.items()
+    if kind == "sequence":
+        return SequenceNode([build_node(child) for child in argument])
+    if kind == "selector":
+        return SelectorNode([build_node(child) for child in argument])
+    if kind == "optional":
+        return OptionalNode(build_node(argument))
+    if kind == "condition":
+        return ConditionNode(CONDITIONS[argument])
+    if kind == "action":
+        return ActionNode(ACTIONS[argument])
+    if kind == "wait":
+        return WaitNode(float(argument))
+    raise ValueError(f"Unknown behavior node: {kind}")
+
+
+@lru_cache
+def load_behavior_tree(character_type_short: str) -> Node:
+    path = f"{DATA_ROOT}/characters/{character_type_short}/behavior.yml"
+    with open(path, encoding="utf-8") as behavior_file:
+        return build_node(yaml.safe_load(behavior_file))
@@ -0,0 +1,110 @@
+"""Hibernation of enemies far from every player. Dormant enemies leave the
+registry and physics space and are kept as plain records in a spatial
+hash, so physics and AI cost scales with active enemies rather than the
+whole population."""
+
+from collections.abc import Collection
+from dataclasses import dataclass
+
+from nk_shared.models.zone import Dormancy
+from nk_shared.proto import CharacterType, Direction
+
+from app.models import Enemy, Player, WorldInterface
+from app.spatial import SpatialHash
+
+
+@dataclass(slots=True)
+class DormantEnemy:
+    uuid: str
+    character_type: CharacterType
+    x: float
+    y: float
+    center_x: int
+    center_y: int
+    facing_direction: Direction
+    hp: float
+    rounds_remaining: int
+    reloading: bool
+    reload_time_remaining: float
+    dash_cooldown_remaining: float
+
+    @classmethod
+    def from_enemy(cls, enemy: Enemy) -> "DormantEnemy":
+        x, y = enemy.body.position
+        return cls(
+            uuid=enemy.uuid,
+            character_type=enemy.character_type,
+            x=x,
+            y=y,
+            center_x=enemy.center_x,
+            center_y=enemy.center_y,
+            facing_direction=enemy.facing_direction,
+            hp=enemy.hp,
+            rounds_remaining=enemy.rounds_remaining,
+            reloading=enemy.reloading,
+            reload_time_remaining=enemy.reload_time_remaining,
+            dash_cooldown_remaining=enemy.dash_cooldown_remaining,
+        )
+
+    def to_enemy(self) -> Enemy:
+        enemy = Enemy(
+            uuid=self.uuid,
+            character_type=self.character_type,
+            start_x=self.x,
+            start_y=self.y,
+            center_x=self.center_x,
+            center_y=self.center_y,
+        )
+        enemy.facing_direction = self.facing_direction
+        enemy.hp = self.hp
+        enemy.rounds_remaining = self.rounds_remaining
+        enemy.reloading = self.reloading
+        enemy.reload_time_remaining = self.reload_time_remaining
+        enemy.dash_cooldown_remaining = self.dash_cooldown_remaining
+        return enemy
+
+
+class DormancyManager:
+    def __init__(self, world: WorldInterface, config: Dormancy):
+        self.world = world
+        self.config = config
+        self._dormant: SpatialHash[DormantEnemy] = SpatialHash()
+        self._time_until_check = config.check_interval_s
+
+    def update(self, dt: float, players: Collection[Player]) -> list[Enemy]:
+        """Every check interval wake dormant enemies near players, then put
+        enemies far from all of them to sleep. Returns enemies put to sleep."""
+        self._time_until_check -= dt
+        if self._time_until_check > 0:
+            return []
+        self._time_until_check = self.config.check_interval_s
+        living = [player for player in players if player.alive]
+        self.wake(living)
+        return self.sleep()
+
+    def wake(self, players: Collection[Player]):
+        for player in players:
+            x, y = player.body.position
+            for record in self._dormant.query_radius(x, y, self.config.wake_distance):
+                self._dormant.remove(record)
+                self.world.add_character(record.to_enemy())
+
+    def sleep(self) -> list[Enemy]:
+        """Hibernate enemies with no living player within sleep distance"""
+        sleepers = []
+        for enemy in list(self.world.enemies):
+            if not enemy.alive:
+                continue
+            x, y = enemy.body.position
+            if self.world.player_index.nearest(
+                x, y, max_distance=self.config.sleep_distance
+            ):
+                continue
+            record = DormantEnemy.from_enemy(enemy)
+            self._dormant.update(record, record.x, record.y)
+            self.world.remove_character(enemy)
+            sleepers.append(enemy)
+        return sleepers
+
+    def __len__(self) -> int:
+        return len(self._dormant)
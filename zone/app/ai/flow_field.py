@@ -0,0 +1,151 @@
+"""Flow fields for chasing enemies. Each field is a Dijkstra map flooded out
+from a player's tile through passable tiles, storing for every reached tile
+the direction of its next step toward the player. Fields are rebuilt only
+when a player changes tiles and are shared by players on the same tile, so
+any number of enemies steer with a single dict lookup."""
+
+import heapq
+from collections.abc import Collection, Set
+from math import floor, sqrt
+from typing import Callable
+
+from nk_shared.proto import Direction
+
+from app.models import Player
+from app.settings import FLOW_FIELD_INTERVAL, FLOW_FIELD_RADIUS
+
+Tile = tuple[int, int]
+
+# neighbor offset, step cost and the direction walked to reach it
+NEIGHBORS = (
+    ((0, -1), 1.0, Direction.DIRECTION_N),
+    ((1, -1), sqrt(2), Direction.DIRECTION_NE),
+    ((1, 0), 1.0, Direction.DIRECTION_E),
+    ((1, 1), sqrt(2), Direction.DIRECTION_SE),
+    ((0, 1), 1.0, Direction.DIRECTION_S),
+    ((-1, 1), sqrt(2), Direction.DIRECTION_SW),
+    ((-1, 0), 1.0, Direction.DIRECTION_W),
+    ((-1, -1), sqrt(2), Direction.DIRECTION_NW),
+)
+REVERSED = {
+    Direction.DIRECTION_N: Direction.DIRECTION_S,
+    Direction.DIRECTION_NE: Direction.DIRECTION_SW,
+    Direction.DIRECTION_E: Direction.DIRECTION_W,
+    Direction.DIRECTION_SE: Direction.DIRECTION_NW,
+    Direction.DIRECTION_S: Direction.DIRECTION_N,
+    Direction.DIRECTION_SW: Direction.DIRECTION_NE,
+    Direction.DIRECTION_W: Direction.DIRECTION_E,
+    Direction.DIRECTION_NW: Direction.DIRECTION_SE,
+}
+
+
+def tile_at(x: float, y: float) -> Tile:
+    return floor(x), floor(y)
+
+
+class FlowField:
+    """Directions toward `target`, for tiles within `radius` path distance"""
+
+    def __init__(self, target: Tile, blocked: Set[Tile], radius: float):
+        self.target = target
+        self.directions: dict[Tile, Direction] = {}
+        self._flood(blocked, radius)
+
+    def direction(self, tile: Tile) -> Direction | None:
+        return self.directions.get(tile)
+
+    def _flood(self, blocked: Set[Tile], radius: float):
+        costs = {self.target: 0.0}
+        frontier = [(0.0, self.target)]
+        while frontier:
+            cost, tile = heapq.heappop(frontier)
+            if cost > costs[tile]:
+                continue
+            for (dx, dy), step, direction in NEIGHBORS:
+                neighbor = (tile[0] + dx, tile[1] + dy)
+                if neighbor in blocked or cuts_corner(tile, dx, dy, blocked):
+                    continue
+                neighbor_cost = cost + step
+                if neighbor_cost > radius or neighbor_cost >= costs.get(
+                    neighbor, radius + 1
+                ):
+                    continue
+                costs[neighbor] = neighbor_cost
+                # walking back from the neighbor retraces this step
+                self.directions[neighbor] = REVERSED[direction]
+                heapq.heappush(frontier, (neighbor_cost, neighbor))
+
+
+def cuts_corner(tile: Tile, dx: int, dy: int, blocked: Set[Tile]) -> bool:
+    """Diagonal steps squeezing between two walls would snag on their corners"""
+    if not dx or not dy:
+        return False
+    return (tile[0] + dx, tile[1]) in blocked or (tile[0], tile[1] + dy) in blocked
+
+
+class FlowFieldManager:
+    def __init__(
+        self,
+        blocked: Set[Tile],
+        radius: float = FLOW_FIELD_RADIUS,
+        interval: float = FLOW_FIELD_INTERVAL,
+    ):
+        self.blocked = blocked
+        self.radius = radius
+        self.interval = interval
+        self.builds = 0
+        self._elapsed = 0.0
+        self._player_tiles: dict[str, Tile] = {}  # the field each player uses
+        self._fields: dict[Tile, FlowField] = {}
+
+    def update(
+        self,
+        dt: float,
+        players: Collection[Player],
+        out_of_time: Callable[[], bool] = lambda: False,
+    ):
+        """Point players at the field for their tile. Players on a tile
+        without one keep their previous field until a rebuild is due, new
+        players get one right away. After the first build, building stops
+        once out_of_time, the rest waiting for the next tick. Fields no
+        player uses anymore are dropped."""
+        self._elapsed += dt
+        rebuild = self._elapsed >= self.interval
+        player_tiles = {}
+        unbuilt = []
+        for player in players:
+            if not player.alive:
+                continue
+            tile = tile_at(*player.body.position)
+            previous = self._player_tiles.get(player.uuid)
+            if tile in self._fields:
+                player_tiles[player.uuid] = tile
+                continue
+            if previous is not None:
+                player_tiles[player.uuid] = previous
+            if rebuild or previous is None:
+                unbuilt.append((player.uuid, tile))
+        built = 0
+        finished = True
+        for uuid, tile in unbuilt:
+            if built and out_of_time():
+                finished = False
+                break
+            if tile not in self._fields:
+                self._fields[tile] = FlowField(tile, self.blocked, self.radius)
+                built += 1
+            player_tiles[uuid] = tile
+        self.builds += built
+        if rebuild and finished:
+            self._elapsed = 0.0
+        self._player_tiles = player_tiles
+        for tile in self._fields.keys() - set(player_tiles.values()):
+            del self._fields[tile]
+
+    def direction(self, player: Player, x: float, y: float) -> Direction | None:
+        """Next step from x,y toward the player. None if x,y is on the
+        player's tile or out of the field's reach."""
+        target = self._player_tiles.get(player.uuid)
+        if target is None:
+            return None
+        return self._fields[target].direction(tile_at(x, y))
@@ -0,0 +1,87 @@
+"""AI level of detail. Enemies far from every player think less often, the
+interval for each enemy's tier is staggered by handle so work is spread
+evenly across ticks."""
+
+from dataclasses import dataclass
+from enum import IntEnum
+
+from nk_shared.models import Character
+from nk_shared.models.zone import AiLod
+
+
+class LodTier(IntEnum):
+    NEAR = 0
+    MID = 1
+    FAR = 2
+
+
+@dataclass
+class LodStats:
+    """Enemies per tier, how many were updated or skipped, and how many
+    were deferred to the next tick by the AI time budget, for the most
+    recent tick"""
+
+    near: int = 0
+    mid: int = 0
+    far: int = 0
+    updated: int = 0
+    skipped: int = 0
+    deferred: int = 0
+
+
+class LodScheduler:
+    def __init__(self, config: AiLod):
+        self.config = config
+        self.stats = LodStats()
+        self._tick = 0
+        self._tiers: dict[str, LodTier] = {}
+
+    def begin_tick(self):
+        self._tick += 1
+        self.stats = LodStats()
+
+    def tier(self, character: Character) -> LodTier:
+        """Current tier, new enemies start near so they are evaluated at once"""
+        return self._tiers.get(character.uuid, LodTier.NEAR)
+
+    def interval(self, tier: LodTier) -> int:
+        if tier == LodTier.NEAR:
+            return 1
+        if tier == LodTier.MID:
+            return self.config.mid_interval_ticks
+        return self.config.far_interval_ticks
+
+    def due(self, character: Character) -> bool:
+        """Whether the character should be updated this tick, counting it
+        in the tick's stats either way"""
+        tier = self.tier(character)
+        due = (self._tick + character.handle) % self.interval(tier) == 0
+        self._record(tier, due)
+        return due
+
+    def assign(self, character: Character, player_distance: float | None) -> LodTier:
+        """Re-tier character by distance to its closest player, None when no
+        player is within mid_distance"""
+        if player_distance is None or player_distance > self.config.mid_distance:
+            tier = LodTier.FAR
+        elif player_distance > self.config.near_distance:
+            tier = LodTier.MID
+        else:
+            tier = LodTier.NEAR
+        self._tiers[character.uuid] = tier
+        return tier
+
+    def forget(self, character: Character):
+        self._tiers.pop(character.uuid, None)
+
+    def _record(self, tier: LodTier, due: bool):
+        if tier == LodTier.NEAR:
+            self.stats.near += 1
+        elif tier == LodTier.MID:
+            self.stats.mid += 1
+        else:
+            self.stats.far += 1
+        if due:
+            self.stats.updated += 1
+        else:
+            self.stats.skipped += 1
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from nk_shared.models.zone import Environment, Spawner
 
@@ -8,6 +8,7 @@ class SpawnerStruct:
     spawner: Spawner
     next_spawn_time_s: float
     parent_feature: Environment
+    population: set[str] = field(default_factory=set)  # living spawned uuids
 
     @property
     def spawn_x(self) -> int:
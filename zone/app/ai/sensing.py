@@ -0,0 +1,71 @@
+"""Batched enemy sensing. Gathers enemy and player positions into arrays once
+per tick and computes every enemy's nearest player, distance, 8-way
+direction and chase/attack eligibility in bulk."""
+
+from collections.abc import Sequence
+from math import pi
+from typing import NamedTuple
+
+import numpy as np
+from nk_shared.proto import Direction
+
+from app.models import Enemy, Player
+
+# octants of atan2 in screen space (y grows south), starting east
+OCTANT_DIRECTIONS = (
+    Direction.DIRECTION_E,
+    Direction.DIRECTION_SE,
+    Direction.DIRECTION_S,
+    Direction.DIRECTION_SW,
+    Direction.DIRECTION_W,
+    Direction.DIRECTION_NW,
+    Direction.DIRECTION_N,
+    Direction.DIRECTION_NE,
+)
+
+
+class Sensed(NamedTuple):
+    """What one enemy perceives of its nearest player"""
+
+    player: Player | None
+    distance: float
+    direction: Direction | None  # straight line toward player
+    angle: float
+    chase: bool
+    attack: bool
+
+
+def sense(enemies: Sequence[Enemy], players: Sequence[Player]) -> list[Sensed]:
+    """Sense the nearest player for each enemy, in enemy order"""
+    if not enemies:
+        return []
+    if not players:
+        return [Sensed(None, np.inf, None, 0, False, False)] * len(enemies)
+    enemy_xy = np.array([tuple(enemy.body.position) for enemy in enemies])
+    player_xy = np.array([tuple(player.body.position) for player in players])
+    deltas = player_xy[np.newaxis, :, :] - enemy_xy[:, np.newaxis, :]
+    distances_sq = np.einsum("epk,epk->ep", deltas, deltas)
+    nearest = distances_sq.argmin(axis=1)
+    rows = np.arange(len(enemies))
+    offsets = deltas[rows, nearest]
+    distances = np.sqrt(distances_sq[rows, nearest])
+    angles = np.arctan2(offsets[:, 1], offsets[:, 0])
+    octants = np.floor((angles + pi / 8) / (pi / 4)).astype(int) % 8
+
+    chase_distances = np.array([enemy.chase_distance for enemy in enemies])
+    attack_distances = np.array([enemy.weapon.attack_distance for enemy in enemies])
+    attacking = np.array([enemy.attacking for enemy in enemies], dtype=bool)
+    chase = distances < chase_distances
+    attack = (distances < attack_distances) & ~attacking
+
+    return [
+        Sensed(players[index], distance, OCTANT_DIRECTIONS[octant], angle, *flags)
+        for index, distance, octant, angle, *flags in zip(
+            nearest.tolist(),
+            distances.tolist(),
+            octants.tolist(),
+            angles.tolist(),
+            chase.tolist(),
+            attack.tolist(),
+        )
+    ]
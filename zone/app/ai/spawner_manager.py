@@ -1,9 +1,8 @@
 import heapq
 from abc import ABC, abstractmethod
 
-from nk_shared import builders
-from nk_shared.models.zone import Environment
-from nk_shared.proto import CharacterType, Message
+from nk_shared.models.zone import Environment, Spawning
+from nk_shared.proto import CharacterType
 
 from app.ai.models import SpawnerStruct
 from app.models import Enemy
@@ -17,17 +16,28 @@ class SpawnerProvider(ABC):
         raise NotImplementedError()
 
     @abstractmethod
-    async def publish(self, message: Message, **kwargs) -> None:
+    def player_near(self, x: float, y: float, distance: float) -> bool:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def population(self) -> int:
+        """Enemies in the zone, active or dormant"""
         raise NotImplementedError()
 
 
 class SpawnerManager:
     def __init__(
-        self, provider: SpawnerProvider, environment_features: list[Environment]
+        self,
+        provider: SpawnerProvider,
+        environment_features: list[Environment],
+        config: Spawning | None = None,
     ):
         self.provider = provider
+        self.config = config or Spawning()
         self.spawners: list[SpawnerStruct] = []
         self.current_time = 0
+        self._spawned_by: dict[str, SpawnerStruct] = {}
         for environment_feature in environment_features:
             for spawner in environment_feature.spawners:
                 next_spawn = spawner.spawn_frequency_s
@@ -41,14 +51,44 @@ class SpawnerManager:
         heapq.heapify(self.spawners)
 
     async def update(self, dt: float):
-        """Update the spawners to spawn enemies based on their next spawn time."""
+        """Update the spawners to spawn enemies based on their next spawn time.
+        At most max_spawns_per_tick spawn per tick, spawners left due stay
+        at the front of the queue for the next tick. Spawners at their
+        population cap or with no player in range skip their turn.
+        Players are told about new enemies when they enter their view."""
         self.current_time += dt
-        while self.spawners and self.spawners[0].next_spawn_time_s <= self.current_time:
+        budget = self.config.max_spawns_per_tick
+        while (
+            budget > 0
+            and self.spawners
+            and self.spawners[0].next_spawn_time_s <= self.current_time
+            and self.provider.population < self.config.max_enemies
+        ):
             spawn_str = heapq.heappop(self.spawners)
-            enemy = self.provider.spawn_enemy(
-                spawn_str.spawner.character_type, spawn_str.spawn_x, spawn_str.spawn_y
-            )
+            if self.active(spawn_str):
+                enemy = self.provider.spawn_enemy(
+                    spawn_str.spawner.character_type,
+                    spawn_str.spawn_x,
+                    spawn_str.spawn_y,
+                )
+                spawn_str.population.add(enemy.uuid)
+                self._spawned_by[enemy.uuid] = spawn_str
+                budget -= 1
             next_spawn = self.current_time + spawn_str.spawner.spawn_frequency_s
             spawn_str.next_spawn_time_s = next_spawn
             heapq.heappush(self.spawners, spawn_str)
-            await self.provider.publish(builders.build_character_updated(enemy))
+
+    def active(self, spawn_str: SpawnerStruct) -> bool:
+        """Whether the spawner is below its cap with a player in range"""
+        spawner = spawn_str.spawner
+        if len(spawn_str.population) >= spawner.max_population:
+            return False
+        return self.provider.player_near(
+            spawn_str.spawn_x, spawn_str.spawn_y, spawner.activation_distance
+        )
+
+    def character_removed(self, enemy: Enemy):
+        """Free the dead enemy's slot in its spawner's population"""
+        spawn_str = self._spawned_by.pop(enemy.uuid, None)
+        if spawn_str:
+            spawn_str.population.discard(enemy.uuid)
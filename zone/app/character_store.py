@@ -0,0 +1,98 @@
+"""Player character persistence off the tick. Loads and saves run as
+background tasks so the world never waits on the database mid-tick, and
+finished loads queue here until the world collects them at the start of
+the next tick. Operations for one player run in the order issued, so a
+reconnect always loads the position its disconnect saved."""
+
+import asyncio
+from dataclasses import dataclass
+from functools import partial
+from typing import Coroutine
+
+from beanie import PydanticObjectId
+from loguru import logger
+
+from app.db import Character as DBCharacter
+
+
+@dataclass
+class LoadedCharacter:
+    """A connecting player's saved position, None if it has never saved"""
+
+    player_uuid: str
+    position: tuple[float, float] | None
+
+
+async def load_position(player_uuid: str) -> tuple[float, float] | None:
+    character = await DBCharacter.find_one(
+        DBCharacter.user_id == PydanticObjectId(player_uuid)
+    )
+    if character is None or character.x is None or character.y is None:
+        return None
+    return character.x, character.y
+
+
+async def save_position(player_uuid: str, x: float, y: float):
+    user_id = PydanticObjectId(player_uuid)
+    character = await DBCharacter.find_one(DBCharacter.user_id == user_id)
+    if character:
+        await character.set({DBCharacter.x: x, DBCharacter.y: y})
+    else:
+        await DBCharacter(user_id=user_id, x=x, y=y).insert()
+
+
+class CharacterStore:
+    def __init__(self):
+        self._loading: set[str] = set()
+        self._loaded: list[LoadedCharacter] = []
+        self._tasks: dict[str, asyncio.Task] = {}  # newest operation per player
+
+    def load(self, player_uuid: str):
+        """Start loading a connecting player, see drain"""
+        self._loading.add(player_uuid)
+        self._chain(player_uuid, self._load(player_uuid))
+
+    def cancel_load(self, player_uuid: str):
+        """Drop a pending load, the player left before it finished"""
+        self._loading.discard(player_uuid)
+        self._loaded = [c for c in self._loaded if c.player_uuid != player_uuid]
+
+    def save(self, player_uuid: str, x: float, y: float):
+        self._chain(player_uuid, save_position(player_uuid, x, y))
+
+    def drain(self) -> list[LoadedCharacter]:
+        """Players whose load finished since the last drain"""
+        loaded, self._loaded = self._loaded, []
+        return loaded
+
+    async def wait(self):
+        """Wait for every pending operation, for shutdown and tests"""
+        if self._tasks:
+            await asyncio.wait(list(self._tasks.values()))
+
+    async def _load(self, player_uuid: str):
+        position = await load_position(player_uuid)
+        if player_uuid in self._loading:
+            self._loading.discard(player_uuid)
+            self._loaded.append(LoadedCharacter(player_uuid, position))
+
+    def _chain(self, player_uuid: str, operation: Coroutine):
+        previous = self._tasks.get(player_uuid)
+        task = asyncio.create_task(run_after(previous, operation))
+        self._tasks[player_uuid] = task
+        task.add_done_callback(partial(self._done, player_uuid))
+
+    def _done(self, player_uuid: str, task: asyncio.Task):
+        if self._tasks.get(player_uuid) is task:
+            del self._tasks[player_uuid]
+        if not task.cancelled() and task.exception() is not None:
+            self._loading.discard(player_uuid)
+            logger.error(
+                "Character store failed for {}: {!r}", player_uuid, task.exception()
+            )
+
+
+async def run_after(previous: asyncio.Task | None, operation: Coroutine):
+    if previous is not None:
+        await asyncio.wait([previous])  # its failure is logged, not ours
+    await operation
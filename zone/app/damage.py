@@ -0,0 +1,27 @@
+"""Per tick hit accounting. Damage is applied as hits land, so the
+simulation sees it at once, but each target is reported only once at the
+end of the tick with the summed damage and resulting hp. A burst of hits
+costs one message per target, and a target killed this tick is reported
+with hp 0, which doubles as its death event."""
+
+from nk_shared.models import Character
+
+
+class DamageLedger:
+    def __init__(self):
+        self._hits: dict[str, tuple[Character, float]] = {}
+
+    def apply(self, target: Character, damage: float):
+        target.handle_damage_received(damage)
+        _target, total = self._hits.get(target.uuid, (target, 0))
+        self._hits[target.uuid] = (target, total + damage)
+
+    def drain(self) -> list[tuple[Character, float]]:
+        """Targets hit since the last drain with their total damage, in the
+        order they were first hit"""
+        hits = list(self._hits.values())
+        self._hits.clear()
+        return hits
+
+    def __len__(self) -> int:
+        return len(self._hits)
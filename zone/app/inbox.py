@@ -0,0 +1,110 @@
+"""Tick synchronous input. A reader task blocks on the zone channel and
+queues parsed messages here, the world drains them in arrival order at the
+start of each tick so client input never mutates characters mid-tick. At
+most max_batch messages are drained per tick, the rest wait in order for
+the next one.
+
+Movement state is last writer wins, so before draining, queued updates
+superseded by a newer one for the same character are dropped. Everything
+else, like attacks and reloads, passes through in order."""
+
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import betterproto
+from loguru import logger
+from nk_shared.proto import Message
+
+from app.settings import INPUT_BATCH_MAX
+
+POSITION = "position"
+DIRECTION = "direction"
+# movement state each coalescable message sets
+COALESCED = {
+    "character_updated": frozenset((POSITION, DIRECTION)),
+    "character_updated_quantized": frozenset((POSITION, DIRECTION)),
+    "character_position_updated": frozenset((POSITION,)),
+    "character_position_updated_quantized": frozenset((POSITION,)),
+    "character_direction_updated": frozenset((DIRECTION,)),
+}
+
+
+def coalesce(messages: Iterable[Message]) -> list[Message]:
+    """Drop movement updates whose state is entirely overwritten by newer
+    updates for the same character from the same sender, keeping everything
+    else in order. Keying on the sender too means an update from someone
+    not owning the character, which handlers ignore, never hides a real one.
+    Other messages for the character, like attacks, are barriers: updates
+    before one are never dropped for updates after it, so the event still
+    happens where the character was when it was sent."""
+    kept = []
+    covered: dict[tuple[str, int | str], set[str]] = {}
+    for message in reversed(list(messages)):
+        name, details = betterproto.which_one_of(message, "payload")
+        character = (
+            message.origin_uuid,
+            getattr(details, "handle", 0) or getattr(details, "uuid", ""),
+        )
+        state = COALESCED.get(name)
+        if state is None:
+            covered.pop(character, None)
+        else:
+            seen = covered.setdefault(character, set())
+            if state <= seen:
+                continue
+            seen.update(state)
+        kept.append(message)
+    kept.reverse()
+    return kept
+
+
+@dataclass
+class InboxStats:
+    """Messages received, coalesced away and drained during the most recent
+    tick, and the queue depth left after draining, plus running totals"""
+
+    received: int = 0
+    coalesced: int = 0
+    drained: int = 0
+    depth: int = 0
+    total_received: int = 0
+    total_coalesced: int = 0
+    total_drained: int = 0
+
+
+class Inbox:
+    def __init__(self, max_batch: int = INPUT_BATCH_MAX):
+        self.max_batch = max_batch
+        self.stats = InboxStats()
+        self._queue: deque[Message] = deque()
+        self._received = 0
+
+    def put(self, message: Message):
+        self._queue.append(message)
+        self._received += 1
+
+    def drain(self) -> list[Message]:
+        """Coalesce the queue, then pop the next batch of messages, oldest
+        first"""
+        queued = len(self._queue)
+        self._queue = deque(coalesce(self._queue))
+        count = min(len(self._queue), self.max_batch)
+        batch = [self._queue.popleft() for _ in range(count)]
+        self.record(queued - count - len(self._queue), count)
+        return batch
+
+    def record(self, coalesced: int, drained: int):
+        self.stats.received = self._received
+        self.stats.coalesced = coalesced
+        self.stats.drained = drained
+        self.stats.depth = len(self._queue)
+        self.stats.total_received += self._received
+        self.stats.total_coalesced += coalesced
+        self.stats.total_drained += drained
+        self._received = 0
+        if self.stats.depth:
+            logger.debug("Input backlog of {} messages", self.stats.depth)
+
+    def __len__(self) -> int:
+        return len(self._queue)
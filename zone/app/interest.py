@@ -0,0 +1,71 @@
+"""Area of interest management. Tracks which characters each player can
+see, so character and projectile updates are only sent to players who
+have them in view."""
+
+from collections.abc import Collection
+from dataclasses import dataclass, field
+
+from nk_shared.models import Character
+
+from app.models import Player
+from app.settings import VIEW_RADIUS
+from app.spatial import SpatialHash
+
+
+@dataclass
+class InterestChange:
+    player_uuid: str
+    entered: set[str] = field(default_factory=set)
+    left: set[str] = field(default_factory=set)
+
+
+class InterestManager:
+    def __init__(self, view_radius: float = VIEW_RADIUS):
+        self.view_radius = view_radius
+        self._visible: dict[str, set[str]] = {}
+        self._observers: dict[str, set[str]] = {}
+
+    def update(
+        self, players: Collection[Player], index: SpatialHash[Character]
+    ) -> list[InterestChange]:
+        """Recompute each player's relevance set from the character index,
+        returning which characters entered and left each player's view."""
+        changes = []
+        for player in players:
+            x, y = player.body.position
+            visible = {
+                character.uuid
+                for character in index.query_radius(x, y, self.view_radius)
+                if character is not player
+            }
+            previous = self._visible.get(player.uuid, set())
+            change = InterestChange(player.uuid, visible - previous, previous - visible)
+            for uuid in change.entered:
+                self._observers.setdefault(uuid, set()).add(player.uuid)
+            for uuid in change.left:
+                self._discard_observer(uuid, player.uuid)
+            self._visible[player.uuid] = visible
+            if change.entered or change.left:
+                changes.append(change)
+        self._forget_departed_players({player.uuid for player in players})
+        return changes
+
+    def visible(self, player_uuid: str) -> Collection[str]:
+        """Uuids of characters currently in the player's view"""
+        return self._visible.get(player_uuid, ())
+
+    def observers(self, character_uuid: str) -> Collection[str]:
+        """Uuids of players who currently have the character in view"""
+        return self._observers.get(character_uuid, ())
+
+    def _forget_departed_players(self, player_uuids: set[str]):
+        for player_uuid in set(self._visible) - player_uuids:
+            for uuid in self._visible.pop(player_uuid):
+                self._discard_observer(uuid, player_uuid)
+
+    def _discard_observer(self, character_uuid: str, player_uuid: str):
+        observers = self._observers.get(character_uuid)
+        if observers is not None:
+            observers.discard(player_uuid)
+            if not observers:
+                del self._observers[character_uuid]
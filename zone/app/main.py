@@ -3,36 +3,38 @@ import asyncio
 import sentry_sdk
 from beanie import init_beanie
 from loguru import logger
+from nk_shared import codec
 from nk_shared.profiling import begin_profiling, end_profiling
-from nk_shared.proto import Message
-from pygame.time import Clock
 
 from app.db import Character, db
 from app.pubsub import subscribe
-from app.settings import SENTRY_DSN
+from app.scheduler import TickScheduler
+from app.settings import ENABLE_UVLOOP, SENTRY_DSN
 from app.world import World
 
 
 async def updater(world: World):
-    clock = Clock()
-    while True:
-        dt = clock.tick(60) / 1000.0
-        await world.update(dt)
-        try:
-            await asyncio.sleep(max(0.01, 0.016 - dt))
-        except asyncio.CancelledError:
-            logger.warning("World update loop sleep cancelled, killing")
-            break
+    await TickScheduler(world.update).run()
 
 
 async def consumer(world: World):
+    """Block on the zone channel, queueing messages for the next tick"""
     channel = await subscribe()
     logger.info("Subscribed to channel successfully")
-    while True:
-        message = await channel.get_message(ignore_subscribe_messages=True)
-        if message is not None:
-            proto = Message().parse(message["data"])
-            await world.handle_message(proto)
+    async for message in channel.listen():
+        if message["type"] == "message":
+            queue_message(world, message["data"])
+
+
+def queue_message(world: World, data: bytes):
+    """Decode a message into the inbox, dropping any that fail to decode so
+    one malformed message cannot take down the consumer"""
+    try:
+        message = codec.decode(data)
+    except (IndexError, ValueError) as error:
+        logger.warning("Dropping undecodable message: {!r}", error)
+        return
+    world.inbox.put(message)
 
 
 async def handler(world: World):
@@ -73,13 +75,27 @@ async def main():
         ],
     )
     begin_profiling()
+    world = World()
     try:
-        await handler(World())
+        await handler(world)
     except Exception as e:
         raise e
     finally:
+        await world.character_store.wait()  # let disconnect saves land
         end_profiling()
 
 
-if __name__ == "__main__":
+def run():
+    if ENABLE_UVLOOP:
+        try:
+            import uvloop  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            logger.warning("uvloop not installed, falling back to asyncio")
+        else:
+            uvloop.run(main())
+            return
     asyncio.run(main())
+
+
+if __name__ == "__main__":
+    run()
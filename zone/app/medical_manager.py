@@ -1,13 +1,18 @@
+from collections.abc import Collection
+from math import sqrt
 from typing import Protocol
 
+import pymunk
 from nk_shared import builders
 from nk_shared.models.character import Character
 from nk_shared.models.zone import Medic
 from nk_shared.proto import Message
 
 from app.models import Player
+from app.spatial import SpatialHash
 
 HEAL_DST_SQ = 5
+HEAL_DST = sqrt(HEAL_DST_SQ)
 HEAL_AMT = 10.0
 RESPAWN_TIME = 5.0
 
@@ -18,13 +23,19 @@ class ProviderProtocol(Protocol):
     async def publish(self, message: Message, **kwargs) -> None: ...
 
     @property
-    def players(self) -> list[Player]: ...
+    def players(self) -> Collection[Player]: ...
+
+    @property
+    def space(self) -> pymunk.Space: ...
 
 
 class MedicalManager:
     def __init__(self, protocol: ProviderProtocol, medics: list[Medic]):
         self.protocol = protocol
         self.medics = medics
+        self.medic_index: SpatialHash[Medic] = SpatialHash()
+        for medic in medics:
+            self.medic_index.update(medic, medic.x, medic.y)
         self._player_respawns: dict[str, float] = {}
 
     async def update(self, dt: float):
@@ -46,15 +57,13 @@ class MedicalManager:
                 self._player_respawns[player_uuid] = respawn_time
 
     async def respawn_player(self, player: Player):
-        player.hp = player.hp_max
-        closest_dst_sq = float("inf")
-        spawn_point = None
-        for medic in self.medics:
-            dst_sq = player.position.get_dist_sqrd((medic.x, medic.y))
-            if dst_sq < closest_dst_sq:
-                closest_dst_sq = dst_sq
-                spawn_point = (medic.x, medic.y)
-        player.position = spawn_point
+        player.handle_healing_received(player.hp_max)
+        closest = self.medic_index.nearest(player.position.x, player.position.y)
+        if closest:
+            player.position = (closest[0].x, closest[0].y)
+        if player.body.space is None:
+            self.protocol.space.add(player.body, player.shape)
+        player.body_removal_processed = False
         await self.protocol.publish(builders.build_player_respawned(player))
 
     def schedule_respawn(self, player: Player):
@@ -62,8 +71,7 @@ class MedicalManager:
 
     def update_medic(self, dt: float, player: Player):
         """Check if player is in range of a medic and heal if so"""
-        for medic in self.medics:
-            dst_sq = player.position.get_dist_sqrd((medic.x, medic.y))
-            if dst_sq < HEAL_DST_SQ:
-                player.handle_healing_received(HEAL_AMT * dt)
-                return
+        if self.medic_index.query_radius(
+            player.position.x, player.position.y, HEAL_DST
+        ):
+            player.handle_healing_received(HEAL_AMT * dt)
@@ -1,5 +1,9 @@
-from betterproto import serialized_on_wire
+from functools import partial
+
 from loguru import logger
+from nk_shared import builders
+from nk_shared.dispatch import Dispatcher
+from nk_shared.models import Character
 from nk_shared.proto import (
     CharacterAttacked,
     CharacterDirectionUpdated,
@@ -7,12 +11,19 @@ from nk_shared.proto import (
     CharacterReloaded,
     CharacterUpdated,
     Direction,
-    Message,
 )
 
 from app.messages.models import BaseMessageHandler
 from app.models import WorldInterface
 
+CharacterDetails = (
+    CharacterAttacked
+    | CharacterDirectionUpdated
+    | CharacterPositionUpdated
+    | CharacterReloaded
+    | CharacterUpdated
+)
+
 
 class UnknownCharacterError(Exception):
     pass
@@ -22,83 +33,97 @@ class CharacterMessageHandler(BaseMessageHandler):
     def __init__(self, world: WorldInterface):
         self.world = world
 
-    async def handle_message(self, msg: Message) -> bool:
-        if serialized_on_wire(msg.character_attacked):
-            handle_character_attacked(self.world, msg.character_attacked)
-        elif serialized_on_wire(msg.character_updated):
-            await handle_character_updated(self.world, msg.character_updated)
-        elif serialized_on_wire(msg.character_position_updated):
-            await handle_character_position_updated(
-                self.world, msg.character_position_updated
-            )
-        elif serialized_on_wire(msg.character_reloaded):
-            await handle_character_reloaded(self.world, msg.character_reloaded)
-        elif serialized_on_wire(msg.character_direction_updated):
-            await handle_character_direction_updated(
-                self.world, msg.character_direction_updated
-            )
-        else:
-            return False
-        return True
-
-
-def handle_character_attacked(world: WorldInterface, details: CharacterAttacked):
+    def register(self, dispatcher: Dispatcher):
+        for payload, handler in (
+            ("character_attacked", handle_character_attacked),
+            ("character_updated", handle_character_updated),
+            ("character_position_updated", handle_character_position_updated),
+            ("character_reloaded", handle_character_reloaded),
+            ("character_direction_updated", handle_character_direction_updated),
+        ):
+            dispatcher.register(payload, partial(handler, self.world), with_origin=True)
+
+
+def get_character(
+    world: WorldInterface, details: CharacterDetails, origin_uuid: str
+) -> Character | None:
+    """Clients address their own character by handle once joined, older
+    messages (and CharacterUpdated) by uuid. The api stamps each message
+    with its sender, so characters belonging to anyone else are ignored."""
+    if details.handle:
+        character = world.get_character_by_handle(details.handle)
+    else:
+        character = world.get_character_by_uuid(details.uuid)
+    if character is None or character.uuid != origin_uuid:
+        return None
+    return character
+
+
+def handle_character_attacked(
+    world: WorldInterface, details: CharacterAttacked, origin_uuid: str
+):
     """Call character attack, does nothing if character does not exist"""
-    character = world.get_character_by_uuid(details.uuid)
+    character = get_character(world, details, origin_uuid)
     if not character:
-        logger.warning("No character maching uuid: {}", details.uuid)
+        logger.warning("No character maching {}", details)
         return
     character.attack(details.direction)
 
 
 async def handle_character_position_updated(
-    world: WorldInterface, details: CharacterPositionUpdated
+    world: WorldInterface, details: CharacterPositionUpdated, origin_uuid: str
 ):
     """Apply message details to relevant character. If character
     does not exist, do not do anything."""
-    character = world.get_character_by_uuid(details.uuid)
+    character = get_character(world, details, origin_uuid)
     if not character:
-        logger.warning("No character maching uuid: {}", details.uuid)
+        logger.warning("No character maching {}", details)
         return
     character.position = (details.x, details.y)
     character.velocity = (details.dx, details.dy)
-    await world.publish(Message(origin_uuid=character.uuid, character_updated=details))
+    msg = builders.build_character_position_updated_quantized(character)
+    await world.publish_to_observers(character, msg)
 
 
-async def handle_character_reloaded(world: WorldInterface, details: CharacterReloaded):
+async def handle_character_reloaded(
+    world: WorldInterface, details: CharacterReloaded, origin_uuid: str
+):
     """Apply message details to relevant character. If character
     does not exist, do not do anything."""
-    character = world.get_character_by_uuid(details.uuid)
+    character = get_character(world, details, origin_uuid)
     if not character:
-        logger.warning("No character maching uuid: {}", details.uuid)
+        logger.warning("No character maching {}", details)
         return
     character.reload()
-    await world.publish(Message(origin_uuid=character.uuid, character_reloaded=details))
+    msg = builders.build_character_reloaded(character)
+    await world.publish_to_observers(character, msg)
 
 
 async def handle_character_direction_updated(
-    world: WorldInterface, details: CharacterDirectionUpdated
+    world: WorldInterface, details: CharacterDirectionUpdated, origin_uuid: str
 ):
-    character = world.get_character_by_uuid(details.uuid)
+    character = get_character(world, details, origin_uuid)
     if not character:
-        logger.warning("No character maching uuid: {}", details.uuid)
+        logger.warning("No character maching {}", details)
         return
     character.moving_direction = Direction(details.moving_direction)
     character.facing_direction = Direction(details.facing_direction)
-    await world.publish(
-        Message(origin_uuid=character.uuid, character_direction_updated=details)
-    )
+    msg = builders.build_character_direction_updated(character)
+    await world.publish_to_observers(character, msg)
 
 
-async def handle_character_updated(world: WorldInterface, details: CharacterUpdated):
+async def handle_character_updated(
+    world: WorldInterface, details: CharacterUpdated, origin_uuid: str
+):
     """Apply message details to relevant character. If character
     does not exist, do not do anything."""
-    character = world.get_character_by_uuid(details.uuid)
+    character = get_character(world, details, origin_uuid)
     if not character:
-        logger.warning("No character maching uuid: {}", details.uuid)
+        logger.warning("No character maching {}", details)
         return
     character.position = (details.x, details.y)
     character.velocity = (details.dx, details.dy)
     character.moving_direction = Direction(details.moving_direction)
     character.facing_direction = Direction(details.facing_direction)
-    await world.publish(Message(origin_uuid=character.uuid, character_updated=details))
+    msg = builders.build_character_updated_quantized(character)
+    await world.publish_to_observers(character, msg)
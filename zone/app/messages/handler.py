@@ -1,22 +1,28 @@
+from nk_shared import builders
+from nk_shared.dispatch import Dispatcher
 from nk_shared.proto import Message
 
 from app.ai.ai import Ai
 from app.messages.character_handlers import CharacterMessageHandler
 from app.messages.models import BaseMessageHandler
 from app.messages.player_handlers import PlayerMessageHandler
+from app.messages.snapshot_handlers import SnapshotMessageHandler
 from app.messages.util_handlers import UtilMessageHandler
 from app.models import WorldInterface
 
 
 class MessageHandler:
     def __init__(self, world: WorldInterface, ai: Ai):
+        self.dispatcher = Dispatcher()
         self.handlers: list[BaseMessageHandler] = [
             CharacterMessageHandler(world),
             PlayerMessageHandler(world),
+            SnapshotMessageHandler(world),
             UtilMessageHandler(world, ai),
         ]
+        for handler in self.handlers:
+            handler.register(self.dispatcher)
 
     async def handle_message(self, msg: Message):
-        for handler in self.handlers:
-            if await handler.handle_message(msg):
-                return
+        msg = builders.dequantize_message(msg)
+        await self.dispatcher.dispatch_async(msg)
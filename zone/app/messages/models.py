@@ -1,8 +1,10 @@
-from abc import ABC
+from abc import ABC, abstractmethod
 
-from betterproto import Message
+from nk_shared.dispatch import Dispatcher
 
 
 class BaseMessageHandler(ABC):
-    async def handle_message(self, msg: Message) -> bool:
+    @abstractmethod
+    def register(self, dispatcher: Dispatcher):
+        """Register a handler for each message payload handled"""
         raise NotImplementedError
@@ -1,7 +1,7 @@
-from beanie import PydanticObjectId
-from betterproto import serialized_on_wire
+from functools import partial
+
 from loguru import logger
-from nk_shared import builders
+from nk_shared.dispatch import Dispatcher
 from nk_shared.proto import (
     Message,
     PlayerConnected,
@@ -11,80 +11,58 @@ from nk_shared.proto import (
     PlayerLeft,
 )
 
-from app.db import Character as DBCharacter
+from app.character_store import LoadedCharacter
 from app.messages.models import BaseMessageHandler
 from app.models import Player, WorldInterface
+from app.pubsub import player_channel
 
 
 class PlayerMessageHandler(BaseMessageHandler):
     def __init__(self, world: WorldInterface):
         self.world = world
 
-    async def handle_message(self, msg: Message) -> bool:
-        if serialized_on_wire(msg.player_connected):
-            await handle_player_connected(self.world, msg.player_connected)
-        elif serialized_on_wire(msg.player_disconnected):
-            await handle_player_disconnected(self.world, msg.player_disconnected)
-        else:
-            return False
-        return True
+    def register(self, dispatcher: Dispatcher):
+        dispatcher.register(
+            "player_connected", partial(handle_player_connected, self.world)
+        )
+        dispatcher.register(
+            "player_disconnected", partial(handle_player_disconnected, self.world)
+        )
 
 
 async def handle_player_disconnected(
     world: WorldInterface, details: PlayerDisconnected
 ):
-    player = world.get_character_by_uuid(details.uuid)
     await world.publish(Message(player_left=PlayerLeft(uuid=details.uuid)))
+    world.character_store.cancel_load(details.uuid)
+    player = world.get_character_by_uuid(details.uuid)
     if player is None:
         return
     x, y = player.position.x, player.position.y  # pylint: disable=no-member
-    user_id = PydanticObjectId(details.uuid)
-    character = await DBCharacter.find_one(DBCharacter.user_id == user_id)
-    if character:
-        await character.set({DBCharacter.x: x, DBCharacter.y: y})
-    else:
-        await DBCharacter(user_id=user_id, x=x, y=y).insert()
-    world.players.remove(player)
+    world.character_store.save(details.uuid, x, y)
+    world.remove_character(player)
 
 
 async def handle_player_connected(world: WorldInterface, details: PlayerConnected):
-    """A player has joined. Handle initialization."""
+    """A player has joined. Their character is loaded in the background and
+    spawned by spawn_player once it arrives."""
     logger.info("Player joined: {}", details.uuid)
-    player = await spawn_player(world, details.uuid)
+    world.character_store.load(details.uuid)
+
+
+async def spawn_player(world: WorldInterface, loaded: LoadedCharacter) -> Player:
+    """Player 'is' a Character, which i don't love, but its already
+    created. Update relevant attrs."""
+    start_x, start_y = loaded.position or world.map.get_start_tile()
+    player = Player(user_id=loaded.player_uuid, start_x=start_x, start_y=start_y)
+    world.add_character(player)
     # pylint: disable-next=no-member
     x, y = player.position.x, player.position.y
-    response = PlayerJoinResponse(uuid=player.uuid, x=x, y=y)
+    response = PlayerJoinResponse(uuid=player.uuid, x=x, y=y, handle=player.handle)
+    # nearby characters are sent as they enter the player's view next tick
     await world.publish(
         Message(player_join_response=response, destination_uuid=player.uuid),
-        channel=f"player-{player.uuid}",
-    )
-    await send_player_full_character_updates(world, player.uuid)
-    await world.publish(
-        Message(player_join_response=response, destination_uuid=player.uuid),
-        channel=f"player-{player.uuid}",
+        channel=player_channel(player.uuid),
     )
     await world.publish(Message(player_joined=PlayerJoined(uuid=player.uuid)))
-
-
-async def spawn_player(world: WorldInterface, player_uuid: str) -> Player:
-    """Player 'is' a Character, which i don't love, but its already
-    created. Update relevant attrs."""
-    character = await DBCharacter.find_one(
-        DBCharacter.user_id == PydanticObjectId(player_uuid)
-    )
-    if character:
-        x, y = character.x, character.y
-    else:
-        x, y = world.map.get_start_tile()
-    player = Player(user_id=player_uuid, start_x=x, start_y=y)
-    world.space.add(player.body, player.shape, player.hitbox_shape)
-    world.players.append(player)
     return player
-
-
-async def send_player_full_character_updates(world: WorldInterface, player_uuid: str):
-    for character in world.enemies + world.players:
-        if character.uuid == player_uuid:
-            continue
-        proto = builders.build_character_updated(character)
-        await world.publish(proto, channel=f"player-{player_uuid}")
@@ -0,0 +1,26 @@
+from nk_shared.dispatch import Dispatcher
+from nk_shared.proto import SnapshotAcknowledged
+
+from app.messages.models import BaseMessageHandler
+from app.models import WorldInterface
+
+
+class SnapshotMessageHandler(BaseMessageHandler):
+    def __init__(self, world: WorldInterface):
+        self.world = world
+
+    def register(self, dispatcher: Dispatcher):
+        dispatcher.register(
+            "snapshot_acknowledged",
+            self.handle_snapshot_acknowledged,
+            with_origin=True,
+        )
+
+    def handle_snapshot_acknowledged(
+        self, details: SnapshotAcknowledged, origin_uuid: str
+    ):
+        """Players only acknowledge their own snapshots, the api stamps each
+        message with its sender"""
+        if details.uuid != origin_uuid:
+            return
+        self.world.acknowledge_snapshot(origin_uuid, details.sequence)
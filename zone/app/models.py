@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
 from asyncio import Queue
+from collections.abc import Collection, Set
 from dataclasses import dataclass, field
 
 import pymunk
 from nk_shared.map.tilemap import Tilemap
-from nk_shared.models import Character
+from nk_shared.models import Character, CollisionCategory
 from nk_shared.proto import Message
 
+from app.character_store import CharacterStore
+from app.spatial import SpatialHash
+
 
 @dataclass
 class Player(Character):
@@ -14,18 +18,28 @@ class Player(Character):
 
     messages: Queue[Message] = field(default_factory=Queue)
     user_id: str = None
+    collision_category: CollisionCategory = CollisionCategory.PLAYER
 
     def __post_init__(self):
         super().__post_init__()
         self.uuid = self.user_id
 
 
+@dataclass(slots=True)
+class Blackboard:
+    """Per enemy behavior tree memory, keyed by node id"""
+
+    running: dict[int, int] = field(default_factory=dict)  # running child index
+    timers: dict[int, float] = field(default_factory=dict)
+
+
 @dataclass
 class Enemy(Character):
     """AI controlled enemy"""
 
     center_x: int = None
     center_y: int = None
+    blackboard: Blackboard = field(default_factory=Blackboard)
 
 
 class WorldListener(ABC):
@@ -35,25 +49,60 @@ class WorldListener(ABC):
 
 class WorldInterface(ABC):
     @abstractmethod
-    async def publish(self, message: Message, **kwargs) -> None:
+    async def publish(self, message: Message, channel: str = "api") -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def publish_to_observers(
+        self, character: Character, message: Message, include_self: bool = False
+    ) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def publish_nearby(self, message: Message, x: float, y: float) -> None:
         raise NotImplementedError()
 
     @abstractmethod
     def get_character_by_uuid(self, uuid: str) -> Character | None:
         raise NotImplementedError()
 
+    @abstractmethod
+    def get_character_by_handle(self, handle: int) -> Character | None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def apply_damage(self, target: Character, damage: float) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def add_character(self, character: Character) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def remove_character(self, character: Character) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def acknowledge_snapshot(self, player_uuid: str, sequence: int) -> None:
+        raise NotImplementedError()
+
     @abstractmethod
     def add_listener(self, listener: WorldListener) -> None:
         raise NotImplementedError()
 
     @property
     @abstractmethod
-    def enemies(self) -> list[Enemy]:
+    def enemies(self) -> Collection[Enemy]:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def players(self) -> Collection[Player]:
         raise NotImplementedError()
 
     @property
     @abstractmethod
-    def players(self) -> list[Player]:
+    def player_index(self) -> SpatialHash[Player]:
         raise NotImplementedError()
 
     @property
@@ -61,7 +110,17 @@ class WorldInterface(ABC):
     def map(self) -> Tilemap:
         raise NotImplementedError()
 
+    @property
+    @abstractmethod
+    def blocked_tiles(self) -> Set[tuple[int, int]]:
+        raise NotImplementedError()
+
     @property
     @abstractmethod
     def space(self) -> pymunk.Space:
         raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def character_store(self) -> CharacterStore:
+        raise NotImplementedError()
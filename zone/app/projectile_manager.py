@@ -1,43 +1,62 @@
+from dataclasses import dataclass
+from itertools import count
 from math import cos, sin
-from uuid import uuid4
 
 import pymunk
 from nk_shared import builders
+from nk_shared.models import CollisionCategory, ProjectilePool
 from nk_shared.models.character import Character
-from nk_shared.models.projectile import Projectile
 from nk_shared.models.weapon import load_weapon_by_name
+from nk_shared.proto import Projectile
 
 from app.models import WorldInterface
 
 
+@dataclass
+class ProjectileHit:
+    slot: int
+    handle: int
+    character: Character | None = None  # None when a wall was hit
+
+
 class ProjectileManager:
 
     def __init__(self, world: WorldInterface):
         self.world = world
-        self.projectiles: list[Projectile] = []
+        self.pool = ProjectilePool()
+        self._handles = count(1)
 
     async def update(self, dt: float):
-        for projectile in self.projectiles[:]:
-            projectile.update(dt)
-            if await self.handle_projectile_collisions(projectile):
-                self.projectiles.remove(projectile)
-                msg = builders.build_projectile_destroyed(projectile.uuid)
-                await self.world.publish(msg)
-
-    async def handle_projectile_collisions(self, projectile: Projectile) -> bool:
-        """Handle collisions for a single projectile."""
-        for query_info in self.world.space.shape_query(projectile.shape):
-            if hasattr(query_info.shape.body, "character"):
-                character: Character = query_info.shape.body.character
-                if projectile.origin != character:
-                    dmg = 1
-                    character.handle_damage_received(dmg)
-                    msg = builders.build_character_damaged(character, dmg)
-                    await self.world.publish(msg)
-                    return True
+        for hit in self.sweep(dt):
+            if hit.character is not None:
+                self.world.apply_damage(hit.character, 1)
+            await self.publish_destroyed(hit.slot)
+        await self.cull_expired()
+
+    async def cull_expired(self):
+        """Retire projectiles that flew their full range or left the map"""
+        for slot in self.pool.expired(self.world.map.width, self.world.map.height):
+            await self.publish_destroyed(slot)
+
+    async def publish_destroyed(self, slot: int):
+        """Release slot, telling players near where it ended up"""
+        msg = builders.build_projectile_destroyed(int(self.pool.handles[slot]))
+        x, y = self.pool.positions[slot].tolist()
+        self.pool.release(slot)
+        await self.world.publish_nearby(msg, x, y)
+
+    def sweep(self, dt: float) -> list[ProjectileHit]:
+        """Advance every projectile, querying the segment it travelled this
+        tick so fast projectiles cannot tunnel. The origin's collision group
+        is filtered out, so projectiles never hit their shooter."""
+        hits = []
+        for slot, shape in self.pool.sweep(self.world.space, dt):
+            handle = int(self.pool.handles[slot])
+            if shape.filter.categories & CollisionCategory.WALL:
+                hits.append(ProjectileHit(slot, handle))
             else:
-                return True
-        return False
+                hits.append(ProjectileHit(slot, handle, shape.body.character))
+        return hits
 
     def create_projectile(self, character: Character) -> Projectile:
         weapon = load_weapon_by_name(character.weapon_name)
@@ -49,10 +68,17 @@ class ProjectileManager:
             y=character.position.y,
             dx=speed.x,
             dy=speed.y,
-            origin=character,
-            weapon=weapon,
             weapon_name=character.weapon_name,
-            uuid=str(uuid4()),
+            handle=next(self._handles),
+        )
+        self.pool.spawn(
+            projectile.uuid,
+            projectile.x,
+            projectile.y,
+            projectile.dx,
+            projectile.dy,
+            weapon,
+            owner=character.collision_group,
+            handle=projectile.handle,
         )
-        self.projectiles.append(projectile)
         return projectile
@@ -12,5 +12,17 @@ async def subscribe() -> PubSub:
     return pubsub
 
 
+def player_channel(player_uuid: str) -> str:
+    return f"player-{player_uuid}"
+
+
 async def publish(message: bytes, channel: str = "api") -> None:
     await r.publish(channel, message)
+
+
+async def publish_batch(messages: list[tuple[str, bytes]]) -> None:
+    """Publish (channel, message) pairs in order with a single round trip"""
+    async with r.pipeline(transaction=False) as pipe:
+        for channel, message in messages:
+            pipe.publish(channel, message)
+        await pipe.execute()
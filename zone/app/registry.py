@@ -0,0 +1,62 @@
+from collections.abc import ValuesView
+from itertools import count
+
+from nk_shared.models import Character
+
+from app.models import Enemy, Player
+
+
+class EntityRegistry:
+    """Characters in the zone keyed by uuid, with typed views so callers
+    can look up or iterate players and enemies without scanning. Each
+    character is assigned a small integer handle on add, which hot network
+    messages carry in place of the uuid."""
+
+    def __init__(self):
+        self._handles = count(1)
+        self._characters: dict[str, Character] = {}
+        self._by_handle: dict[int, Character] = {}
+        self._players: dict[str, Player] = {}
+        self._enemies: dict[str, Enemy] = {}
+
+    def add(self, character: Character):
+        character.handle = next(self._handles)
+        self._characters[character.uuid] = character
+        self._by_handle[character.handle] = character
+        if isinstance(character, Player):
+            self._players[character.uuid] = character
+        elif isinstance(character, Enemy):
+            self._enemies[character.uuid] = character
+
+    def remove(self, character: Character) -> bool:
+        """Remove character, returning False if it was not registered"""
+        if self._characters.pop(character.uuid, None) is None:
+            return False
+        self._by_handle.pop(character.handle, None)
+        self._players.pop(character.uuid, None)
+        self._enemies.pop(character.uuid, None)
+        return True
+
+    def get(self, uuid: str) -> Character | None:
+        return self._characters.get(uuid)
+
+    def get_by_handle(self, handle: int) -> Character | None:
+        return self._by_handle.get(handle)
+
+    def __contains__(self, character: Character) -> bool:
+        return character.uuid in self._characters
+
+    def __len__(self) -> int:
+        return len(self._characters)
+
+    @property
+    def characters(self) -> ValuesView[Character]:
+        return self._characters.values()
+
+    @property
+    def players(self) -> ValuesView[Player]:
+        return self._players.values()
+
+    @property
+    def enemies(self) -> ValuesView[Enemy]:
+        return self._enemies.values()
@@ -0,0 +1,92 @@
+"""Fixed timestep scheduler, ticks the world at a constant rate regardless
+of how long each tick takes to simulate."""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from loguru import logger
+
+from app.settings import TICK_MAX_STEPS, TICK_RATE
+
+
+@dataclass
+class TickStats:
+    """Accounting for the most recent tick plus running totals"""
+
+    ticks: int = 0
+    steps: int = 0
+    duration: float = 0
+    lateness: float = 0
+    skipped_steps: int = 0
+    total_skipped_steps: int = 0
+    overruns: int = 0
+
+
+class TickScheduler:
+    """Calls `callback(step)` at `tick_rate` hz using an accumulator. When the
+    simulation falls behind, at most `max_steps` steps are run to catch up and
+    the remaining backlog is dropped (and reported) rather than spiraling."""
+
+    def __init__(
+        self,
+        callback: Callable[[float], Awaitable[None]],
+        tick_rate: int = TICK_RATE,
+        max_steps: int = TICK_MAX_STEPS,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.callback = callback
+        self.step = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.clock = clock
+        self.stats = TickStats()
+        self._accumulator = 0.0
+        self._last_time: float | None = None
+
+    async def tick(self) -> float:
+        """Run every step that is due. Returns seconds until the next step is due."""
+        now = self.clock()
+        if self._last_time is None:
+            self._last_time = now - self.step
+        self._accumulator += now - self._last_time
+        self._last_time = now
+        lateness = max(0.0, self._accumulator - self.step)
+
+        steps = 0
+        while self._accumulator >= self.step and steps < self.max_steps:
+            await self.callback(self.step)
+            self._accumulator -= self.step
+            steps += 1
+
+        skipped = 0
+        if self._accumulator >= self.step:
+            skipped = int(self._accumulator // self.step)
+            self._accumulator -= skipped * self.step
+            logger.warning("Tick fell behind, skipped {} steps", skipped)
+
+        duration = self.clock() - now
+        self.record(steps, duration, lateness, skipped)
+        return max(0.0, self.step - self._accumulator - duration)
+
+    def record(self, steps: int, duration: float, lateness: float, skipped: int):
+        self.stats.ticks += 1
+        self.stats.steps = steps
+        self.stats.duration = duration
+        self.stats.lateness = lateness
+        self.stats.skipped_steps = skipped
+        self.stats.total_skipped_steps += skipped
+        if steps and duration > self.step * steps:
+            self.stats.overruns += 1
+            logger.debug(
+                "Tick overran budget: {:.2f}ms for {} steps", duration * 1000, steps
+            )
+
+    async def run(self):
+        while True:
+            delay = await self.tick()
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                logger.warning("World update loop sleep cancelled, killing")
+                break
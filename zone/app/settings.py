@@ -1,3 +1,16 @@
 from os import environ
 
 SENTRY_DSN = environ.get("SENTRY_DSN", "")
+TICK_RATE = int(environ.get("TICK_RATE", "60"))
+TICK_MAX_STEPS = int(environ.get("TICK_MAX_STEPS", "5"))
+ENABLE_UVLOOP = environ.get("ENABLE_UVLOOP", "1") == "1"
+VIEW_RADIUS = float(environ.get("VIEW_RADIUS", "40"))
+SNAPSHOT_INTERVAL = float(environ.get("SNAPSHOT_INTERVAL", "0.1"))
+SNAPSHOT_HISTORY = int(environ.get("SNAPSHOT_HISTORY", "32"))
+SNAPSHOT_SLICE = int(environ.get("SNAPSHOT_SLICE", "0"))  # 0 is unbounded
+SNAPSHOT_FULL_EVERY = int(environ.get("SNAPSHOT_FULL_EVERY", "50"))  # 0 never
+FLOW_FIELD_RADIUS = int(environ.get("FLOW_FIELD_RADIUS", "24"))
+FLOW_FIELD_INTERVAL = float(environ.get("FLOW_FIELD_INTERVAL", "0.25"))
+AI_BUDGET_MS = float(environ.get("AI_BUDGET_MS", "4"))
+AI_SLICE = int(environ.get("AI_SLICE", "8"))  # enemies run per budget check
+INPUT_BATCH_MAX = int(environ.get("INPUT_BATCH_MAX", "256"))
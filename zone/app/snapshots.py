@@ -0,0 +1,178 @@
+"""Delta compressed world snapshots. Each player is sent only the character
+fields that changed since the last snapshot they acknowledged, naming it as
+the delta's baseline, so a lost snapshot is healed by the next one. Every
+full_every snapshots a player gets a full one instead, as a safety net
+should their state ever drift from what the zone thinks they hold.
+Players take turns, a rotating slice of them each tick, so snapshot work
+is spread evenly over the interval rather than landing on one tick."""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from itertools import repeat
+
+from nk_shared.models import Character, SnapshotField
+from nk_shared.proto import EntitySnapshot, Message, WorldSnapshot
+
+from app.settings import (
+    SNAPSHOT_FULL_EVERY,
+    SNAPSHOT_HISTORY,
+    SNAPSHOT_INTERVAL,
+    SNAPSHOT_SLICE,
+)
+
+POSITION_DECIMALS = 2
+EntityState = tuple[float, float, float, float, int, int, int, float]
+# EntitySnapshot field name and mask bit for each EntityState element
+STATE_FIELDS = (
+    ("x", SnapshotField.X),
+    ("y", SnapshotField.Y),
+    ("dx", SnapshotField.DX),
+    ("dy", SnapshotField.DY),
+    ("character_type", SnapshotField.CHARACTER_TYPE),
+    ("facing_direction", SnapshotField.FACING_DIRECTION),
+    ("moving_direction", SnapshotField.MOVING_DIRECTION),
+    ("hp", SnapshotField.HP),
+)
+
+
+def capture(character: Character) -> EntityState:
+    """Networked state of character. Positions are rounded so sub-centimeter
+    jitter does not count as a change."""
+    return (
+        round(character.position.x, POSITION_DECIMALS),
+        round(character.position.y, POSITION_DECIMALS),
+        round(character.velocity.x, POSITION_DECIMALS),
+        round(character.velocity.y, POSITION_DECIMALS),
+        int(character.character_type),
+        int(character.facing_direction or 0),
+        int(character.moving_direction or 0),
+        character.hp,
+    )
+
+
+def build_entity_snapshot(
+    character: Character, state: EntityState, baseline: EntityState | None
+) -> EntitySnapshot | None:
+    """Delta of state against baseline, or None when nothing changed. Without
+    a baseline every field is sent, along with the uuid the handle maps to."""
+    changed = {}
+    fields = 0
+    for (name, bit), value, previous in zip(
+        STATE_FIELDS, state, baseline or repeat(None)
+    ):
+        if value != previous:
+            changed[name] = value
+            fields |= bit
+    if not fields:
+        return None
+    uuid = character.uuid if baseline is None else ""
+    return EntitySnapshot(handle=character.handle, uuid=uuid, fields=fields, **changed)
+
+
+@dataclass
+class ClientSnapshots:
+    """Snapshots sent to one player, keyed by sequence, that are at or after
+    the one they last acknowledged. Each maps character handle to state."""
+
+    sequence: int = 0
+    acknowledged: int = 0
+    since_full: int = 0
+    history: dict[int, dict[int, EntityState]] = field(default_factory=dict)
+
+    @property
+    def baseline(self) -> dict[int, EntityState]:
+        return self.history.get(self.acknowledged, {})
+
+
+class SnapshotManager:
+    def __init__(
+        self,
+        interval: float = SNAPSHOT_INTERVAL,
+        history_size: int = SNAPSHOT_HISTORY,
+        slice_size: int = SNAPSHOT_SLICE,
+        full_every: int = SNAPSHOT_FULL_EVERY,
+    ):
+        self.interval = interval
+        self.history_size = history_size
+        self.slice_size = slice_size
+        self.full_every = full_every
+        self._clients: dict[str, ClientSnapshots] = {}
+        self._credit = 0.0
+        self._cursor = 0
+
+    def due(self, dt: float, player_uuids: Sequence[str]) -> list[str]:
+        """Players to snapshot this tick. Each player comes up once per
+        interval, spread over its ticks, and at most slice_size per tick
+        when set."""
+        if not player_uuids:
+            self._credit = 0.0
+            return []
+        total = len(player_uuids)
+        self._credit = min(self._credit + total * dt / self.interval, total)
+        count = int(self._credit)
+        if self.slice_size:
+            count = min(count, self.slice_size)
+        self._credit -= count
+        start = self._cursor % total
+        self._cursor = start + count
+        return [player_uuids[(start + offset) % total] for offset in range(count)]
+
+    def build(
+        self, player_uuid: str, characters: Iterable[Character]
+    ) -> Message | None:
+        """Snapshot of characters relative to the player's acknowledged
+        baseline, or None if the player is already up to date. Full
+        snapshots, with baseline 0, are relative to nothing."""
+        client = self._clients.setdefault(player_uuid, ClientSnapshots())
+        full = bool(self.full_every) and client.since_full >= self.full_every
+        baseline = {} if full else client.baseline
+        current = {}
+        entities = []
+        for character in characters:
+            state = current[character.handle] = capture(character)
+            entity = build_entity_snapshot(
+                character, state, baseline.get(character.handle)
+            )
+            if entity is not None:
+                entities.append(entity)
+        removed = [handle for handle in baseline if handle not in current]
+        if not entities and not removed and not full:
+            return None
+        client.since_full = 0 if full else client.since_full + 1
+        client.sequence += 1
+        client.history[client.sequence] = current
+        self._trim(client)
+        return Message(
+            world_snapshot=WorldSnapshot(
+                sequence=client.sequence,
+                baseline=0 if full else client.acknowledged,
+                entities=entities,
+                removed=removed,
+            )
+        )
+
+    def acknowledge(self, player_uuid: str, sequence: int):
+        """Player received snapshot `sequence`, future deltas are relative to it"""
+        client = self._clients.get(player_uuid)
+        if (
+            client is None
+            or sequence <= client.acknowledged
+            or sequence not in client.history
+        ):
+            return
+        client.acknowledged = sequence
+        for stale in [seq for seq in client.history if seq < sequence]:
+            del client.history[stale]
+
+    def forget(self, player_uuid: str):
+        self._clients.pop(player_uuid, None)
+
+    def _trim(self, client: ClientSnapshots):
+        """Drop the oldest unacknowledged snapshots past history_size. The
+        acknowledged baseline is always kept."""
+        excess = len(client.history) - self.history_size
+        if excess <= 0:
+            return
+        stale = [seq for seq in client.history if seq != client.acknowledged]
+        for seq in stale[:excess]:
+            del client.history[seq]
@@ -0,0 +1,136 @@
+"""Uniform grid spatial index for proximity queries"""
+
+from math import floor, inf
+from typing import Generic, Iterator, TypeVar
+
+T = TypeVar("T")
+Cell = tuple[int, int]
+
+DEFAULT_CELL_SIZE = 8.0
+
+
+class SpatialHash(Generic[T]):
+    """Buckets items into square cells so radius and nearest neighbor
+    queries only visit cells near the query point. Items are tracked by
+    identity, so they need not be hashable."""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells: dict[Cell, dict[int, tuple[float, float, T]]] = {}
+        self._item_cells: dict[int, Cell] = {}
+        self._min_cell: Cell | None = None
+        self._max_cell: Cell | None = None
+
+    def cell(self, x: float, y: float) -> Cell:
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def update(self, item: T, x: float, y: float):
+        """Insert item at x,y, or move it if already indexed"""
+        key = id(item)
+        cell = self.cell(x, y)
+        previous = self._item_cells.get(key)
+        if previous is not None and previous != cell:
+            self._discard(key, previous)
+        self._cells.setdefault(cell, {})[key] = (x, y, item)
+        self._item_cells[key] = cell
+        self._expand_bounds(cell)
+
+    def remove(self, item: T):
+        key = id(item)
+        cell = self._item_cells.pop(key, None)
+        if cell is not None:
+            self._discard(key, cell)
+
+    def clear(self):
+        self._cells.clear()
+        self._item_cells.clear()
+        self._min_cell = self._max_cell = None
+
+    def query_radius(self, x: float, y: float, radius: float) -> list[T]:
+        """All items within radius of x,y, in no particular order"""
+        min_x, min_y = self.cell(x - radius, y - radius)
+        max_x, max_y = self.cell(x + radius, y + radius)
+        radius_sq = radius * radius
+        results = []
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = self._cells.get((cell_x, cell_y))
+                if not bucket:
+                    continue
+                for item_x, item_y, item in bucket.values():
+                    if (item_x - x) ** 2 + (item_y - y) ** 2 <= radius_sq:
+                        results.append(item)
+        return results
+
+    def nearest(
+        self, x: float, y: float, k: int = 1, max_distance: float = inf
+    ) -> list[T]:
+        """Up to k items closest to x,y, nearest first. Searches outward ring
+        by ring, stopping once no unvisited cell can hold anything closer."""
+        if not self._item_cells:
+            return []
+        center = self.cell(x, y)
+        max_ring = self._max_ring(center)
+        max_distance_sq = max_distance * max_distance
+        found: list[tuple[float, T]] = []
+        for ring in range(max_ring + 1):
+            ring_min_distance = max(0, ring - 1) * self.cell_size
+            if ring_min_distance > max_distance:
+                break
+            if len(found) >= k and found[k - 1][0] <= ring_min_distance**2:
+                break
+            for cell in ring_cells(center, ring):
+                bucket = self._cells.get(cell)
+                if not bucket:
+                    continue
+                for item_x, item_y, item in bucket.values():
+                    dst_sq = (item_x - x) ** 2 + (item_y - y) ** 2
+                    if dst_sq <= max_distance_sq:
+                        found.append((dst_sq, item))
+            found.sort(key=lambda pair: pair[0])
+        return [item for _dst_sq, item in found[:k]]
+
+    def __len__(self) -> int:
+        return len(self._item_cells)
+
+    def _discard(self, key: int, cell: Cell):
+        bucket = self._cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self._cells[cell]
+
+    def _expand_bounds(self, cell: Cell):
+        if self._min_cell is None:
+            self._min_cell = self._max_cell = cell
+            return
+        self._min_cell = (
+            min(self._min_cell[0], cell[0]),
+            min(self._min_cell[1], cell[1]),
+        )
+        self._max_cell = (
+            max(self._max_cell[0], cell[0]),
+            max(self._max_cell[1], cell[1]),
+        )
+
+    def _max_ring(self, center: Cell) -> int:
+        """Rings beyond this cannot contain an indexed cell"""
+        return max(
+            abs(center[0] - self._min_cell[0]),
+            abs(center[0] - self._max_cell[0]),
+            abs(center[1] - self._min_cell[1]),
+            abs(center[1] - self._max_cell[1]),
+        )
+
+
+def ring_cells(center: Cell, ring: int) -> Iterator[Cell]:
+    """Cells forming the square ring `ring` cells away from center"""
+    cx, cy = center
+    if ring == 0:
+        yield center
+        return
+    for i in range(-ring, ring + 1):
+        yield cx + i, cy - ring
+        yield cx + i, cy + ring
+    for j in range(-ring + 1, ring):
+        yield cx - ring, cy + j
+        yield cx + ring, cy + j
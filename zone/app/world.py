@@ -1,21 +1,32 @@
 """Simulates the world's characters"""
 
 from collections import deque
+from collections.abc import Collection, Set
 
 import pymunk
 from loguru import logger
-from nk_shared import builders
+from nk_shared import builders, codec
 from nk_shared.map.tilemap import Tilemap
-from nk_shared.models import AttackType, Character, Zone
+from nk_shared.models import AttackType, Character, CollisionCategory, Zone
 from nk_shared.proto import Message
 from nk_shared.settings import DATA_ROOT, ZONE_NAME
 
 from app.ai import Ai
+from app.character_store import CharacterStore
+from app.damage import DamageLedger
+from app.inbox import Inbox
+from app.interest import InterestManager
 from app.medical_manager import MedicalManager
 from app.messages.handler import MessageHandler
+from app.messages.player_handlers import spawn_player
 from app.models import Enemy, Player, WorldInterface, WorldListener
 from app.projectile_manager import ProjectileManager
-from app.pubsub import publish
+from app.pubsub import player_channel, publish_batch
+from app.registry import EntityRegistry
+from app.snapshots import SnapshotManager
+from app.spatial import SpatialHash
+
+MELEE_HITBOX_RADIUS = 1
 
 
 class World(WorldInterface):  # pylint: disable=too-many-instance-attributes
@@ -27,84 +38,201 @@ class World(WorldInterface):  # pylint: disable=too-many-instance-attributes
         self._zone = Zone.from_yaml_file(f"{DATA_ROOT}/zones/{zone_name}.yml")
         self._map = Tilemap(self._zone.tmx_path, headless=True)
         self._map.add_map_geometry_to_space(self._space)
-        self._players: list[Player] = []
+        self._blocked_tiles = set(self._map.blocked_tiles())
+        self.init_environment_features()
+        self._registry = EntityRegistry()
+        self._player_index: SpatialHash[Player] = SpatialHash()
+        self._character_index: SpatialHash[Character] = SpatialHash()
+        self._interest = InterestManager()
+        self._snapshots = SnapshotManager()
+        self._damage = DamageLedger()
+        self._inbox = Inbox()
+        self._character_store = CharacterStore()
+        self._outbox: list[tuple[str, bytes]] = []
         self._ai = Ai(self, self._zone)
         self._projectile_component = ProjectileManager(self)
         self._message_handler = MessageHandler(self, self._ai)
         self._medical_manager = MedicalManager(self, self._zone.medics)
-        self.init_environment_features()
 
     def init_environment_features(self):
         for feature in self._zone.environment_features:
             tilemap = Tilemap(feature.tmx_name, headless=True)
-            tilemap.add_map_geometry_to_space(
-                self.space,
-                feature.center_x - tilemap.width // 2,
-                feature.center_y - tilemap.height // 2,
-            )
+            offset_x = feature.center_x - tilemap.width // 2
+            offset_y = feature.center_y - tilemap.height // 2
+            tilemap.add_map_geometry_to_space(self.space, offset_x, offset_y)
+            self._blocked_tiles.update(tilemap.blocked_tiles(offset_x, offset_y))
 
     async def update(self, dt: float):
+        await self.handle_inbox()
+        self.update_indexes()
+        await self.update_interest()
         await self._ai.update(dt)
-        await self.update_characters(dt, self._players, self._ai.enemies)
-        await self.update_characters(dt, self._ai.enemies, self._players)
+        await self.update_characters(dt, self.players, CollisionCategory.ENEMY)
+        await self.update_characters(dt, self.enemies, CollisionCategory.PLAYER)
         await self._medical_manager.update(dt)
         await self._projectile_component.update(dt)
+        await self.publish_damage()
         self._space.step(dt)
+        await self.update_snapshots(dt)
+        await self.flush()
+
+    def update_indexes(self):
+        """Sync spatial indexes with physics body positions, once per tick"""
+        for player in self.players:
+            if player.alive:
+                self._player_index.update(player, *player.body.position)
+            else:
+                self._player_index.remove(player)
+        for character in self._registry.characters:
+            self._character_index.update(character, *character.body.position)
+
+    async def update_interest(self):
+        """Tell players about characters entering and leaving their view"""
+        for change in self._interest.update(self.players, self._character_index):
+            channel = player_channel(change.player_uuid)
+            for uuid in change.entered:
+                character = self._registry.get(uuid)
+                msg = builders.build_character_updated_quantized(character)
+                await self.publish(msg, channel=channel)
+            for uuid in change.left:
+                await self.publish(builders.build_character_left_view(uuid), channel)
+
+    async def update_snapshots(self, dt: float):
+        """Send players whose turn it is a delta snapshot of the characters
+        in their view. Views date from the start of the tick, so characters
+        removed since, like enemies killed this tick, are skipped."""
+        player_uuids = [player.uuid for player in self.players]
+        for player_uuid in self._snapshots.due(dt, player_uuids):
+            visible = self._interest.visible(player_uuid)
+            characters = [
+                character
+                for character in map(self._registry.get, visible)
+                if character is not None
+            ]
+            msg = self._snapshots.build(player_uuid, characters)
+            if msg is not None:
+                await self.publish(msg, channel=player_channel(player_uuid))
+
+    def acknowledge_snapshot(self, player_uuid: str, sequence: int):
+        self._snapshots.acknowledge(player_uuid, sequence)
 
     async def update_characters(
         self,
         dt: float,
-        characters: list[Character],
-        targets: list[Character],
+        characters: Collection[Character],
+        target_category: CollisionCategory,
     ):
-        """Update given characters (players and enemies)"""
-        for character in characters:
+        """Update given characters (players and enemies), attacking shapes
+        of the given target category"""
+        for character in list(characters):
             character.update(dt)
             if character.should_process_attack:
                 if character.weapon.attack_type == AttackType.MELEE:
-                    await self.process_attack_damage(character, targets)
+                    await self.process_attack_damage(character, target_category)
                 elif character.weapon.attack_type == AttackType.RANGED:
                     await self.process_ranged_attack(character)
             if not character.alive and not character.body_removal_processed:
+                # remotes learned of the death from the damage event's hp
                 character.body_removal_processed = True
-                self._space.remove(
-                    character.body, character.shape, character.hitbox_shape
-                )
+                self._space.remove(character.body, character.shape)
                 for listener in self._listeners:
-                    # make sure we tell remotes about the death, better to just send a health update
-                    await self.publish(builders.build_character_updated(character))
                     listener.character_removed(character)
-                if character in self.players:
+                if isinstance(character, Player):
                     logger.info("Player killed {}", character.uuid)
                     self._medical_manager.schedule_respawn(character)
 
     async def process_ranged_attack(self, character: Character):
         projectile = self._projectile_component.create_projectile(character)
-        await self.publish(builders.build_projectile_created(character, projectile))
+        msg = builders.build_projectile_created_quantized(character, projectile)
+        await self.publish_to_observers(character, msg)
         character.should_process_attack = False
 
     async def process_attack_damage(
-        self, attacker: Character, targets: list[Character]
+        self, attacker: Character, target_category: CollisionCategory
     ):
-        """Attack trigger frame reached, let's find who was hit and apply dmg"""
+        """Attack trigger frame reached, query the space along the attacker's
+        swing for shapes of the target category and apply dmg"""
         attacker.should_process_attack = False
-        for target in targets:
-            if attacker.hitbox_shape.shapes_collide(target.shape).points:
-                damage = 1
-                target.handle_damage_received(damage)
-                await self.publish(builders.build_character_damaged(target, damage))
+        start, end = attacker.melee_hitbox_endpoints()
+        shape_filter = pymunk.ShapeFilter(mask=target_category)
+        hits = self._space.segment_query(start, end, MELEE_HITBOX_RADIUS, shape_filter)
+        for hit in hits:
+            target: Character = hit.shape.body.character
+            self.apply_damage(target, 1)
+
+    def apply_damage(self, target: Character, damage: float):
+        """Damage target now, reporting it with the tick's other hits"""
+        self._damage.apply(target, damage)
+
+    async def publish_damage(self):
+        """Tell observers of each target hit this tick its total damage"""
+        for target, damage in self._damage.drain():
+            msg = builders.build_character_damaged(target, damage)
+            await self.publish_to_observers(target, msg, include_self=True)
 
     def get_character_by_uuid(self, uuid: str) -> Character | None:
-        for character in self._players + self._ai.enemies:
-            if character.uuid == uuid:
-                return character
-        return None
+        return self._registry.get(uuid)
+
+    def get_character_by_handle(self, handle: int) -> Character | None:
+        return self._registry.get_by_handle(handle)
+
+    def add_character(self, character: Character):
+        """Register character and add its physics shapes to the space"""
+        self._registry.add(character)
+        self._space.add(character.body, character.shape)
+        if isinstance(character, Player) and character.alive:
+            self._player_index.update(character, *character.body.position)
+        self._character_index.update(character, *character.body.position)
+
+    def remove_character(self, character: Character):
+        """Unregister character, removing its shapes if still simulated"""
+        self._registry.remove(character)
+        self._player_index.remove(character)
+        self._character_index.remove(character)
+        if character.body.space is not None:
+            self._space.remove(character.body, character.shape)
+        if isinstance(character, Player):
+            self._snapshots.forget(character.uuid)
 
     async def handle_message(self, msg: Message):
         await self._message_handler.handle_message(msg)
 
-    async def publish(self, message: Message, **kwargs):
-        await publish(bytes(message), **kwargs)
+    async def handle_inbox(self):
+        """Spawn players whose characters finished loading, then apply this
+        tick's batch of queued client input, in arrival order"""
+        for loaded in self._character_store.drain():
+            if self.get_character_by_uuid(loaded.player_uuid) is None:
+                await spawn_player(self, loaded)
+        for msg in self._inbox.drain():
+            await self.handle_message(msg)
+
+    async def publish(self, message: Message, channel: str = "api"):
+        """Queue message on the tick outbox, sent when the tick is flushed"""
+        self._outbox.append((channel, codec.encode(message)))
+
+    async def publish_to_observers(
+        self, character: Character, message: Message, include_self: bool = False
+    ):
+        """Send message to players who have character in view. Players are not
+        their own observers, include_self also sends it to a player character."""
+        data = codec.encode(message)
+        for player_uuid in self._interest.observers(character.uuid):
+            self._outbox.append((player_channel(player_uuid), data))
+        if include_self and isinstance(character, Player):
+            self._outbox.append((player_channel(character.uuid), data))
+
+    async def publish_nearby(self, message: Message, x: float, y: float):
+        """Send message to living players within view range of x,y"""
+        data = codec.encode(message)
+        for player in self._player_index.query_radius(x, y, self._interest.view_radius):
+            self._outbox.append((player_channel(player.uuid), data))
+
+    async def flush(self):
+        """Send everything published this tick in one redis round trip"""
+        if not self._outbox:
+            return
+        outbox, self._outbox = self._outbox, []
+        await publish_batch(outbox)
 
     def add_listener(self, listener: WorldListener):
         self._listeners.append(listener)
@@ -114,13 +242,29 @@ class World(WorldInterface):  # pylint: disable=too-many-instance-attributes
         return self._map
 
     @property
-    def enemies(self) -> list[Enemy]:
-        return self._ai.enemies
+    def blocked_tiles(self) -> Set[tuple[int, int]]:
+        return self._blocked_tiles
+
+    @property
+    def enemies(self) -> Collection[Enemy]:
+        return self._registry.enemies
 
     @property
-    def players(self) -> list[Player]:
-        return self._players
+    def players(self) -> Collection[Player]:
+        return self._registry.players
+
+    @property
+    def player_index(self) -> SpatialHash[Player]:
+        return self._player_index
 
     @property
     def space(self) -> pymunk.Space:
         return self._space
+
+    @property
+    def inbox(self) -> Inbox:
+        return self._inbox
+
+    @property
+    def character_store(self) -> CharacterStore:
+        return self._character_store
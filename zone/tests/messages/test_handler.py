@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 from nk_shared import builders
@@ -18,7 +18,7 @@ def world() -> World:
 
 @pytest.fixture
 def message_bus(world: World) -> MessageHandler:
-    return MessageHandler(world)
+    return MessageHandler(world, world._ai)
 
 
 class TestMessageBus:
@@ -29,8 +29,49 @@ class TestMessageBus:
         await message_bus.handle_message(msg)
 
     @pytest.mark.asyncio
-    async def test_handle_character_updated(self, message_bus: MessageHandler):
+    async def test_handle_character_updated(
+        self, world: World, message_bus: MessageHandler
+    ):
         player = Player(user_id="1234", moving_direction=Direction.DIRECTION_E)
-        message_bus.world.players.append(player)
+        world.add_character(player)
         msg = builders.build_character_updated(player)
         await message_bus.handle_message(msg)
+
+    @pytest.mark.asyncio
+    async def test_character_owned_by_sender(
+        self, world: World, message_bus: MessageHandler
+    ):
+        player = Player(user_id="1234", start_x=5, start_y=5)
+        other = Player(user_id="5678", start_x=5, start_y=5)
+        world.add_character(player)
+        world.add_character(other)
+        player.position = (9, 9)
+        msg = builders.build_character_position_updated(player)
+        msg.origin_uuid = other.uuid  # someone else addressing player's handle
+        player.position = (5, 5)
+        await message_bus.handle_message(msg)
+        assert tuple(player.position) == (5, 5)
+        msg.origin_uuid = player.uuid
+        await message_bus.handle_message(msg)
+        assert tuple(player.position) == (9, 9)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_acknowledged_by_sender(
+        self, world: World, message_bus: MessageHandler
+    ):
+        world.acknowledge_snapshot = Mock()
+        msg = builders.build_snapshot_acknowledged("1234", 3)
+        msg.origin_uuid = "5678"  # someone else acking player's snapshots
+        await message_bus.handle_message(msg)
+        world.acknowledge_snapshot.assert_not_called()
+        msg.origin_uuid = "1234"
+        await message_bus.handle_message(msg)
+        world.acknowledge_snapshot.assert_called_once_with("1234", 3)
+
+    @pytest.mark.asyncio
+    async def test_dispatch_stats(self, message_bus: MessageHandler):
+        msg = Message(text_message=TextMessage(text="test"))
+        await message_bus.handle_message(msg)
+        await message_bus.handle_message(Message())
+        assert message_bus.dispatcher.stats["text_message"].count == 1
+        assert message_bus.dispatcher.unhandled == 1
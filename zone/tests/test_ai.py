@@ -2,8 +2,10 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from nk_shared.models.zone import EnemyGroup, Environment, Spawner, Zone
+from nk_shared.proto import CharacterType
 
 from app.ai import Ai
+from app.ai.lod import LodTier
 from app.models import Player
 from app.world import World
 
@@ -24,7 +26,7 @@ def single_enemy_enemy_group() -> EnemyGroup:
 def world(player) -> World:
     world = World()
     world.publish = AsyncMock(return_value=None)
-    world.players.append(player)
+    world.add_character(player)
     return world
 
 
@@ -55,6 +57,8 @@ def environment_feature(spawner: Spawner) -> Environment:
 @pytest.fixture
 def ai(world: World, zone: Zone) -> Ai:
     world._zone = zone
+    for enemy in list(world.enemies):
+        world.remove_character(enemy)
     return Ai(world, zone)
 
 
@@ -71,3 +75,75 @@ class TestAi:
         assert len(ai.enemies) == 1
         await ai.update(10)
         assert len(ai.enemies) == 2
+
+    @pytest.mark.asyncio
+    async def test_spawner_population_cap(self, ai: Ai, spawner: Spawner):
+        spawner.max_population = 1
+        await ai.update(10)
+        await ai.update(10)
+        assert len(ai.enemies) == 2
+        spawned = ai.spawn_manager.spawners[0].population
+        ai.character_removed(ai.world.get_character_by_uuid(next(iter(spawned))))
+        await ai.update(10)
+        assert len(ai.enemies) == 2
+
+    @pytest.mark.asyncio
+    async def test_spawner_inactive_without_nearby_player(
+        self, ai: Ai, spawner: Spawner, player: Player
+    ):
+        spawner.activation_distance = 5
+        await ai.update(10)
+        assert len(ai.enemies) == 1
+
+    @pytest.mark.asyncio
+    async def test_spawns_per_tick_budget(self, ai: Ai, zone: Zone, spawner: Spawner):
+        zone.environment_features[0].spawners.append(
+            Spawner(character_type_str="droid_assassin", offset_x=0, offset_y=1)
+        )
+        ai = Ai(ai.world, zone)
+        enemies = len(ai.enemies)
+        await ai.update(10)
+        assert len(ai.enemies) == enemies + 1
+        await ai.update(0.016)
+        assert len(ai.enemies) == enemies + 2
+
+    @pytest.mark.asyncio
+    async def test_lod_far_enemies_skipped(self, ai: Ai, player: Player):
+        player.body.position = (1000, 1000)
+        ai.world.update_indexes()
+        enemy = next(iter(ai.enemies))
+        await ai.update(0.016)
+        assert ai.lod.tier(enemy) == LodTier.FAR
+        await ai.update(0.016)
+        assert ai.lod.stats.far == 1
+        assert ai.lod.stats.skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_defers_round_robin(self, ai: Ai):
+        list(ai.spawn_enemies(3, CharacterType.CHARACTER_TYPE_SHADOW_GUARDIAN, 10, 0))
+        ticks = iter(range(1000))
+        ai.clock = lambda: next(ticks)
+        ai.budget = 1.5  # clock advances 1 per call, so two enemies per tick
+        ai.slice_size = 1
+        await ai.update(0.016)
+        assert ai.lod.stats.deferred == 2
+        await ai.update(0.016)
+        assert ai.lod.stats.deferred == 2
+
+    @pytest.mark.asyncio
+    async def test_budget_never_starves(self, ai: Ai):
+        list(ai.spawn_enemies(3, CharacterType.CHARACTER_TYPE_SHADOW_GUARDIAN, 10, 0))
+        ai.budget = -1  # already spent before any enemy runs
+        ai.slice_size = 1
+        updated = []
+        original = ai.update_enemy_lod
+
+        async def update_enemy_lod(dt, enemy, sensed):
+            updated.append(enemy)
+            return await original(dt, enemy, sensed)
+
+        ai.update_enemy_lod = update_enemy_lod
+        for _ in range(4):
+            await ai.update(0.016)
+        assert len(updated) == 4
+        assert {e.uuid for e in updated} == {e.uuid for e in ai.enemies}
@@ -0,0 +1,62 @@
+from unittest.mock import Mock
+
+import pytest
+from nk_shared.proto import CharacterType, Direction
+
+from app.ai.behavior import (
+    BehaviorContext,
+    Status,
+    build_node,
+    load_behavior_tree,
+)
+from app.ai.sensing import Sensed
+from app.models import Enemy
+
+
+@pytest.fixture
+def enemy() -> Enemy:
+    return Enemy(
+        character_type=CharacterType.CHARACTER_TYPE_SHADOW_GUARDIAN,
+        start_x=0,
+        start_y=0,
+    )
+
+
+def make_ctx(enemy: Enemy, dt: float = 0.1, **sensed) -> BehaviorContext:
+    flags = {"chase": False, "attack": False, **sensed}
+    flow_fields = Mock()
+    flow_fields.direction.return_value = None
+    return BehaviorContext(
+        enemy,
+        Sensed(Mock(), 1.0, Direction.DIRECTION_E, 0.0, **flags),
+        flow_fields,
+        dt,
+    )
+
+
+class TestBehaviorTree:
+    def test_running_node_resumes(self, enemy: Enemy):
+        tree = build_node(
+            {"sequence": [{"action": "attack"}, {"wait": 0.25}, {"action": "idle"}]}
+        )
+        ctx = make_ctx(enemy)
+        assert tree.tick(ctx) == Status.RUNNING
+        assert ctx.attacked
+        ctx = make_ctx(enemy)
+        assert tree.tick(ctx) == Status.RUNNING
+        assert not ctx.attacked  # resumed at the wait, attack not repeated
+        assert tree.tick(make_ctx(enemy)) == Status.SUCCESS
+        assert not enemy.blackboard.running and not enemy.blackboard.timers
+
+    def test_enemy_tree_chases_and_attacks(self, enemy: Enemy):
+        tree = load_behavior_tree(enemy.character_type_short)
+        ctx = make_ctx(enemy, chase=True, attack=True)
+        assert tree.tick(ctx) == Status.SUCCESS
+        assert enemy.moving_direction == Direction.DIRECTION_E
+        assert ctx.attacked
+        tree.tick(make_ctx(enemy))
+        assert enemy.moving_direction is None
+
+    def test_unknown_node(self):
+        with pytest.raises(ValueError):
+            build_node({"parallel": []})
@@ -0,0 +1,83 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from nk_shared.proto import Message, PlayerConnected, PlayerDisconnected
+
+from app.character_store import CharacterStore, LoadedCharacter
+from app.world import World
+
+PLAYER_UUID = "65f1e2c3a4b5c6d7e8f90123"
+
+
+@pytest.mark.asyncio
+async def test_load_queues_result():
+    store = CharacterStore()
+    with patch("app.character_store.load_position", new=AsyncMock(return_value=(3, 4))):
+        store.load(PLAYER_UUID)
+        assert not store.drain()
+        await store.wait()
+    assert store.drain() == [LoadedCharacter(PLAYER_UUID, (3, 4))]
+    assert not store.drain()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_load_dropped():
+    store = CharacterStore()
+    with patch("app.character_store.load_position", new=AsyncMock(return_value=None)):
+        store.load(PLAYER_UUID)
+        store.cancel_load(PLAYER_UUID)
+        await store.wait()
+    assert not store.drain()
+
+
+@pytest.mark.asyncio
+async def test_operations_run_in_order():
+    store = CharacterStore()
+    calls = []
+
+    async def save(player_uuid, x, y):
+        await asyncio.sleep(0.01)
+        calls.append(("save", x, y))
+
+    async def load(player_uuid):
+        calls.append(("load",))
+
+    with patch("app.character_store.save_position", new=save), patch(
+        "app.character_store.load_position", new=load
+    ):
+        store.save(PLAYER_UUID, 1, 2)
+        store.load(PLAYER_UUID)
+        await store.wait()
+    assert calls == [("save", 1, 2), ("load",)]
+
+
+@pytest.mark.asyncio
+async def test_failed_load_logged_not_raised():
+    store = CharacterStore()
+    failing = AsyncMock(side_effect=RuntimeError("db down"))
+    with patch("app.character_store.load_position", new=failing):
+        store.load(PLAYER_UUID)
+        await store.wait()
+    assert not store.drain()
+
+
+@pytest.mark.asyncio
+async def test_world_spawns_loaded_player_next_tick():
+    world = World()
+    world.publish = AsyncMock()
+    connected = Message(player_connected=PlayerConnected(uuid=PLAYER_UUID))
+    with patch("app.character_store.load_position", new=AsyncMock(return_value=None)):
+        await world.handle_message(connected)
+        assert world.get_character_by_uuid(PLAYER_UUID) is None
+        await world.character_store.wait()
+    await world.handle_inbox()
+    assert world.get_character_by_uuid(PLAYER_UUID) is not None
+
+    disconnected = Message(player_disconnected=PlayerDisconnected(uuid=PLAYER_UUID))
+    save = AsyncMock()
+    with patch("app.character_store.save_position", new=save):
+        await world.handle_message(disconnected)
+        assert world.get_character_by_uuid(PLAYER_UUID) is None
+        await world.character_store.wait()
+    save.assert_awaited_once()
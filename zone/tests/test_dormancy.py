@@ -0,0 +1,33 @@
+from unittest.mock import AsyncMock
+
+from nk_shared.models.zone import Dormancy
+
+from app.ai.dormancy import DormancyManager
+from app.models import Player
+from app.world import World
+
+
+class TestDormancyManager:
+    def test_sleep_and_wake(self):
+        world = World()
+        world.publish = AsyncMock(return_value=None)
+        player = Player(user_id="1234", start_x=16, start_y=26)
+        world.add_character(player)
+        dormancy = DormancyManager(
+            world, Dormancy(wake_distance=6, sleep_distance=8, check_interval_s=0)
+        )
+        total = len(world.enemies)
+        for enemy in world.enemies:
+            enemy.hp = 3
+        sleepers = dormancy.update(0.016, world.players)
+        assert sleepers and len(dormancy) == len(sleepers)
+        assert len(world.enemies) == total - len(sleepers)
+        assert all(sleeper.body.space is None for sleeper in sleepers)
+
+        x, y = sleepers[0].body.position
+        player.body.position = (x, y)
+        world.update_indexes()
+        dormancy.update(0.016, world.players)
+        woken = world.get_character_by_uuid(sleepers[0].uuid)
+        assert woken is not None and woken.body.space is world.space
+        assert woken is not sleepers[0] and woken.hp == 3
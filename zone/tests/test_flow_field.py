@@ -0,0 +1,67 @@
+from nk_shared.proto import Direction
+
+from app.ai.flow_field import FlowField, FlowFieldManager
+from app.models import Player
+
+
+class TestFlowField:
+    def test_steers_around_wall(self):
+        # wall at x=1 from y=-2..2, target on the other side
+        blocked = {(1, y) for y in range(-2, 3)}
+        field = FlowField((2, 0), blocked, radius=20)
+        assert field.direction((2, 0)) is None
+        assert field.direction((0, 0)) in (Direction.DIRECTION_N, Direction.DIRECTION_S)
+        assert field.direction((3, 0)) == Direction.DIRECTION_W
+        assert field.direction((1, 0)) is None  # blocked
+
+    def test_no_corner_cutting(self):
+        blocked = {(1, 0), (0, 1)}
+        field = FlowField((1, 1), blocked, radius=20)
+        assert field.direction((0, 0)) not in (None, Direction.DIRECTION_SE)
+
+    def test_radius_bounds_field(self):
+        field = FlowField((0, 0), set(), radius=3)
+        assert field.direction((3, 0)) == Direction.DIRECTION_W
+        assert field.direction((5, 0)) is None
+
+
+class TestFlowFieldManager:
+    def test_rebuilt_only_on_tile_change(self):
+        manager = FlowFieldManager(set(), radius=10, interval=0)
+        player = Player(user_id="1234", start_x=5.5, start_y=5.5)
+        manager.update(0.016, [player])
+        field = manager._fields[(5, 5)]
+        player.body.position = (5.9, 5.1)
+        manager.update(0.016, [player])
+        assert manager._fields[(5, 5)] is field
+        player.body.position = (7.5, 5.5)
+        manager.update(0.016, [player])
+        assert list(manager._fields) == [(7, 5)]
+        assert manager.direction(player, 9.5, 5.5) == Direction.DIRECTION_W
+
+    def test_rebuilt_at_most_once_per_interval(self):
+        manager = FlowFieldManager(set(), radius=10, interval=0.25)
+        player = Player(user_id="1234", start_x=5.5, start_y=5.5)
+        manager.update(0.1, [player])  # new players are built right away
+        assert manager.builds == 1
+        player.body.position = (7.5, 5.5)
+        manager.update(0.1, [player])
+        assert list(manager._fields) == [(5, 5)]  # stale field kept
+        assert manager.direction(player, 9.5, 5.5) == Direction.DIRECTION_W
+        manager.update(0.1, [player])
+        assert list(manager._fields) == [(7, 5)]
+        assert manager.builds == 2
+
+    def test_builds_stop_out_of_time(self):
+        manager = FlowFieldManager(set(), radius=10, interval=0)
+        players = [
+            Player(user_id=str(i), start_x=i * 3 + 0.5, start_y=0.5) for i in range(3)
+        ]
+        manager.update(0.016, players, out_of_time=lambda: True)
+        assert manager.builds == 1
+        assert manager.direction(players[1], 0.5, 0.5) is None
+        manager.update(0.016, players, out_of_time=lambda: True)
+        assert manager.builds == 2
+        manager.update(0.016, players)
+        assert manager.builds == 3
+        assert manager.direction(players[2], 0.5, 0.5) == Direction.DIRECTION_E
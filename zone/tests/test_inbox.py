@@ -0,0 +1,68 @@
+from nk_shared.proto import (
+    CharacterAttacked,
+    CharacterDirectionUpdated,
+    CharacterPositionUpdated,
+    CharacterUpdated,
+    Message,
+)
+
+from app.inbox import Inbox, coalesce
+
+
+def position(handle: int, x: float) -> Message:
+    return Message(
+        character_position_updated=CharacterPositionUpdated(handle=handle, x=x)
+    )
+
+
+class TestCoalesce:
+    def test_newest_position_wins(self):
+        messages = [position(1, 1), position(2, 1), position(1, 2), position(1, 3)]
+        kept = coalesce(messages)
+        assert [m.character_position_updated.x for m in kept] == [1, 3]
+        assert kept[0].character_position_updated.handle == 2
+
+    def test_events_are_barriers(self):
+        """Updates on either side of an event for the character are kept, so
+        it fires from where the character was when it was sent"""
+        attack = Message(character_attacked=CharacterAttacked(handle=1))
+        messages = [position(1, 1), attack, position(1, 2), position(1, 3), attack]
+        assert coalesce(messages) == [
+            position(1, 1),
+            attack,
+            position(1, 3),
+            attack,
+        ]
+
+    def test_events_for_other_characters_not_barriers(self):
+        attack = Message(character_attacked=CharacterAttacked(handle=2))
+        kept = coalesce([position(1, 1), attack, position(1, 2)])
+        assert kept == [attack, position(1, 2)]
+
+    def test_partial_updates_kept(self):
+        """An older full update still carries direction a newer position
+        update does not, while a newer full update supersedes both"""
+        direction = Message(
+            character_direction_updated=CharacterDirectionUpdated(handle=1)
+        )
+        updated = Message(character_updated=CharacterUpdated(handle=1, x=5))
+        assert coalesce([updated, position(1, 2)]) == [updated, position(1, 2)]
+        assert coalesce([position(1, 2), direction, updated]) == [updated]
+
+    def test_senders_coalesced_apart(self):
+        spoofed = Message(
+            origin_uuid="other",
+            character_position_updated=CharacterPositionUpdated(handle=1, x=9),
+        )
+        assert coalesce([position(1, 1), spoofed]) == [position(1, 1), spoofed]
+
+
+class TestInbox:
+    def test_drain_counts_coalesced(self):
+        inbox = Inbox()
+        for x in range(4):
+            inbox.put(position(1, x))
+        assert inbox.drain() == [position(1, 3)]
+        assert inbox.stats.coalesced == 3
+        assert inbox.stats.drained == 1
+        assert not inbox
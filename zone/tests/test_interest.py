@@ -0,0 +1,38 @@
+from nk_shared.models import Character
+
+from app.interest import InterestManager
+from app.models import Player
+from app.spatial import SpatialHash
+
+
+class TestInterestManager:
+    def test_enter_and_leave(self):
+        interest = InterestManager(view_radius=10)
+        index: SpatialHash[Character] = SpatialHash()
+        player = Player(user_id="1234", start_x=0, start_y=0)
+        near = Character(start_x=5, start_y=0)
+        far = Character(start_x=50, start_y=0)
+        for character in (player, near, far):
+            index.update(character, *character.body.position)
+
+        changes = interest.update([player], index)
+        assert len(changes) == 1
+        assert changes[0].entered == {near.uuid}
+        assert set(interest.observers(near.uuid)) == {player.uuid}
+        assert not interest.observers(far.uuid)
+        assert not interest.update([player], index)
+
+        index.update(near, 30, 0)
+        changes = interest.update([player], index)
+        assert changes[0].left == {near.uuid}
+        assert not interest.observers(near.uuid)
+
+    def test_departed_player_forgotten(self):
+        interest = InterestManager(view_radius=10)
+        index: SpatialHash[Character] = SpatialHash()
+        player = Player(user_id="1234", start_x=0, start_y=0)
+        near = Character(start_x=5, start_y=0)
+        index.update(near, 5, 0)
+        interest.update([player], index)
+        interest.update([], index)
+        assert not interest.observers(near.uuid)
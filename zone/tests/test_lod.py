@@ -0,0 +1,27 @@
+from nk_shared.models import Character
+from nk_shared.models.zone import AiLod
+
+from app.ai.lod import LodScheduler, LodTier
+
+
+class TestLodScheduler:
+    def test_tiers_by_distance(self):
+        lod = LodScheduler(AiLod(near_distance=10, mid_distance=20))
+        character = Character(handle=1)
+        assert lod.assign(character, 5) == LodTier.NEAR
+        assert lod.assign(character, 15) == LodTier.MID
+        assert lod.assign(character, 25) == LodTier.FAR
+        assert lod.assign(character, None) == LodTier.FAR
+
+    def test_mid_tier_runs_every_interval(self):
+        lod = LodScheduler(
+            AiLod(near_distance=10, mid_distance=20, mid_interval_ticks=4)
+        )
+        character = Character(handle=1)
+        lod.assign(character, 15)
+        due = []
+        for _ in range(8):
+            lod.begin_tick()
+            due.append(lod.due(character))
+        assert due.count(True) == 2
+        assert lod.stats.mid == 1
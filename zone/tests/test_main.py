@@ -0,0 +1,17 @@
+from nk_shared.proto import Message, TextMessage
+
+from app.main import queue_message
+from app.world import World
+
+
+def test_queue_message():
+    world = World()
+    msg = Message(text_message=TextMessage(text="test"))
+    queue_message(world, bytes(msg))
+    assert world.inbox.drain() == [msg]
+
+
+def test_queue_message_drops_undecodable():
+    world = World()
+    queue_message(world, b"\xff")
+    assert not world.inbox.drain()
@@ -1,6 +1,11 @@
+from unittest.mock import AsyncMock
+
 import pytest
+from nk_shared import builders
 from nk_shared.models.character import Character
+from nk_shared.proto import CharacterType
 
+from app.models import Enemy, Player
 from app.projectile_manager import ProjectileManager
 from app.world import World
 
@@ -21,3 +26,36 @@ class TestProjectileManager:
         character = Character()
         projectile_manager.create_projectile(character)
         await projectile_manager.update(0.016)
+
+    def test_sweep_hits_without_tunneling(
+        self, world: World, projectile_manager: ProjectileManager
+    ):
+        player = Player(user_id="1234", start_x=5, start_y=5)
+        enemy = Enemy(
+            character_type=CharacterType.CHARACTER_TYPE_DROID_ASSASSIN,
+            start_x=8,
+            start_y=5,
+        )
+        world.add_character(player)
+        world.add_character(enemy)
+        player.attack(0)
+        projectile = projectile_manager.create_projectile(player)
+        # a long tick moves the projectile well past the enemy in one step
+        hits = projectile_manager.sweep(0.2)
+        assert len(hits) == 1
+        assert hits[0].handle == projectile.handle
+        assert hits[0].character is enemy
+
+    @pytest.mark.asyncio
+    async def test_projectile_expires_after_range(
+        self, world: World, projectile_manager: ProjectileManager
+    ):
+        world.publish_nearby = AsyncMock(return_value=None)
+        character = Character(start_x=10, start_y=10)
+        character.attack(0)
+        projectile = projectile_manager.create_projectile(character)
+        lifetime = projectile_manager.pool.weapons[0].projectile_lifetime
+        await projectile_manager.update(lifetime)
+        assert projectile.handle not in projectile_manager.pool
+        msg = builders.build_projectile_destroyed(projectile.handle)
+        assert world.publish_nearby.await_args.args[0] == msg
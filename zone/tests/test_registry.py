@@ -0,0 +1,32 @@
+from nk_shared.proto import CharacterType
+
+from app.models import Enemy, Player
+from app.registry import EntityRegistry
+
+
+class TestEntityRegistry:
+    def test_add_get_remove(self):
+        registry = EntityRegistry()
+        player = Player(user_id="1234")
+        enemy = Enemy(character_type=CharacterType.CHARACTER_TYPE_DROID_ASSASSIN)
+        registry.add(player)
+        registry.add(enemy)
+        assert registry.get("1234") is player
+        assert registry.get(enemy.uuid) is enemy
+        assert list(registry.players) == [player]
+        assert list(registry.enemies) == [enemy]
+        assert registry.remove(enemy)
+        assert not registry.remove(enemy)
+        assert registry.get(enemy.uuid) is None
+        assert len(registry) == 1
+
+    def test_handles(self):
+        registry = EntityRegistry()
+        player = Player(user_id="1234")
+        enemy = Enemy(character_type=CharacterType.CHARACTER_TYPE_DROID_ASSASSIN)
+        registry.add(player)
+        registry.add(enemy)
+        assert player.handle and enemy.handle and player.handle != enemy.handle
+        assert registry.get_by_handle(enemy.handle) is enemy
+        registry.remove(enemy)
+        assert registry.get_by_handle(enemy.handle) is None
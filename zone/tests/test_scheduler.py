@@ -0,0 +1,47 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.scheduler import TickScheduler
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def callback() -> AsyncMock:
+    return AsyncMock(return_value=None)
+
+
+class TestTickScheduler:
+    @pytest.mark.asyncio
+    async def test_fixed_step(self, clock: FakeClock, callback: AsyncMock):
+        scheduler = TickScheduler(callback, tick_rate=10, max_steps=5, clock=clock)
+        delay = await scheduler.tick()
+        callback.assert_awaited_once_with(0.1)
+        assert delay == pytest.approx(0.1)
+        clock.now = 0.25
+        await scheduler.tick()
+        assert callback.await_count == 3
+        assert scheduler.stats.steps == 2
+        assert scheduler.stats.lateness == pytest.approx(0.15)
+
+    @pytest.mark.asyncio
+    async def test_max_steps_skips_backlog(self, clock: FakeClock, callback):
+        scheduler = TickScheduler(callback, tick_rate=10, max_steps=2, clock=clock)
+        await scheduler.tick()
+        clock.now = 1.0
+        await scheduler.tick()
+        assert scheduler.stats.steps == 2
+        assert scheduler.stats.skipped_steps == 8
+        assert scheduler.stats.total_skipped_steps == 8
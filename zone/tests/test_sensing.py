@@ -0,0 +1,42 @@
+from math import pi
+
+from nk_shared import direction_util
+from nk_shared.proto import CharacterType, Direction
+
+from app.ai.sensing import sense
+from app.models import Enemy, Player
+
+
+def make_enemy(x: float, y: float) -> Enemy:
+    return Enemy(
+        character_type=CharacterType.CHARACTER_TYPE_SHADOW_GUARDIAN,
+        start_x=x,
+        start_y=y,
+    )
+
+
+class TestSense:
+    def test_nearest_player_and_flags(self):
+        near = Player(user_id="near", start_x=0, start_y=0)
+        far = Player(user_id="far", start_x=100, start_y=0)
+        enemy = make_enemy(0.5, 0)
+        idle = make_enemy(60, 60)
+        sensed, sensed_idle = sense([enemy, idle], [near, far])
+        assert sensed.player is near
+        assert sensed.distance == 0.5
+        assert sensed.direction == Direction.DIRECTION_W
+        assert sensed.angle == pi
+        assert sensed.chase and sensed.attack
+        assert not sensed_idle.chase and not sensed_idle.attack
+
+    def test_directions_match_scalar(self):
+        player = Player(user_id="1234", start_x=0, start_y=0)
+        offsets = [(1, 0), (1, 1), (0, 1), (-1, 1), (0, -1), (-1, -1), (1, -1)]
+        enemies = [make_enemy(-x * 5, -y * 5) for x, y in offsets]
+        for enemy, sensed in zip(enemies, sense(enemies, [player])):
+            expected = direction_util.direction_to(enemy.position, player.position)
+            assert sensed.direction == expected
+
+    def test_no_players(self):
+        (sensed,) = sense([make_enemy(0, 0)], [])
+        assert sensed.player is None and not sensed.chase
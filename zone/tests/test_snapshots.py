@@ -0,0 +1,81 @@
+from nk_shared.models import Character, SnapshotField
+
+from app.snapshots import SnapshotManager
+
+
+class TestSnapshotManager:
+    def test_deltas_relative_to_acknowledged(self):
+        snapshots = SnapshotManager()
+        character = Character(start_x=5, start_y=5, handle=1)
+
+        first = snapshots.build("1234", [character]).world_snapshot
+        assert first.baseline == 0
+        assert first.entities[0].fields == SnapshotField.ALL
+
+        # unacknowledged, so the next snapshot still carries everything
+        second = snapshots.build("1234", [character]).world_snapshot
+        assert second.entities[0].fields == SnapshotField.ALL
+
+        snapshots.acknowledge("1234", second.sequence)
+        assert snapshots.build("1234", [character]) is None
+
+        character.position = (7, 5)
+        third = snapshots.build("1234", [character]).world_snapshot
+        assert third.baseline == second.sequence
+        assert third.entities[0].fields == SnapshotField.X
+        assert third.entities[0].x == 7
+
+    def test_lost_snapshot_heals(self):
+        snapshots = SnapshotManager()
+        character = Character(start_x=5, start_y=5, handle=1)
+        snapshots.acknowledge(
+            "1234", snapshots.build("1234", [character]).world_snapshot.sequence
+        )
+
+        character.hp = 1
+        snapshots.build("1234", [character])  # lost in transit, never acked
+        character.position = (7, 5)
+        healed = snapshots.build("1234", [character]).world_snapshot
+        assert healed.entities[0].fields == SnapshotField.X | SnapshotField.HP
+
+    def test_removed_characters(self):
+        snapshots = SnapshotManager()
+        character = Character(start_x=5, start_y=5, handle=1)
+        snapshot = snapshots.build("1234", [character]).world_snapshot
+        snapshots.acknowledge("1234", snapshot.sequence)
+        assert snapshots.build("1234", []).world_snapshot.removed == [character.handle]
+
+    def test_history_trimmed(self):
+        snapshots = SnapshotManager(history_size=2)
+        character = Character(start_x=5, start_y=5, handle=1)
+        for x in range(5):
+            character.position = (x, 0)
+            snapshots.build("1234", [character])
+        snapshots.acknowledge("1234", 1)  # trimmed, ignored
+        assert snapshots.build("1234", [character]).world_snapshot.baseline == 0
+
+    def test_due_rotates_players_evenly(self):
+        snapshots = SnapshotManager(interval=0.1)
+        players = [str(player) for player in range(12)]
+        ticks = [snapshots.due(1 / 60, players) for _ in range(6)]
+        assert all(len(due) == 2 for due in ticks)
+        assert sorted(uuid for due in ticks for uuid in due) == sorted(players)
+
+    def test_due_slice_size(self):
+        snapshots = SnapshotManager(interval=0.1, slice_size=1)
+        assert snapshots.due(0.1, ["1", "2", "3"]) == ["1"]
+        assert snapshots.due(0.0, ["1", "2", "3"]) == ["2"]
+
+    def test_periodic_full_snapshot(self):
+        snapshots = SnapshotManager(full_every=2)
+        character = Character(start_x=5, start_y=5, handle=1)
+        for _ in range(2):
+            snapshot = snapshots.build("1234", [character]).world_snapshot
+            snapshots.acknowledge("1234", snapshot.sequence)
+            character.position = (character.position.x + 1, 5)
+        full = snapshots.build("1234", [character]).world_snapshot
+        assert full.baseline == 0
+        assert full.entities[0].fields == SnapshotField.ALL
+        assert full.entities[0].uuid == character.uuid
+        after = snapshots.build("1234", [character]).world_snapshot
+        assert after.baseline == snapshot.sequence  # deltas resume from the ack
@@ -0,0 +1,30 @@
+from app.spatial import SpatialHash
+
+
+class Item:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class TestSpatialHash:
+    def test_nearest(self):
+        index: SpatialHash[Item] = SpatialHash(cell_size=4)
+        near, mid, far = Item("near"), Item("mid"), Item("far")
+        index.update(near, 1, 1)
+        index.update(mid, 10, 0)
+        index.update(far, 100, 100)
+        assert index.nearest(0, 0) == [near]
+        assert index.nearest(0, 0, k=3) == [near, mid, far]
+        assert index.nearest(0, 0, k=3, max_distance=20) == [near, mid]
+        assert index.nearest(99, 99) == [far]
+
+    def test_update_and_remove(self):
+        index: SpatialHash[Item] = SpatialHash(cell_size=4)
+        item = Item("item")
+        index.update(item, 0, 0)
+        index.update(item, 50, 50)
+        assert index.query_radius(0, 0, 5) == []
+        assert index.query_radius(50, 49, 2) == [item]
+        index.remove(item)
+        assert len(index) == 0
+        assert index.nearest(50, 50) == []
@@ -1,7 +1,12 @@
-from unittest.mock import AsyncMock
+from math import pi
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from nk_shared.models import CollisionCategory
+from nk_shared.proto import CharacterType, Message, TextMessage
 
+from app.models import Enemy, Player
+from app.pubsub import player_channel
 from app.world import World
 
 
@@ -11,3 +16,98 @@ class TestWorld:
         world = World()
         world.publish = AsyncMock(return_value=None)
         await world.update(0.016)
+
+    @pytest.mark.asyncio
+    async def test_outbox_flushed_once_per_tick(self):
+        world = World()
+        msg = Message(text_message=TextMessage(text="test"))
+        await world.publish(msg)
+        await world.publish(msg, channel="player-1234")
+        with patch("app.world.publish_batch", new=AsyncMock()) as publish_batch:
+            await world.update(0.016)
+            await world.update(0.016)
+        publish_batch.assert_awaited_once_with(
+            [("api", bytes(msg)), ("player-1234", bytes(msg))]
+        )
+        assert not world._outbox
+
+    @pytest.mark.asyncio
+    async def test_melee_attack_hits_target_category(self):
+        world = World()
+        world.publish = AsyncMock(return_value=None)
+        player = Player(user_id="1234", start_x=5, start_y=5)
+        enemy = Enemy(
+            character_type=CharacterType.CHARACTER_TYPE_SHADOW_GUARDIAN,
+            start_x=6,
+            start_y=5,
+        )
+        world.add_character(player)
+        world.add_character(enemy)
+        enemy.attack(pi)
+        await world.process_attack_damage(enemy, CollisionCategory.PLAYER)
+        assert player.hp == player.hp_max - 1
+        assert enemy.hp == enemy.hp_max
+
+    @pytest.mark.asyncio
+    async def test_snapshot_skips_character_killed_mid_tick(self):
+        world = World()
+        world._snapshots.interval = 0.016  # a snapshot every tick
+        player = Player(user_id="1234", start_x=5, start_y=5)
+        world.add_character(player)
+        enemy = Enemy(
+            character_type=CharacterType.CHARACTER_TYPE_SHADOW_GUARDIAN,
+            start_x=6,
+            start_y=5,
+        )
+        world.add_character(enemy)
+        with patch("app.world.publish_batch", new=AsyncMock()) as publish_batch:
+            await world.update(0.016)  # enemy enters the player's view
+            enemy.hp = 0  # killed, and removed, during the next tick
+            await world.update(0.016)
+        assert world.get_character_by_uuid(enemy.uuid) is None
+        snapshots = [
+            Message().parse(data).world_snapshot
+            for call in publish_batch.await_args_list
+            for channel, data in call.args[0]
+            if channel == player_channel(player.uuid)
+            and Message().parse(data).is_set("world_snapshot")
+        ]
+        assert snapshots
+        assert all(entity.handle != enemy.handle for entity in snapshots[-1].entities)
+
+    @pytest.mark.asyncio
+    async def test_inbox_drained_in_bounded_batches(self):
+        world = World()
+        world.publish = AsyncMock(return_value=None)
+        world.inbox.max_batch = 2
+        for text in "abc":
+            world.inbox.put(Message(text_message=TextMessage(text=text)))
+        with patch.object(world, "handle_message", new=AsyncMock()) as handle:
+            await world.update(0.016)
+            assert [
+                call.args[0].text_message.text for call in handle.await_args_list
+            ] == ["a", "b"]
+            assert world.inbox.stats.received == 3
+            assert world.inbox.stats.depth == 1
+            await world.update(0.016)
+        assert handle.await_args_list[-1].args[0].text_message.text == "c"
+        assert world.inbox.stats.received == 0
+        assert world.inbox.stats.drained == 1
+        assert world.inbox.stats.total_drained == 3
+
+    @pytest.mark.asyncio
+    async def test_damage_reported_once_per_target_per_tick(self):
+        world = World()
+        world.publish_to_observers = AsyncMock()
+        player = Player(user_id="1234", start_x=5, start_y=5)
+        world.add_character(player)
+        for _ in range(3):
+            world.apply_damage(player, 1)
+        assert player.hp == player.hp_max - 3
+        await world.publish_damage()
+        world.publish_to_observers.assert_awaited_once()
+        details = world.publish_to_observers.await_args.args[1].character_damaged
+        assert details.damage == 3
+        assert details.hp == player.hp
+        await world.publish_damage()
+        world.publish_to_observers.assert_awaited_once()